@@ -1,16 +1,136 @@
 # Configuration for Selenium Tests
+import os
 
 # Application URL
-BASE_URL = "http://13.51.159.98:5173"
+BASE_URL = os.getenv("BASE_URL", "http://13.51.159.98:5173")
 
 # API URL
-API_URL = "http://13.51.159.98:5000"
+API_URL = os.getenv("API_URL", "http://13.51.159.98:5000")
+API_RECORDS_PATH = "/record"
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "8"))  # Keep-alive connections
+
+# Local stand-in app (utils/stub_server.py) instead of BASE_URL/API_URL
+LOCAL_APP = os.getenv("LOCAL_APP", "0") == "1"
+LOCAL_APP_HOST = os.getenv("LOCAL_APP_HOST", "127.0.0.1")  # Must be reachable from the browser
+LOCAL_APP_LATENCY_MS = float(os.getenv("LOCAL_APP_LATENCY_MS", "0"))  # Added to every API request
+LOCAL_APP_ERROR_RATE = float(os.getenv("LOCAL_APP_ERROR_RATE", "0"))  # Share of API requests failing with 503
+
+# Navigation: "auto" changes routes in the client when the app is already
+# loaded (utils/navigation.py), "hard" always reloads with driver.get
+NAVIGATION_MODE = os.getenv("NAVIGATION_MODE", "auto")
+APP_ROOT_SELECTOR = "#root"  # Element the React app mounts into
 
 # Timeouts (in seconds)
-IMPLICIT_WAIT = 10
-EXPLICIT_WAIT = 15
-PAGE_LOAD_TIMEOUT = 30
+# With ADAPTIVE_TIMEOUTS these are starting values, recalibrated against the
+# target's latency (utils/timeouts.py); values set in the environment are kept
+IMPLICIT_WAIT = 0  # Explicit waits only (see utils/waits.py)
+EXPLICIT_WAIT = float(os.getenv("EXPLICIT_WAIT", "15"))
+PAGE_LOAD_TIMEOUT = float(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
+TIMEOUT_OVERRIDES = [name for name in ("EXPLICIT_WAIT", "PAGE_LOAD_TIMEOUT") if os.getenv(name)]
+ADAPTIVE_TIMEOUTS = os.getenv("ADAPTIVE_TIMEOUTS", "1") == "1"
+TIMEOUT_SAFETY_FACTOR = float(os.getenv("TIMEOUT_SAFETY_FACTOR", "4"))  # Times the p95 latency
+
+# Form filling: "keys" types with real keystrokes, "fast" sets all fields
+# (and submits) in one script call for bulk data creation
+FORM_FILL_MODE = os.getenv("FORM_FILL_MODE", "keys")
 
 # Chrome Options
 HEADLESS = True  # Set to False for debugging
 WINDOW_SIZE = "1920,1080"
+
+# Selenium Grid readiness (seconds to wait for the hub to report ready nodes)
+GRID_READY_TIMEOUT = int(os.getenv("GRID_READY_TIMEOUT", "120"))
+
+# Browser pool (one pool per pytest worker)
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+BROWSER_MAX_TESTS_PER_SESSION = int(os.getenv("BROWSER_MAX_TESTS_PER_SESSION", "25"))
+
+# Parallel runs (pytest -n auto sizes workers from free Grid slots)
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "0"))  # 0 = no cap
+
+# Scaling benchmark (pytest --run-benchmarks)
+BENCHMARK_SIZES = [int(n) for n in os.getenv("BENCHMARK_SIZES", "1000,10000,100000").split(",")]
+BENCHMARK_RELEASE = os.getenv("APP_RELEASE", "unversioned")  # Label for the saved curve
+BENCHMARK_RESULTS_DIR = os.getenv("BENCHMARK_RESULTS_DIR", "benchmark_results")
+BENCHMARK_THRESHOLDS_FILE = os.getenv(
+    "BENCHMARK_THRESHOLDS_FILE",
+    os.path.join(os.path.dirname(__file__), "benchmark_thresholds.json")
+)
+BENCHMARK_BASELINE_FILE = os.getenv("BENCHMARK_BASELINE_FILE")  # Curve from an earlier release
+BENCHMARK_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.2"))  # Allowed slowdown vs baseline
+BENCHMARK_RENDER_TIMEOUT = int(os.getenv("BENCHMARK_RENDER_TIMEOUT", "300"))
+
+# WebDriver command tracing and per-test time budgets
+TRACE_COMMANDS = os.getenv("TRACE_COMMANDS", "1") == "1"
+REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")  # JSON outputs (command_trace*.json, ...)
+
+# Front-end performance metrics (per page, per build)
+PERF_METRICS = os.getenv("PERF_METRICS", "1") == "1"
+BUILD_ID = os.getenv("BUILD_NUMBER", "local")  # Jenkins sets BUILD_NUMBER
+PERF_BUDGETS_FILE = os.getenv(
+    "PERF_BUDGETS_FILE",
+    os.path.join(os.path.dirname(__file__), "perf_budgets.json")
+)
+PERF_BASELINE_FILE = os.getenv("PERF_BASELINE_FILE")  # perf_<build>_*.json from an earlier build
+PERF_BASELINE_TOLERANCE = float(os.getenv("PERF_BASELINE_TOLERANCE", "0.25"))
+PERF_STRICT = os.getenv("PERF_STRICT", "0") == "1"  # Fail tests over budget (else report only; also --perf-strict)
+
+# API load mode (pytest --run-load, or python -m utils.load_generator)
+LOAD_DURATION = float(os.getenv("LOAD_DURATION", "30"))  # Seconds
+LOAD_CONCURRENCY = int(os.getenv("LOAD_CONCURRENCY", "10"))
+LOAD_RATE = float(os.getenv("LOAD_RATE")) if os.getenv("LOAD_RATE") else None  # Scenarios/s, None = closed loop
+LOAD_MIX = os.getenv("LOAD_MIX", "create=3,edit=2,delete=1")
+LOAD_P95_BUDGET_MS = float(os.getenv("LOAD_P95_BUDGET_MS", "1000"))
+
+# Soak mode (pytest --run-soak)
+SOAK_CYCLES = int(os.getenv("SOAK_CYCLES", "2000"))
+SOAK_SAMPLE_EVERY = int(os.getenv("SOAK_SAMPLE_EVERY", "50"))
+SOAK_WARMUP_CYCLES = int(os.getenv("SOAK_WARMUP_CYCLES", "100"))  # Ignored by the trend fit
+SOAK_MAX_HEAP_GROWTH = float(os.getenv("SOAK_MAX_HEAP_GROWTH", "2048"))  # Bytes per cycle
+SOAK_MAX_NODE_GROWTH = float(os.getenv("SOAK_MAX_NODE_GROWTH", "0.5"))  # DOM nodes per cycle
+SOAK_MAX_LISTENER_GROWTH = float(os.getenv("SOAK_MAX_LISTENER_GROWTH", "0.5"))  # Listeners per cycle
+
+# Multi-browser contention (pytest --run-contention); sessions are capped at the free Grid slots
+CONTENTION_SESSIONS = int(os.getenv("CONTENTION_SESSIONS", "4"))
+CONTENTION_ROUNDS = int(os.getenv("CONTENTION_ROUNDS", "10"))
+CONTENTION_RECORDS = int(os.getenv("CONTENTION_RECORDS", "3"))  # Shared records seeded before the first round
+CONTENTION_MIX = os.getenv("CONTENTION_MIX", "edit=2,create=1,delete=1")
+CONTENTION_VISIBILITY_TIMEOUT = float(os.getenv("CONTENTION_VISIBILITY_TIMEOUT", "10"))  # Seconds
+CONTENTION_P95_BUDGET_MS = float(os.getenv("CONTENTION_P95_BUDGET_MS", "3000"))  # Change visible elsewhere
+
+# Lean browser profile (LEAN_PROFILE=1)
+LEAN_PROFILE = os.getenv("LEAN_PROFILE", "0") == "1"
+LEAN_BLOCKED_URLS = [pattern for pattern in os.getenv(
+    "LEAN_BLOCKED_URLS",
+    "*.woff,*.woff2,*.ttf,*.otf,*.map,*.png,*.jpg,*.jpeg,*.gif,*.webp,*.ico,"
+    "*google-analytics.com*,*googletagmanager.com*,*doubleclick.net*,*fonts.googleapis.com*,*fonts.gstatic.com*"
+).split(",") if pattern]
+LEAN_ALLOWED_HOSTS = [host for host in os.getenv("LEAN_ALLOWED_HOSTS", "").split(",") if host]  # Empty: app and API hosts, "*": any
+LEAN_PROFILE_TEMPLATE = os.getenv("LEAN_PROFILE_TEMPLATE", ".chrome_profile_template")  # Local Chrome only
+LEAN_COMPARE_RUNS = int(os.getenv("LEAN_COMPARE_RUNS", "3"))  # Plain-vs-lean navigations for the report, 0 = skip
+
+# Test-duration history (longest-first ordering and build-time estimate)
+DURATION_HISTORY_FILE = os.getenv("DURATION_HISTORY_FILE", "history/test_durations.json")
+DURATION_HISTORY_WINDOW = int(os.getenv("DURATION_HISTORY_WINDOW", "20"))  # Runs before older ones fade out
+DURATION_ORDERING = os.getenv("DURATION_ORDERING", "1") == "1"  # 0 keeps the file order
+
+# Network/CPU throttling (utils.throttling.PROFILES)
+THROTTLE_PROFILE = os.getenv("THROTTLE_PROFILE", "fast")  # Profile for the whole run
+THROTTLE_MATRIX = os.getenv("THROTTLE_MATRIX", "")  # e.g. "fast,slow-3g,cpu-4x": run every browser test under each
+
+# Result cache for read-only tests (skip them while the app build and their source are unchanged)
+# Opt-in: the build hash covers the front end only, not the API or server behind it
+RESULT_CACHE = os.getenv("RESULT_CACHE", "0") == "1"  # --no-result-cache also forces a full run
+RESULT_CACHE_FILE = os.getenv("RESULT_CACHE_FILE", "history/result_cache.json")
+
+# Direct-to-node routing on Selenium Grid (DIRECT_NODE_ROUTING=1)
+DIRECT_NODE_ROUTING = os.getenv("DIRECT_NODE_ROUTING", "0") == "1"
+DIRECT_ROUTING_COMPARE_RUNS = int(os.getenv("DIRECT_ROUTING_COMPARE_RUNS", "20"))  # Commands per route for the report, 0 = skip
+
+# Failure artifacts (screenshot, DOM, console, HAR), written per worker under REPORTS_DIR/artifacts
+FAILURE_ARTIFACTS = os.getenv("FAILURE_ARTIFACTS", "1") == "1"
+ARTIFACTS_MAX_COUNT = int(os.getenv("ARTIFACTS_MAX_COUNT", "50"))  # Failures captured per worker
+ARTIFACTS_MAX_MB = float(os.getenv("ARTIFACTS_MAX_MB", "200"))  # Disk space per worker
+
+# One JSON line per finished test in REPORTS_DIR/results.jsonl; junit.xml and results.html are built from it
+RESULTS_STREAM = os.getenv("RESULTS_STREAM", "1") == "1"
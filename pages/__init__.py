@@ -0,0 +1,3 @@
+# Page objects for the Employee Management System
+from pages.employee_list_page import EmployeeListPage, EmployeeRow, TableSnapshot
+from pages.employee_form_page import EmployeeFormPage
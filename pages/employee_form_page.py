@@ -0,0 +1,167 @@
+"""
+Page object for the Create/Update Employee Record form (`/create`, `/edit/:id`)
+"""
+
+from urllib.parse import urlparse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import BASE_URL, FORM_FILL_MODE
+from utils.navigation import navigate
+from utils.page_snapshot import capture_page
+from utils.timeouts import TIMEOUTS
+
+
+LEVEL_RADIO_IDS = {
+    "Intern": "positionIntern",
+    "Junior": "positionJunior",
+    "Senior": "positionSenior",
+}
+
+# Sets React-controlled inputs through the native value setter (so React's
+# value tracker sees the change), fires input/change, picks the level radio
+# and optionally submits. arguments[0]: {name, position, level, submit}
+FAST_FILL_SCRIPT = """
+var data = arguments[0];
+var path = location.pathname;
+var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+function fill(id, value) {
+    if (value === null || value === undefined) { return; }
+    var input = document.getElementById(id);
+    setValue.call(input, value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+fill('name', data.name);
+fill('position', data.position);
+if (data.level) {
+    var radio = document.getElementById(data.level);
+    if (!radio.checked) { radio.click(); }
+}
+if (data.submit) {
+    document.querySelector('input[type="submit"]').click();
+}
+return path;
+"""
+
+FORM_STATE_SCRIPT = """
+var checked = document.querySelector('input[type="radio"]:checked');
+return {
+    name: document.getElementById('name').value,
+    position: document.getElementById('position').value,
+    level: checked ? checked.value : null
+};
+"""
+
+
+class EmployeeFormPage:
+    """Create/edit form with name, position and level fields"""
+
+    HEADING = (By.XPATH, "//h3[contains(text(), 'Create/Update')]")
+    NAME = (By.ID, "name")
+    POSITION = (By.ID, "position")
+    SUBMIT = (By.XPATH, "//input[@type='submit']")
+    
+    # Elements captured by capture_create() for read-only checks
+    SNAPSHOT_LOCATORS = (HEADING, NAME, POSITION, SUBMIT) + tuple(
+        (By.ID, radio_id) for radio_id in LEVEL_RADIO_IDS.values()
+    )
+
+    def __init__(self, driver, base_url=BASE_URL, timeout=None):
+        self.driver = driver
+        self.base_url = base_url
+        self.wait = WebDriverWait(driver, timeout if timeout is not None else TIMEOUTS.explicit(driver))
+        self.last_navigation = None  # `link`, `history` or `hard` (utils.navigation)
+
+    def open_create(self, hard=False):
+        """Show /create; in-app navigation when the app is loaded unless `hard`"""
+        self.last_navigation = navigate(self.driver, self.base_url, "/create", hard)
+        self.wait.until(EC.presence_of_element_located(self.NAME))
+        return self
+
+    def open_edit(self, record_id, expected_name=None, hard=False):
+        """Show /edit/<id>; optionally wait for the record to load into the form"""
+        self.last_navigation = navigate(self.driver, self.base_url, f"/edit/{record_id}", hard)
+        self.wait_until_loaded(expected_name)
+        return self
+
+    def capture_create(self):
+        """Load /create (hard) and capture the empty form as a PageSnapshot"""
+        self.open_create(hard=True)
+        return capture_page(self.driver, self.SNAPSHOT_LOCATORS)
+    
+    def wait_until_loaded(self, expected_name=None):
+        if expected_name is None:
+            self.wait.until(EC.presence_of_element_located(self.NAME))
+        else:
+            self.wait.until(EC.text_to_be_present_in_element_value(self.NAME, expected_name))
+        return self
+
+    def level_radio(self, level):
+        return self.driver.find_element(By.ID, LEVEL_RADIO_IDS[level])
+
+    def fill(self, name=None, position=None, level=None, fast=None):
+        """
+        Fill the form; None leaves a field as is
+        Uses real keystrokes unless `fast` is True (default: FORM_FILL_MODE)
+        """
+        if fast is None:
+            fast = FORM_FILL_MODE == "fast"
+        if fast:
+            return self.fast_fill(name, position, level)
+
+        if name is not None:
+            name_input = self.driver.find_element(*self.NAME)
+            name_input.clear()
+            name_input.send_keys(name)
+        if position is not None:
+            position_input = self.driver.find_element(*self.POSITION)
+            position_input.clear()
+            position_input.send_keys(position)
+        if level is not None:
+            self.level_radio(level).click()
+        return self
+
+    def fast_fill(self, name=None, position=None, level=None, submit=False):
+        """
+        Fill (and optionally submit) the form in a single WebDriver command
+        Skips keystroke simulation, so use fill() when typing is under test
+        """
+        path = self.driver.execute_script(FAST_FILL_SCRIPT, {
+            "name": name,
+            "position": position,
+            "level": LEVEL_RADIO_IDS[level] if level else None,
+            "submit": submit
+        })
+        if submit:
+            self._submitted(path)
+            self.wait.until(EC.url_to_be(f"{self.base_url}/"))
+        return self
+
+    def create(self, name, position, level, fast=None):
+        """Open /create, fill and submit; fast mode costs one script call"""
+        self.open_create()
+        if fast is None:
+            fast = FORM_FILL_MODE == "fast"
+        if fast:
+            self.fast_fill(name, position, level, submit=True)
+        else:
+            self.fill(name, position, level, fast=False)
+            self.submit()
+
+    def submit(self):
+        """Submit and wait for the redirect back to the list"""
+        self._submitted(urlparse(self.driver.current_url).path)
+        self.driver.find_element(*self.SUBMIT).click()
+        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
+
+    def _submitted(self, path):
+        """Count create submits on the session, so the clean-up looks for their records"""
+        if path.rstrip("/").endswith("/create"):
+            self.driver._ui_creates = getattr(self.driver, "_ui_creates", 0) + 1
+
+    def values(self):
+        """Current form state in one round trip: {name, position, level}"""
+        return self.driver.execute_script(FORM_STATE_SCRIPT)
@@ -0,0 +1,149 @@
+"""
+Page object for the employee list (homepage)
+Table reads come back as structured data from a single execute_script call
+instead of page_source scans or one WebDriver round trip per cell
+"""
+
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import BASE_URL
+from utils.navigation import navigate
+from utils.page_snapshot import capture_page
+from utils.timeouts import TIMEOUTS
+from utils.waits import row_xpath, row_with_name_present, row_with_name_absent
+
+
+EmployeeRow = namedtuple("EmployeeRow", ["id", "name", "position", "level"])
+
+
+class TableSnapshot(namedtuple("TableSnapshot", ["headers", "rows", "total"])):
+    """
+    Headers and (optionally filtered) rows of the employee table
+    `total` is the number of rows in the table before filtering
+    """
+
+    def names(self):
+        return [row.name for row in self.rows]
+
+    def find(self, name):
+        """Row with the exact name, or None"""
+        return next((row for row in self.rows if row.name == name), None)
+
+
+# arguments[0]: {name: exact match, contains: substring, ids: [record ids]}
+TABLE_SNAPSHOT_SCRIPT = """
+var filter = arguments[0] || {};
+var headers = Array.prototype.map.call(
+    document.querySelectorAll('thead th'),
+    function (th) { return th.textContent.trim(); }
+);
+var body = document.querySelectorAll('tbody tr');
+var rows = [];
+for (var i = 0; i < body.length; i++) {
+    var cells = body[i].cells;
+    var name = cells.length > 0 ? cells[0].textContent.trim() : '';
+    var link = body[i].querySelector('a[href*="/edit/"]');
+    var id = link ? link.getAttribute('href').split('/edit/')[1] : null;
+    if (filter.name && name !== filter.name) { continue; }
+    if (filter.contains && name.indexOf(filter.contains) === -1) { continue; }
+    if (filter.ids && filter.ids.indexOf(id) === -1) { continue; }
+    rows.push([
+        id,
+        name,
+        cells.length > 1 ? cells[1].textContent.trim() : '',
+        cells.length > 2 ? cells[2].textContent.trim() : ''
+    ]);
+}
+return {headers: headers, rows: rows, total: body.length};
+"""
+
+
+class EmployeeListPage:
+    """The `/` route: Employee Records table with Edit/Delete actions"""
+
+    HEADING = (By.XPATH, "//h3[contains(text(), 'Employee Records')]")
+    CREATE_LINK = (By.LINK_TEXT, "Create Employee")
+    TABLE = (By.CSS_SELECTOR, "table")
+    HEADER_CELLS = (By.CSS_SELECTOR, "thead th")
+    
+    # Elements captured by capture() for read-only checks
+    SNAPSHOT_LOCATORS = (HEADING, CREATE_LINK, TABLE, HEADER_CELLS)
+
+    def __init__(self, driver, base_url=BASE_URL, timeout=None):
+        self.driver = driver
+        self.base_url = base_url
+        self.wait = WebDriverWait(driver, timeout if timeout is not None else TIMEOUTS.explicit(driver))
+        self.last_navigation = None  # `link`, `history` or `hard` (utils.navigation)
+
+    def open(self, hard=False):
+        """Show the list; in-app navigation when the app is loaded unless `hard`"""
+        self.last_navigation = navigate(self.driver, self.base_url, "/", hard)
+        return self.wait_until_loaded()
+
+    def wait_until_loaded(self):
+        self.wait.until(EC.presence_of_element_located(self.HEADING))
+        return self
+
+    def capture(self):
+        """Load the list (hard) and capture its structure as a PageSnapshot"""
+        self.open(hard=True)
+        self.wait.until(EC.presence_of_element_located(self.TABLE))
+        return capture_page(self.driver, self.SNAPSHOT_LOCATORS)
+    
+    # ==================== Batched reads ====================
+    def snapshot(self, name=None, contains=None, ids=None):
+        """
+        Read headers and rows in one round trip
+        Filters run inside the page so only matching rows cross the wire
+        """
+        result = self.driver.execute_script(
+            TABLE_SNAPSHOT_SCRIPT,
+            {"name": name, "contains": contains, "ids": ids}
+        )
+        return TableSnapshot(
+            headers=result["headers"],
+            rows=[EmployeeRow(*row) for row in result["rows"]],
+            total=result["total"]
+        )
+
+    def headers(self):
+        return self.snapshot(ids=[]).headers
+
+    def row_count(self):
+        return self.snapshot(ids=[]).total
+
+    def find(self, name):
+        """The row for `name` as data, or None"""
+        return self.snapshot(name=name).find(name)
+
+    # ==================== Waits and actions ====================
+    def wait_for_row(self, name):
+        """Wait for the row with `name`; returns its element"""
+        return self.wait.until(row_with_name_present(name))
+
+    def wait_for_row_gone(self, name):
+        self.wait.until(row_with_name_absent(name))
+
+    def row_element(self, name):
+        return self.driver.find_element(By.XPATH, row_xpath(name))
+
+    def edit_button(self, name):
+        """The Edit link in the row for `name`"""
+        return self.row_element(name).find_element(By.LINK_TEXT, "Edit")
+
+    def delete_button(self, name):
+        """The Delete button in the row for `name`"""
+        return self.row_element(name).find_element(By.XPATH, ".//button[contains(text(), 'Delete')]")
+
+    def click_edit(self, name):
+        self.edit_button(name).click()
+
+    def click_delete(self, name):
+        self.delete_button(name).click()
+
+    def click_create(self):
+        self.wait.until(EC.element_to_be_clickable(self.CREATE_LINK)).click()
@@ -1,75 +1,843 @@
 """
 Pytest configuration file for Selenium tests
-Sets up Firefox driver with headless mode for CI/CD
+Sets up a pool of reusable Chrome sessions with headless mode for CI/CD
 """
 
 import pytest
-from selenium import webdriver
 import sys
 import os
+import json
+import glob
+import signal
+import threading
+import time
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from config.config import (
-    HEADLESS,
-    WINDOW_SIZE,
-    IMPLICIT_WAIT,
-    PAGE_LOAD_TIMEOUT
+    BROWSER_POOL_SIZE,
+    BROWSER_MAX_TESTS_PER_SESSION,
+    GRID_READY_TIMEOUT,
+    MAX_WORKERS,
+    TRACE_COMMANDS,
+    REPORTS_DIR,
+    BASE_URL,
+    API_URL,
+    LOCAL_APP,
+    LOCAL_APP_HOST,
+    LOCAL_APP_LATENCY_MS,
+    LOCAL_APP_ERROR_RATE,
+    PERF_METRICS,
+    BUILD_ID,
+    PERF_BUDGETS_FILE,
+    PERF_BASELINE_FILE,
+    PERF_BASELINE_TOLERANCE,
+    PERF_STRICT,
+    LEAN_PROFILE,
+    LEAN_COMPARE_RUNS,
+    DURATION_HISTORY_FILE,
+    DURATION_HISTORY_WINDOW,
+    DURATION_ORDERING,
+    THROTTLE_PROFILE,
+    THROTTLE_MATRIX,
+    RESULT_CACHE,
+    RESULT_CACHE_FILE,
+    DIRECT_NODE_ROUTING,
+    DIRECT_ROUTING_COMPARE_RUNS,
+    FAILURE_ARTIFACTS,
+    ARTIFACTS_MAX_COUNT,
+    ARTIFACTS_MAX_MB,
+    RESULTS_STREAM,
+    ADAPTIVE_TIMEOUTS
 )
+from utils.browser_pool import BrowserPool
+from utils.driver_factory import create_driver, prepare_profile_template
+from utils.lean_profile import compare_navigation, format_savings, write_savings
+from utils.node_routing import NodeRoutedConnection, compare_routes, format_routing, write_routing
+from utils.api_client import EmployeeApiClient
+from utils.grid import fetch_grid_status, free_slots, wait_for_grid
+from utils.test_data import EmployeeFactory, NameFactory, new_run_id, current_worker_id
+from utils.tracing import CommandTracer, TraceCollector, install_wait_tracing, breakdown_html
+from utils.perf_metrics import PerfRecorder, PerfCollector, check_sample
+from utils.benchmark import load_json
+from utils.durations import DurationHistory, assign_workers, estimate_build, format_estimate, longest_first
+from utils.stub_server import StubServer
+from utils.cleanup import ResourceRegistry
+from utils.page_snapshot import PageSnapshots
+from utils.artifacts import ArtifactWriter
+from utils.results_stream import ResultStream, build_reports
+from utils.timeouts import TIMEOUTS, format_timeouts, load_timeouts, write_timeouts
+from utils.result_cache import ResultCache, build_hash, source_hash, format_age
+from utils.throttling import DEFAULT_PROFILE, apply_profile, parse_profiles, summarize_matrix, format_matrix
 
+try:
+    import pytest_html
+except ImportError:  # Report extras are optional
+    pytest_html = None
 
-@pytest.fixture(scope="function")
-def driver():
+run_id_key = pytest.StashKey[str]()
+grid_wait_key = pytest.StashKey[float]()
+tracer_key = pytest.StashKey[CommandTracer]()
+trace_collector_key = pytest.StashKey[TraceCollector]()
+perf_recorder_key = pytest.StashKey[PerfRecorder]()
+perf_collector_key = pytest.StashKey[PerfCollector]()
+duration_history_key = pytest.StashKey[DurationHistory]()
+estimate_key = pytest.StashKey[dict]()
+session_start_key = pytest.StashKey[float]()
+throttle_profiles_key = pytest.StashKey[list]()
+throttle_key = pytest.StashKey[str]()
+result_cache_key = pytest.StashKey[ResultCache]()
+cache_entry_key = pytest.StashKey[str]()
+artifact_writer_key = pytest.StashKey[ArtifactWriter]()
+result_stream_key = pytest.StashKey[ResultStream]()
+
+# Long-running suites that only run when their option is given
+OPT_IN_MARKERS = {
+    "benchmark": ("--run-benchmarks", "large-dataset scaling benchmarks"),
+    "load": ("--run-load", "API load scenarios"),
+    "soak": ("--run-soak", "browser memory soak runs"),
+    "contention": ("--run-contention", "multi-browser contention scenarios"),
+}
+
+# Code read-only tests run besides their own body; a change re-runs them
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CACHE_SOURCES = sorted(glob.glob(os.path.join(ROOT_DIR, "pages", "*.py"))) + [
+    os.path.join(ROOT_DIR, "utils", "navigation.py"),
+    os.path.join(ROOT_DIR, "utils", "page_snapshot.py"),
+    os.path.join(ROOT_DIR, "utils", "waits.py"),
+]
+
+
+def pytest_addoption(parser):
+    for marker, (option, description) in OPT_IN_MARKERS.items():
+        parser.addoption(option, action="store_true", default=False, help=f"run {description}")
+    parser.addoption(
+        "--no-result-cache", action="store_true", default=False,
+        help="run read-only tests even when a cached pass matches the app build"
+    )
+    parser.addoption(
+        "--perf-strict", action="store_true", default=PERF_STRICT,
+        help="fail tests whose pages exceed the performance budget or baseline (default: report only)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)  # xdist reads the xdist_group marks added here
+def pytest_collection_modifyitems(config, items):
     """
-    Pytest fixture to set up and tear down Chrome WebDriver
-    Uses Selenium Grid for reliable headless execution
+    Skip opt-in suites unless their option was given, then run the other
+    tests longest-first according to the duration history
     """
-    import os
-    from selenium.webdriver.chrome.options import Options
+    for marker, (option, description) in OPT_IN_MARKERS.items():
+        if config.getoption(option):
+            continue
+        skip = pytest.mark.skip(reason=f"{description} need {option}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
     
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument(f'--window-size={WINDOW_SIZE}')
+    if DURATION_ORDERING:
+        schedule_longest_first(config, items)
     
-    # Check if we should use Selenium Grid (remote)
-    selenium_remote_url = os.getenv('SELENIUM_REMOTE_URL')
+    if not hasattr(config, "workerinput") and not config.option.collectonly:
+        # Serial run: estimate here (xdist runs estimate in the controller)
+        scheduled = [item.nodeid for item in items if not item.get_closest_marker("skip")]
+        report_estimate(config, scheduled, workers=1)
+
+
+def opt_in_marker(keywords):
+    return next((marker for marker in OPT_IN_MARKERS if marker in keywords), None)
+
+
+def schedule_longest_first(config, items):
+    """
+    Order tests longest-first (LPT). Opt-in suites keep their order at the end,
+    since their parametrized cases build on each other.
+    With `--dist loadgroup`, each test is also pinned to an LPT worker group.
+    Every xdist worker computes the same order from the same history file.
+    """
+    history = config.stash[duration_history_key]
+    regular = [item for item in items if opt_in_marker(item.keywords) is None]
+    opt_in = [item for item in items if opt_in_marker(item.keywords) is not None]
+    by_id = {item.nodeid: item for item in regular}
+    items[:] = [by_id[test_id] for test_id in longest_first(list(by_id), history)] + opt_in
     
-    if selenium_remote_url:
-        # Use Selenium Grid with retry logic
-        import time
-        max_retries = 30
-        retry_delay = 2
-        
-        for attempt in range(max_retries):
-            try:
-                driver = webdriver.Remote(
-                    command_executor=selenium_remote_url,
-                    options=chrome_options
-                )
-                break  # Success!
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"Waiting for Selenium Grid... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(retry_delay)
-                else:
-                    raise  # Re-raise on final attempt
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if uses_loadgroup(config) and workers > 1:
+        assignment, _ = assign_workers(list(by_id), history, workers)
+        for test_id, index in assignment.items():
+            if not by_id[test_id].get_closest_marker("xdist_group"):
+                by_id[test_id].add_marker(pytest.mark.xdist_group(f"lpt{index}"))
+
+
+def uses_loadgroup(config):
+    """
+    True for `--dist loadgroup`; xdist workers see `dist` as "no" and keep
+    the mode only as the `loadgroup` option
+    """
+    return config.getoption("dist", "no") == "loadgroup" or config.getoption("loadgroup", False)
+
+
+def report_estimate(config, test_ids, workers):
+    """Print the expected build time before the first test starts"""
+    if estimate_key in config.stash:
+        return
+    estimate = estimate_build(test_ids, config.stash[duration_history_key], workers)
+    config.stash[estimate_key] = estimate
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_line(format_estimate(estimate))
+
+
+def history_id(nodeid):
+    """Node id without the `@group` suffix xdist adds for --dist loadgroup"""
+    return nodeid.split("@", 1)[0]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_node_collection_finished(node, ids):
+    """Estimate the build time once the first worker has collected"""
+    config = node.config
+    history = config.stash[duration_history_key]
+    enabled = {marker for marker, (option, _) in OPT_IN_MARKERS.items() if config.getoption(option)}
+    scheduled = [
+        history_id(test_id) for test_id in ids
+        if history.marker(history_id(test_id)) in enabled | {None}
+    ]
+    report_estimate(config, scheduled, workers=len(config.getoption("tx")))
+
+
+def pytest_configure(config):
+    """
+    Register the opt-in markers and pick one run id per test run
+    xdist workers inherit the controller's run id
+    """
+    for marker, (option, description) in OPT_IN_MARKERS.items():
+        config.addinivalue_line("markers", f"{marker}: {description} (enable with {option})")
+    config.addinivalue_line("markers", "read_only: changes no data; a pass is cached per app build")
+    
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        config.stash[run_id_key] = workerinput["run_id"]
     else:
-        # Fallback to local Chrome (for local testing)
-        driver = webdriver.Chrome(options=chrome_options)
+        config.stash[run_id_key] = os.getenv("TEST_RUN_ID") or new_run_id()
+    
+    if TRACE_COMMANDS:
+        install_wait_tracing()
+        config.stash[trace_collector_key] = TraceCollector()
+    if PERF_METRICS:
+        config.stash[perf_collector_key] = PerfCollector(BUILD_ID)
+    config.stash[duration_history_key] = DurationHistory(DURATION_HISTORY_FILE, DURATION_HISTORY_WINDOW)
+    config.stash[session_start_key] = time.perf_counter()
+    config.stash[result_cache_key] = ResultCache(RESULT_CACHE_FILE)
+    if FAILURE_ARTIFACTS:
+        config.stash[artifact_writer_key] = ArtifactWriter(
+            os.path.join(REPORTS_DIR, "artifacts", current_worker_id()),
+            max_count=ARTIFACTS_MAX_COUNT,
+            max_bytes=int(ARTIFACTS_MAX_MB * 1024 * 1024)
+        )
+    if RESULTS_STREAM and workerinput is None and not config.option.collectonly:
+        # The controller sees every worker's reports, so it alone writes the stream
+        stream = ResultStream(os.path.join(REPORTS_DIR, "results.jsonl"), config.stash[run_id_key])
+        config.stash[result_stream_key] = stream
+        config.pluginmanager.register(stream, "result_stream")
+    try:
+        config.stash[throttle_profiles_key] = parse_profiles(THROTTLE_MATRIX or THROTTLE_PROFILE)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    
+    # A CI abort sends SIGTERM; turn it into an interrupt so fixture
+    # teardown (browser sessions, test data clean-up) still runs
+    if threading.current_thread() is threading.main_thread() and signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _interrupt)
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt(f"Received signal {signum}")
+
+
+def pytest_generate_tests(metafunc):
+    """With THROTTLE_MATRIX, run every browser test once per throttling profile"""
+    if THROTTLE_MATRIX and "driver" in metafunc.fixturenames:
+        metafunc.parametrize("throttle_profile", metafunc.config.stash[throttle_profiles_key], indirect=True)
+
+
+def throttling_enabled(config):
+    return config.stash[throttle_profiles_key] != [DEFAULT_PROFILE]
+
+
+def pytest_sessionfinish(session):
+    """
+    Write this worker's command trace, performance samples and timeouts to REPORTS_DIR,
+    finish writing failure artifacts and (outside xdist workers) add the run's
+    test durations to the history and build JUnit XML and HTML from the
+    results stream
+    """
+    writer = session.config.stash.get(artifact_writer_key, None)
+    if writer is not None:
+        captured, skipped, size = writer.close()
+        if captured:
+            print(f"\nFailure artifacts: {captured} captured ({size / 1024 / 1024:.1f} MB) in {writer.directory}"
+                  + (f", {skipped} over ARTIFACTS_MAX_COUNT not captured" if skipped else ""))
+    if not hasattr(session.config, "workerinput"):
+        update_duration_history(session.config)
+        update_result_cache(session.config)
+        finish_result_stream(session.config)
+    
+    worker = current_worker_id()
+    collector = session.config.stash.get(trace_collector_key, None)
+    if collector is not None and collector.tests:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        collector.write(os.path.join(REPORTS_DIR, f"command_trace_{worker}.json"))
+    
+    perf = session.config.stash.get(perf_collector_key, None)
+    if perf is not None and perf.samples:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        perf.write(os.path.join(REPORTS_DIR, f"perf_{BUILD_ID}_{worker}.json"))
+    
+    if ADAPTIVE_TIMEOUTS and TIMEOUTS.latencies():
+        report = TIMEOUTS.report()
+        report["run_id"] = session.config.stash[run_id_key]
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        write_timeouts(os.path.join(REPORTS_DIR, f"timeouts_{worker}.json"), report)
+
+
+def finish_result_stream(config):
+    """Close the stream and build the CI reports from it (rebuild with python -m utils.results_stream)"""
+    stream = config.stash.get(result_stream_key, None)
+    if stream is None:
+        return
+    stream.close()
+    junit_path = os.path.join(REPORTS_DIR, "junit.xml")
+    html_path = os.path.join(REPORTS_DIR, "results.html")
+    count = build_reports(stream.path, junit_path, html_path)
+    print(f"\nResults stream: {count} tests in {stream.path}, built {junit_path} and {html_path}")
+
+
+def update_duration_history(config):
+    """
+    Record setup + call + teardown time of every test that ran
+    The terminal reporter holds all reports, including those of xdist workers
+    """
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is None:
+        return
+    history = config.stash[duration_history_key]
+    totals = {}
+    skipped = set()
+    for reports in reporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) is None:
+                continue
+            test_id = history_id(report.nodeid)
+            totals[test_id] = totals.get(test_id, 0.0) + report.duration
+            if report.skipped:
+                skipped.add(test_id)
+            marker = opt_in_marker(report.keywords)
+            if marker:
+                history.label(test_id, marker)
+    for test_id, seconds in totals.items():
+        if test_id not in skipped:
+            history.record(test_id, seconds)
+    if totals:
+        history.save()
+
+
+def update_result_cache(config):
+    """Cache read-only tests that passed every phase; forget those that failed"""
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is None:
+        return
+    cache = config.stash[result_cache_key]
+    entries = {}
+    failed = set()
+    for reports in reporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) is None:
+                continue
+            test_id = history_id(report.nodeid)
+            entry = dict(report.user_properties).get("result_cache_entry")
+            if entry:
+                entries[test_id] = entry
+            if report.failed:
+                failed.add(test_id)
+    for test_id in failed:
+        cache.invalidate(test_id)
+    for test_id, (key, build) in entries.items():
+        if test_id not in failed:
+            cache.store(test_id, key, build)
+    if entries or failed:
+        cache.save()
+
+
+def pytest_report_teststatus(report, config):
+    """Show read-only tests skipped for a cached pass as `cached`"""
+    if report.when == "setup" and report.skipped and dict(report.user_properties).get("result_cache") == "hit":
+        return "cached", "c", "CACHED"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Attach the test's time-budget breakdown to its report, report pages that
+    exceeded their performance budget or the baseline (failing the test with
+    --perf-strict), and capture failure artifacts (also for failed setups and
+    reruns)
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call":
+        if report.when == "setup" and report.failed:
+            capture_failure(item, report)
+        return
+    
+    if cache_entry_key in item.stash and report.passed:
+        report.user_properties.append(("result_cache_entry", item.stash[cache_entry_key]))
+    
+    tracer = item.stash.get(tracer_key, None)
+    if tracer is not None:
+        breakdown = tracer.breakdown(report.duration)
+        report.user_properties.append(("time_budget", breakdown))
+        item.config.stash[trace_collector_key].add(item.nodeid, report.outcome, report.duration, breakdown, tracer)
+        if pytest_html is not None:
+            report.extras = getattr(report, "extras", []) + [pytest_html.extras.html(breakdown_html(breakdown, tracer))]
+    
+    profile = item.stash.get(throttle_key, None)
+    if profile is not None:
+        report.user_properties.append(("throttle_profile", profile))
+        if tracer is not None:
+            report.user_properties.append(("waits", tracer.waits))
+    
+    if ADAPTIVE_TIMEOUTS and tracer is not None:
+        # Completed waits refine the timeouts of later tests
+        for wait in tracer.waits:
+            if not wait["timed_out"]:
+                TIMEOUTS.observe("wait", wait["seconds"], profile or THROTTLE_PROFILE)
+    
+    recorder = item.stash.get(perf_recorder_key, None)
+    if recorder is not None:
+        recorder.collect()  # The page the test ended on
+        item.config.stash[perf_collector_key].add(item.nodeid, recorder.samples)
+        report.user_properties.append(("perf_samples", recorder.samples))
+        budgets = load_json(PERF_BUDGETS_FILE, {})
+        baseline = load_json(PERF_BASELINE_FILE)
+        violations = [
+            violation
+            for sample in recorder.samples
+            for violation in check_sample(sample, budgets, baseline, PERF_BASELINE_TOLERANCE)
+        ]
+        if violations:
+            report.user_properties.append(("perf_violations", violations))
+            if report.passed and item.config.getoption("--perf-strict"):
+                report.outcome = "failed"
+                report.longrepr = "Performance budget exceeded:\n  " + "\n  ".join(violations)
+    
+    if report.failed:
+        capture_failure(item, report)
+
+
+def capture_failure(item, report):
+    """Grab artifacts from the test's browser; they are written in the background and linked"""
+    writer = item.config.stash.get(artifact_writer_key, None)
+    driver = item.funcargs.get("driver")
+    if writer is None or driver is None:
+        return
+    files = writer.capture(driver, item.nodeid, report.when)
+    if not files:
+        return
+    report.user_properties.append(("artifacts", {name: path for name, path in files}))
+    if pytest_html is not None:
+        # Links are relative to the HTML report
+        html_path = item.config.getoption("htmlpath", None)
+        report_dir = os.path.dirname(os.path.abspath(html_path)) if html_path else os.getcwd()
+        report.extras = getattr(report, "extras", []) + [
+            pytest_html.extras.url(os.path.relpath(path, report_dir).replace(os.sep, "/"), name=name)
+            for name, path in files
+        ]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the run id to each xdist worker"""
+    node.workerinput["run_id"] = node.config.stash[run_id_key]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """
+    Size `-n auto` to the free browser slots on the Selenium Grid
+    Without a Grid, xdist falls back to the CPU count
+    """
+    selenium_remote_url = os.getenv('SELENIUM_REMOTE_URL')
+    if not selenium_remote_url:
+        return None
+
+    # Nodes register after the hub starts, so wait before counting slots
+    ensure_grid_ready(config)
+    try:
+        workers = free_slots(fetch_grid_status(selenium_remote_url))
+    except Exception as e:
+        print(f"Could not read Grid capacity, running with one worker: {e}")
+        return 1
+
+    if MAX_WORKERS:
+        workers = min(workers, MAX_WORKERS)
+    print(f"Selenium Grid has {workers} free slot(s); starting {max(1, workers)} worker(s)")
+    return max(1, workers)
+
+
+def ensure_grid_ready(config):
+    """
+    Wait (once per process) for the Selenium Grid to report ready nodes
+    The time spent waiting is kept for the terminal summary
+    """
+    selenium_remote_url = os.getenv('SELENIUM_REMOTE_URL')
+    if not selenium_remote_url or grid_wait_key in config.stash:
+        return
+    waited = wait_for_grid(selenium_remote_url, timeout=GRID_READY_TIMEOUT)
+    config.stash[grid_wait_key] = waited
+    print(f"Selenium Grid ready after {waited:.1f}s")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Report the Grid wait, what the lean profile and direct node routing saved,
+    the estimated vs actual test time, the adapted timeouts, pages over their
+    performance budget and, when throttling, page timings and tight waits per
+    profile
+    """
+    if grid_wait_key in config.stash:
+        terminalreporter.write_line(f"Selenium Grid readiness wait: {config.stash[grid_wait_key]:.1f}s")
+    savings = lean_savings(config)
+    if savings:
+        terminalreporter.write_line(format_savings(savings))
+    routing = routing_savings(config)
+    if routing:
+        terminalreporter.write_line(format_routing(routing))
+    if estimate_key in config.stash and not config.option.collectonly:
+        actual = time.perf_counter() - config.stash[session_start_key]
+        terminalreporter.write_line(
+            f"Test time: {actual:.0f}s (estimated {config.stash[estimate_key]['estimate_s']:.0f}s)"
+        )
+    if ADAPTIVE_TIMEOUTS and not hasattr(config, "workerinput"):
+        for worker, report in load_timeouts(REPORTS_DIR, config.stash[run_id_key]).items():
+            for line in format_timeouts(report, worker):
+                terminalreporter.write_line(line)
+    if not hasattr(config, "workerinput") and not config.getoption("--perf-strict"):
+        for test, violations in perf_violations(terminalreporter):
+            terminalreporter.write_line(f"Performance budget exceeded (report only) in {test}:")
+            for violation in violations:
+                terminalreporter.write_line(f"  {violation}")
+    if throttling_enabled(config) and not hasattr(config, "workerinput"):
+        summary = summarize_matrix(throttle_results(terminalreporter))
+        if summary:
+            os.makedirs(REPORTS_DIR, exist_ok=True)
+            with open(os.path.join(REPORTS_DIR, "throttle_matrix.json"), "w") as f:
+                json.dump(summary, f, indent=2)
+            for line in format_matrix(summary):
+                terminalreporter.write_line(line)
+
+
+def perf_violations(reporter):
+    """(test, violations) of every test call whose pages exceeded a budget or the baseline"""
+    results = []
+    for reports in reporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            violations = dict(report.user_properties).get("perf_violations")
+            if violations:
+                results.append((report.nodeid, violations))
+    return results
+
+
+def throttle_results(reporter):
+    """Profile, perf samples and waits of every test call (including xdist workers')"""
+    results = []
+    for reports in reporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            properties = dict(report.user_properties)
+            if "throttle_profile" in properties:
+                results.append({
+                    "profile": properties["throttle_profile"],
+                    "perf_samples": properties.get("perf_samples", []),
+                    "waits": properties.get("waits", []),
+                })
+    return results
+
+
+def lean_savings(config):
+    """This run's plain-vs-lean comparison (written by one worker), or None"""
+    if not LEAN_PROFILE:
+        return None
+    return run_report(config, "lean_profile.json")
+
+
+def routing_savings(config):
+    """This run's hub-vs-node command latency (written by one worker), or None"""
+    if not DIRECT_NODE_ROUTING:
+        return None
+    return run_report(config, "direct_routing.json")
+
+
+def run_report(config, name):
+    """A report file in REPORTS_DIR if it was written by this run"""
+    report = load_json(os.path.join(REPORTS_DIR, name))
+    if report and report.get("run_id") == config.stash[run_id_key]:
+        return report
+    return None
+
+
+def measure_lean_savings(config, app_url):
+    """Compare plain and lean navigation once per run (on the first worker)"""
+    if not LEAN_COMPARE_RUNS or current_worker_id() not in ("main", "gw0"):
+        return
+    try:
+        savings = compare_navigation(create_driver, app_url, LEAN_COMPARE_RUNS)
+    except Exception as e:
+        print(f"Could not compare plain and lean navigation: {e}")
+        return
+    savings["run_id"] = config.stash[run_id_key]
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    write_savings(os.path.join(REPORTS_DIR, "lean_profile.json"), savings)
+
+
+def measure_routing_savings(config, pool):
+    """Compare hub and direct command latency once per run (on the first worker)"""
+    if not DIRECT_ROUTING_COMPARE_RUNS or current_worker_id() not in ("main", "gw0"):
+        return
+    session = pool.acquire()
+    try:
+        if not isinstance(session.driver.command_executor, NodeRoutedConnection):
+            print("Direct node routing is off for this session; commands go through the hub")
+            return
+        result = compare_routes(session.driver, DIRECT_ROUTING_COMPARE_RUNS)
+    except Exception as e:
+        print(f"Could not compare hub and direct command latency: {e}")
+        return
+    finally:
+        pool.release(session)
+    result["run_id"] = config.stash[run_id_key]
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    write_routing(os.path.join(REPORTS_DIR, "direct_routing.json"), result)
+
+
+@pytest.fixture(scope="session")
+def local_app():
+    """
+    In-process stand-in for the app when LOCAL_APP=1 (one per worker, so each
+    worker starts from an empty store); None against the real deployment
+    """
+    if not LOCAL_APP:
+        yield None
+        return
+    with StubServer(LOCAL_APP_HOST, latency=LOCAL_APP_LATENCY_MS / 1000, error_rate=LOCAL_APP_ERROR_RATE) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def app_url(local_app):
+    """URL of the app under test"""
+    return local_app.url if local_app else BASE_URL
+
+
+@pytest.fixture(scope="session")
+def api_url(local_app):
+    """URL of the REST API (the stand-in serves both)"""
+    return local_app.url if local_app else API_URL
+
+
+@pytest.fixture(scope="session")
+def app_build_hash(app_url):
+    """Hash of the served front end, or None when it cannot be fetched (no caching)"""
+    try:
+        return build_hash(app_url)
+    except Exception as e:
+        print(f"Could not hash the app build, running read-only tests: {e}")
+        return None
+
+
+@pytest.fixture(autouse=True)
+def result_cache(request):
+    """
+    Skip a `read_only` test that already passed against this app build with
+    the same test and page-object source (`--no-result-cache` runs it anyway)
+    """
+    if not RESULT_CACHE or request.node.get_closest_marker("read_only") is None:
+        return
+    build = request.getfixturevalue("app_build_hash")
+    if build is None:
+        return
+    cache = request.config.stash[result_cache_key]
+    key = cache.key(build, source_hash(request.function, CACHE_SOURCES), request.getfixturevalue("throttle_profile"))
+    request.node.stash[cache_entry_key] = (key, build)
+    entry = cache.hit(history_id(request.node.nodeid), key)
+    if entry and not request.config.getoption("--no-result-cache"):
+        request.node.user_properties.append(("result_cache", "hit"))
+        pytest.skip(f"cached: passed {format_age(time.time() - entry['passed_at'])} ago against build {build[:12]}")
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, app_url):
+    """
+    Pool of warm Chrome sessions, one pool per worker process
+    Uses Selenium Grid when SELENIUM_REMOTE_URL is set, local Chrome otherwise
+    With LEAN_PROFILE, builds the profile template and measures the savings first
+    With DIRECT_NODE_ROUTING on a Grid, compares hub and direct command latency
+    """
+    ensure_grid_ready(request.config)
+    if LEAN_PROFILE:
+        prepare_profile_template(app_url)
+        measure_lean_savings(request.config, app_url)
+    pool = BrowserPool(
+        size=BROWSER_POOL_SIZE,
+        max_uses=BROWSER_MAX_TESTS_PER_SESSION
+    )
+    if DIRECT_NODE_ROUTING and os.getenv('SELENIUM_REMOTE_URL'):
+        measure_routing_savings(request.config, pool)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def adaptive_timeouts(browser_pool, app_url, api):
+    """
+    Probe one page load and one API round trip per worker, before its first
+    browser test, and derive the starting timeouts from them
+    """
+    if not ADAPTIVE_TIMEOUTS:
+        return TIMEOUTS
+    session = browser_pool.acquire()
+    try:
+        calibrated = TIMEOUTS.calibrate(session.driver, app_url, api)
+    finally:
+        browser_pool.release(session)
+    if calibrated:
+        timeouts = TIMEOUTS.current()
+        print(f"\nTimeouts calibrated: explicit {timeouts['explicit']:.1f}s, page load {timeouts['page_load']:.1f}s")
+    return TIMEOUTS
+
+
+@pytest.fixture(scope="session")
+def grid_ready(request):
+    """Selenium Grid URL once its nodes are ready (None for local Chrome), for tests that open their own sessions"""
+    ensure_grid_ready(request.config)
+    return os.getenv('SELENIUM_REMOTE_URL')
+
+
+@pytest.fixture(scope="function")
+def throttle_profile(request):
+    """Network/CPU profile for the test: its THROTTLE_MATRIX entry or THROTTLE_PROFILE"""
+    return getattr(request, "param", THROTTLE_PROFILE)
+
+
+@pytest.fixture(scope="function")
+def driver(request, browser_pool, adaptive_timeouts, app_url, throttle_profile, registry, monkeypatch):
+    """
+    Pytest fixture that lends a Chrome session from the pool to a test
+    Cookies, storage and the current URL are reset when the test finishes
+    With TRACE_COMMANDS, every command the test sends is traced
+    The session is throttled to the test's profile (pooled sessions keep
+    their profile until the next test sets its own)
+    """
+    start = time.perf_counter()
+    session = browser_pool.acquire()
+    if not apply_profile(session.driver, throttle_profile):
+        browser_pool.release(session)
+        pytest.skip(f"Throttling profile {throttle_profile} needs the DevTools Protocol")
+    request.node.stash[throttle_key] = throttle_profile
+    if ADAPTIVE_TIMEOUTS and throttling_enabled(request.config):
+        # The pool set the previous test's profile's page-load timeout
+        session.driver.set_page_load_timeout(TIMEOUTS.page_load(session.driver))
     
-    # Set timeouts
-    driver.implicitly_wait(IMPLICIT_WAIT)
-    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    tracer = None
+    if TRACE_COMMANDS:
+        tracer = CommandTracer()
+        tracer.add("startup", time.perf_counter() - start)
+        tracer.attach(session.driver)
+        monkeypatch.setattr(time, "sleep", tracer.sleep_hook(time.sleep, str(request.path)))
+        request.node.stash[tracer_key] = tracer
     
-    yield driver
+    recorder = None
+    if PERF_METRICS:
+        recorder = PerfRecorder(app_url, tracer, throttle_profile)
+        recorder.attach(session.driver)
+        request.node.stash[perf_recorder_key] = recorder
     
-    # Teardown: quit driver after test
-    driver.quit()
+    yield session.driver
+    
+    # Teardown: reset the session and return it to the pool
+    if getattr(session.driver, "_ui_creates", 0):
+        registry.expect_untracked()  # Records the test may not have tracked
+        session.driver._ui_creates = 0
+    if recorder is not None:
+        recorder.detach()
+    if tracer is not None:
+        CommandTracer.detach(session.driver)
+    browser_pool.release(session)
+
+
+@pytest.fixture(scope="class")
+def page_snapshots():
+    """
+    Page snapshots shared by the tests of a class: the first test that needs
+    a page under a throttling profile loads and captures it, later read-only
+    checks under that profile reuse the capture
+    """
+    return PageSnapshots()
+
+
+@pytest.fixture(scope="session")
+def api(api_url):
+    """REST client for the Employee Management API (pooled keep-alive connections)"""
+    client = EmployeeApiClient(api_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def names(request):
+    """Collision-free employee names for this worker (`<prefix> <run>-<worker>-<n>`)"""
+    return NameFactory(request.config.stash[run_id_key])
+
+
+@pytest.fixture(scope="session")
+def registry(api, names):
+    """
+    Every employee this worker creates, deleted in one bulk pass when the
+    session ends (also after failures and interrupts)
+    Used by the browser tests and the data factory only; nothing is listed
+    or deleted when they created nothing
+    """
+    registry = ResourceRegistry(api, names.namespace)
+    yield registry
+    try:
+        deleted = registry.purge()
+        if deleted:
+            print(f"\nCleaned up {deleted} test employee(s)")
+    except Exception as e:
+        print(f"\nCould not clean up test employees (run `python -m utils.cleanup`): {e}")
+
+
+@pytest.fixture(scope="function")
+def employee_factory(api, names, registry):
+    """Factory for seeding employee records through the API"""
+    return EmployeeFactory(api, names, registry)
 
 
 def pytest_html_report_title(report):
     """Customize HTML report title"""
     report.title = "Employee Management System - Selenium Test Report"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Show the lean profile's and direct routing's savings above the results"""
+    savings = lean_savings(session.config)
+    if savings:
+        prefix.append(f"<p>{format_savings(savings)}</p>")
+    routing = routing_savings(session.config)
+    if routing:
+        prefix.append(f"<p>{format_routing(routing)}</p>")
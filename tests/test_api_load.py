@@ -0,0 +1,51 @@
+"""
+Employee Management System - API Load Scenarios
+Replays the create/edit/delete flows as concurrent HTTP traffic against the API
+Run with: pytest --run-load tests/test_api_load.py
+"""
+
+import pytest
+import asyncio
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config.config import (
+    LOAD_DURATION,
+    LOAD_CONCURRENCY,
+    LOAD_RATE,
+    LOAD_MIX,
+    LOAD_P95_BUDGET_MS
+)
+from utils.load_generator import run_load, parse_mix, format_summary
+
+pytestmark = pytest.mark.load
+
+
+def test_crud_load(api_url, names, record_property):
+    """
+    Load: mixed create/edit/delete traffic
+    Steps:
+    1. Run the scenario mix for LOAD_DURATION seconds at the configured concurrency/rate
+    2. Verify no request failed
+    3. Verify every endpoint's p95 latency is within LOAD_P95_BUDGET_MS
+    """
+    print(f"\n[LOAD] {LOAD_CONCURRENCY} concurrent scenarios for {LOAD_DURATION}s against {api_url}...")
+    summary = asyncio.run(run_load(
+        api_url,
+        duration=LOAD_DURATION,
+        concurrency=LOAD_CONCURRENCY,
+        rate=LOAD_RATE,
+        mix=parse_mix(LOAD_MIX),
+        name_prefix=f"Load {names.namespace}"
+    ))
+    print(format_summary(summary))
+    record_property("load_summary", summary)
+    
+    failed = {endpoint: s["errors"] for endpoint, s in summary["endpoints"].items() if s["errors"]}
+    assert not failed, f"Requests failed: {failed}"
+    
+    slow = {endpoint: s["p95_ms"] for endpoint, s in summary["endpoints"].items() if s["p95_ms"] > LOAD_P95_BUDGET_MS}
+    assert not slow, f"p95 above {LOAD_P95_BUDGET_MS}ms: {slow}"
@@ -0,0 +1,84 @@
+"""
+Janitor name matching and registry purges (utils/cleanup.py)
+No browser or API needed
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.cleanup import ResourceRegistry, is_test_record
+from utils.test_data import NameFactory
+
+
+def test_contention_records_are_reclaimed():
+    """
+    Records of a crashed contention run are found by the janitor
+    Steps:
+    1. Name a record the way the contention scenarios do
+    2. Verify it matches, also when filtering by its run id
+    """
+    name = NameFactory("ab12cd", "gw0").unique("Contention")
+    assert is_test_record({"name": name})
+    assert is_test_record({"name": name}, run_id="ab12cd")
+    assert not is_test_record({"name": name}, run_id="ffffff")
+
+
+def test_real_employees_are_kept():
+    """
+    Names outside the suite's exact formats are never matched
+    Steps:
+    1. Check real names, including hyphenated ones ending in a number
+       that start with one of the suite's prefixes
+    2. Verify none of them is taken for a test record
+    """
+    for name in ("Contention Smith", "Jane Doe", "Mary-Jane Smith-2", "Alice Smith-Jones-2",
+                 "Load Smith-Jones 3", "Bob O-Neil-7 edited"):
+        assert not is_test_record({"name": name}), name
+
+
+class FakeApi:
+    """Records the calls a purge makes"""
+
+    def __init__(self, records=()):
+        self.records = list(records)
+        self.calls = []
+
+    def list(self):
+        self.calls.append("list")
+        return self.records
+
+    def delete_many(self, record_ids, missing_ok=False):
+        self.calls.append(("delete", tuple(record_ids)))
+
+
+def test_purge_without_creates_makes_no_calls():
+    """A session that created nothing neither lists nor deletes"""
+    api = FakeApi([{"_id": "1", "name": "Test Employee ab12cd-gw0-1"}])
+    assert ResourceRegistry(api, "ab12cd-gw0").purge() == 0
+    assert api.calls == []
+
+
+def test_namespace_scanned_only_after_ui_creates():
+    """
+    Untracked records are looked up only once a browser created some
+    Steps:
+    1. Purge tracked records: deleted by id, nothing listed
+    2. Flag UI creates and purge again: the namespace is scanned
+    """
+    api = FakeApi([
+        {"_id": "1", "name": "Test Employee ab12cd-gw0-1"},
+        {"_id": "2", "name": "Jane Doe"},
+        {"_id": "3", "name": "Test Employee ab12cd-gw01-1"},  # Another worker's record
+    ])
+    registry = ResourceRegistry(api, "ab12cd-gw0")
+    registry.track("7")
+    assert registry.purge() == 1
+    assert api.calls == [("delete", ("7",))]
+
+    api.calls = []
+    registry.expect_untracked()
+    assert registry.purge() == 1
+    assert api.calls == ["list", ("delete", ("1",))]
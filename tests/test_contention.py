@@ -0,0 +1,68 @@
+"""
+Employee Management System - Multi-Browser Contention
+Several browser sessions create, edit and delete the same records at the same
+time and check that every session's list catches up with the others' changes
+Run with: pytest --run-contention tests/test_contention.py
+"""
+
+import pytest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config.config import (
+    REPORTS_DIR,
+    CONTENTION_SESSIONS,
+    CONTENTION_ROUNDS,
+    CONTENTION_RECORDS,
+    CONTENTION_MIX,
+    CONTENTION_VISIBILITY_TIMEOUT,
+    CONTENTION_P95_BUDGET_MS
+)
+from utils.contention import ContentionRunner, session_capacity, format_summary, write_summary
+from utils.load_generator import parse_mix
+from utils.test_data import current_worker_id
+
+pytestmark = pytest.mark.contention
+
+
+def test_concurrent_crud_contention(grid_ready, app_url, employee_factory):
+    """
+    Contention: simultaneous create/edit/delete on shared records
+    Steps:
+    1. Open one session per free Grid slot (at most CONTENTION_SESSIONS) and seed shared records
+    2. Each round, every session changes the shared records at the same moment
+       (concurrent edits all hit the same record)
+    3. Check the saved changes against the API (overwritten edits, lost updates)
+    4. Reload every session's list until it shows the other sessions' changes (stale rows)
+    5. Verify changes show up elsewhere within CONTENTION_P95_BUDGET_MS at p95
+    """
+    sessions = session_capacity(grid_ready, CONTENTION_SESSIONS)
+    if sessions < 2:
+        pytest.skip(f"Contention needs at least 2 browser sessions, {sessions} available")
+
+    print(f"\n[CONTENTION] {sessions} sessions, {CONTENTION_ROUNDS} rounds ({CONTENTION_MIX})...")
+    runner = ContentionRunner(
+        app_url,
+        employee_factory,
+        parse_mix(CONTENTION_MIX),
+        visibility_timeout=CONTENTION_VISIBILITY_TIMEOUT
+    )
+    try:
+        runner.start(sessions)
+        runner.seed(CONTENTION_RECORDS)
+        summary = runner.run(CONTENTION_ROUNDS)
+    finally:
+        runner.close()
+    print(format_summary(summary))
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    write_summary(os.path.join(REPORTS_DIR, f"contention_{current_worker_id()}.json"), summary)
+
+    assert not summary["errors"], "Operations failed: " + "; ".join(summary["errors"])
+    assert not summary["lost_updates"], f"Lost updates: {summary['lost_updates']}"
+    assert not summary["stale_rows"], f"Stale rows after {CONTENTION_VISIBILITY_TIMEOUT}s: {summary['stale_rows']}"
+    p95 = summary["propagation"].get("p95_ms", 0)
+    assert p95 <= CONTENTION_P95_BUDGET_MS, f"Changes took {p95}ms to show up elsewhere (p95)"
+    print(f"[CONTENTION] ✓ Every session caught up; p95 {p95}ms")
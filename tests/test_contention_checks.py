@@ -0,0 +1,62 @@
+"""
+Lost-update checks of the contention runner (utils/contention.py)
+No browser or API needed
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.contention import ContentionRunner
+
+
+class FakeFactory:
+    registry = None
+
+    def track(self, *record_ids):
+        pass
+
+
+def edits(*written):
+    return [
+        {"round": 0, "session": session, "op": "edit", "record_id": "hot", "field": field, "value": value, "saved": 0.0}
+        for session, (field, value) in enumerate(written)
+    ]
+
+
+def runner():
+    runner = ContentionRunner("http://app", FakeFactory(), {"edit": 1})
+    runner.records = {"hot": "Contention A"}
+    return runner
+
+
+def test_overwritten_edit_is_reported():
+    """
+    An edit silently undone by another session's whole-record save is reported
+    Steps:
+    1. Two sessions edit name and position of the same record
+    2. The record keeps the last save: the new position, the old name
+    3. Verify the name edit is reported as overwritten and the position edit must show elsewhere
+    """
+    contention = runner()
+    plan = edits(("name", "Contention B"), ("position", "Role B"))
+    truth = {"hot": {"_id": "hot", "name": "Contention A", "position": "Role B"}}
+    visible = contention._verify(plan, truth)
+    assert visible == [plan[1]]
+    assert contention.overwritten == [{
+        "round": 0, "session": 0, "record_id": "hot",
+        "field": "name", "written": "Contention B", "final": "Contention A",
+    }]
+    assert contention.lost_updates == []
+
+
+def test_dropped_saves_are_lost_updates():
+    """None of the round's edits in the record is a lost update"""
+    contention = runner()
+    plan = edits(("name", "Contention B"), ("position", "Role B"))
+    truth = {"hot": {"_id": "hot", "name": "Contention A", "position": "Role A"}}
+    assert contention._verify(plan, truth) == []
+    assert len(contention.lost_updates) == 1
+    assert len(contention.overwritten) == 2
@@ -4,7 +4,6 @@ Tests all CRUD operations, navigation, and form validation
 """
 
 import pytest
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -15,62 +14,69 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from config.config import BASE_URL, EXPLICIT_WAIT
+from pages import EmployeeListPage, EmployeeFormPage
+from utils.timeouts import TIMEOUTS
+from utils.waits import wait_for_network_idle
 
 
 class TestEmployeeManagementSystem:
     """Test suite for Employee Management System"""
     
     @pytest.fixture(autouse=True)
-    def setup(self, driver):
+    def setup(self, driver, app_url, employee_factory, names, page_snapshots, throttle_profile):
         """Setup method that runs before each test"""
         self.driver = driver
-        self.wait = WebDriverWait(driver, EXPLICIT_WAIT)
-        self.base_url = BASE_URL
+        self.wait = WebDriverWait(driver, TIMEOUTS.explicit(driver))
+        self.base_url = app_url
+        self.employees = employee_factory
+        self.names = names
+        self.list_page = EmployeeListPage(driver, self.base_url)
+        self.form_page = EmployeeFormPage(driver, self.base_url)
+        self.snapshots = page_snapshots
+        self.profile = throttle_profile
     
     # ==================== TEST 1: Homepage Loads ====================
+    @pytest.mark.read_only
     def test_01_homepage_loads_successfully(self):
         """
         Test Case 1: Verify homepage loads successfully
         Steps:
-        1. Navigate to homepage
+        1. Load homepage (snapshot shared with tests 2 and 6)
         2. Verify page title contains expected text
         3. Verify Employee Records heading is displayed
         """
         print("\n[TEST 1] Testing homepage load...")
-        self.driver.get(self.base_url)
+        page = self.snapshots.get("list", self.list_page.capture, self.profile)
         
         # Verify page title
-        assert "Vite + React" in self.driver.title or "Employee" in self.driver.page_source
+        heading = page.find_element(By.XPATH, "//h3[contains(text(), 'Employee Records')]")
+        assert "Vite + React" in page.title or "Employee" in heading.text
         
         # Verify main heading
-        heading = self.wait.until(
-            EC.presence_of_element_located((By.XPATH, "//h3[contains(text(), 'Employee Records')]"))
-        )
         assert heading.is_displayed()
         print("[TEST 1] ✓ Homepage loaded successfully")
     
     # ==================== TEST 2: Create Employee Button Exists ====================
+    @pytest.mark.read_only
     def test_02_create_employee_button_exists(self):
         """
         Test Case 2: Verify Create Employee button is present and clickable
         Steps:
-        1. Navigate to homepage
+        1. Load homepage (shared snapshot)
         2. Locate Create Employee button
         3. Verify button is displayed and enabled
         """
         print("\n[TEST 2] Testing Create Employee button...")
-        self.driver.get(self.base_url)
+        page = self.snapshots.get("list", self.list_page.capture, self.profile)
         
         # Find Create Employee link/button
-        create_button = self.wait.until(
-            EC.presence_of_element_located((By.LINK_TEXT, "Create Employee"))
-        )
+        create_button = page.find_element(By.LINK_TEXT, "Create Employee")
         assert create_button.is_displayed()
         assert create_button.is_enabled()
         print("[TEST 2] ✓ Create Employee button found and enabled")
     
     # ==================== TEST 3: Navigate to Create Page ====================
+    @pytest.mark.read_only
     def test_03_navigate_to_create_page(self):
         """
         Test Case 3: Verify navigation to Create Employee page
@@ -81,7 +87,7 @@ class TestEmployeeManagementSystem:
         4. Verify form is displayed
         """
         print("\n[TEST 3] Testing navigation to create page...")
-        self.driver.get(self.base_url)
+        self.list_page.open()
         
         # Click Create Employee
         create_button = self.wait.until(
@@ -101,40 +107,39 @@ class TestEmployeeManagementSystem:
         print("[TEST 3] ✓ Successfully navigated to create page")
     
     # ==================== TEST 4: Form Elements Present ====================
+    @pytest.mark.read_only
     def test_04_create_form_elements_present(self):
         """
         Test Case 4: Verify all form elements are present
         Steps:
-        1. Navigate to create page
+        1. Load create page (shared snapshot)
         2. Verify Name input field exists
         3. Verify Position input field exists
         4. Verify Level radio buttons exist
         5. Verify Submit button exists
         """
         print("\n[TEST 4] Testing form elements...")
-        self.driver.get(f"{self.base_url}/create")
+        page = self.snapshots.get("create", self.form_page.capture_create, self.profile)
         
         # Verify Name field
-        name_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "name"))
-        )
+        name_input = page.find_element(By.ID, "name")
         assert name_input.is_displayed()
         
         # Verify Position field
-        position_input = self.driver.find_element(By.ID, "position")
+        position_input = page.find_element(By.ID, "position")
         assert position_input.is_displayed()
         
         # Verify Level radio buttons
-        intern_radio = self.driver.find_element(By.ID, "positionIntern")
-        junior_radio = self.driver.find_element(By.ID, "positionJunior")
-        senior_radio = self.driver.find_element(By.ID, "positionSenior")
+        intern_radio = page.find_element(By.ID, "positionIntern")
+        junior_radio = page.find_element(By.ID, "positionJunior")
+        senior_radio = page.find_element(By.ID, "positionSenior")
         
         assert intern_radio.is_displayed()
         assert junior_radio.is_displayed()
         assert senior_radio.is_displayed()
         
         # Verify Submit button
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
+        submit_button = page.find_element(By.XPATH, "//input[@type='submit']")
         assert submit_button.is_displayed()
         
         print("[TEST 4] ✓ All form elements present")
@@ -151,64 +156,45 @@ class TestEmployeeManagementSystem:
         5. Verify employee appears in list
         """
         print("\n[TEST 5] Testing employee creation...")
-        self.driver.get(f"{self.base_url}/create")
+        self.form_page.open_create()
         
         # Generate unique employee name
-        timestamp = str(int(time.time()))
-        employee_name = f"Test Employee {timestamp}"
+        employee_name = self.names.unique("Test Employee")
         
-        # Fill form
-        name_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "name"))
-        )
-        name_input.clear()
-        name_input.send_keys(employee_name)
-        
-        position_input = self.driver.find_element(By.ID, "position")
-        position_input.clear()
-        position_input.send_keys("QA Engineer")
-        
-        # Select Junior level
-        junior_radio = self.driver.find_element(By.ID, "positionJunior")
-        junior_radio.click()
-        
-        # Submit form
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-        submit_button.click()
-        
-        # Wait for redirect to homepage
-        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
+        # Fill form (Junior level) and submit; waits for redirect to homepage
+        self.form_page.fill(employee_name, "QA Engineer", "Junior")
+        self.form_page.submit()
         
         # Verify employee in list
-        time.sleep(2)  # Wait for data to load
-        page_source = self.driver.page_source
-        assert employee_name in page_source, f"Employee '{employee_name}' not found in list"
+        self.list_page.wait_for_row(employee_name)
+        row = self.list_page.find(employee_name)
+        assert row is not None, f"Employee '{employee_name}' not found in list"
+        self.employees.track(row.id)
+        assert (row.position, row.level) == ("QA Engineer", "Junior")
         
         print(f"[TEST 5] ✓ Employee '{employee_name}' created successfully")
     
     # ==================== TEST 6: View Employee List ====================
+    @pytest.mark.read_only
     def test_06_view_employee_list(self):
         """
         Test Case 6: Verify employee list displays correctly
         Steps:
-        1. Navigate to homepage
+        1. Load homepage (shared snapshot)
         2. Verify table headers are present
         3. Check if table has rows (if employees exist)
         """
         print("\n[TEST 6] Testing employee list view...")
-        self.driver.get(self.base_url)
+        page = self.snapshots.get("list", self.list_page.capture, self.profile)
         
         # Verify table exists
-        table = self.wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
-        )
+        table = page.find_element(By.CSS_SELECTOR, "table")
         assert table.is_displayed()
         
         # Verify table headers
-        headers = self.driver.find_elements(By.XPATH, "//thead//th")
-        assert len(headers) >= 4  # Name, Position, Level, Action
+        header_texts = [header.text for header in page.find_elements(By.CSS_SELECTOR, "thead th")]
+        assert len(header_texts) >= 4  # Name, Position, Level, Action
         
-        header_texts = [h.text for h in headers]
         assert "Name" in header_texts
         assert "Position" in header_texts
         assert "Level" in header_texts
@@ -221,36 +207,24 @@ class TestEmployeeManagementSystem:
         """
         Test Case 7: Verify Edit button exists for employee records
         Steps:
-        1. Create a test employee first
-        2. Verify Edit button appears
+        1. Create a test employee first (via API)
+        2. Verify Edit button appears in its row
         3. Verify Edit button is clickable
         """
         print("\n[TEST 7] Testing Edit button existence...")
         
         # First create an employee
-        self.driver.get(f"{self.base_url}/create")
-        timestamp = str(int(time.time()))
-        
-        name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-        name_input.send_keys(f"Edit Test {timestamp}")
+        employee = self.employees.create(self.names.unique("Edit Test"), "Developer", "Senior")
         
-        position_input = self.driver.find_element(By.ID, "position")
-        position_input.send_keys("Developer")
-        
-        senior_radio = self.driver.find_element(By.ID, "positionSenior")
-        senior_radio.click()
+        self.list_page.open()
+        self.list_page.wait_for_row(employee["name"])
         
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-        submit_button.click()
-        
-        # Wait for redirect
-        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
-        time.sleep(2)
-        
-        # Find Edit button
-        edit_buttons = self.driver.find_elements(By.LINK_TEXT, "Edit")
-        assert len(edit_buttons) > 0, "No Edit buttons found"
-        assert edit_buttons[0].is_displayed()
+        # Find the Edit button of the created employee (not whichever row is first)
+        try:
+            edit_button = self.list_page.edit_button(employee["name"])
+        except NoSuchElementException:
+            pytest.fail(f"No Edit button for '{employee['name']}'")
+        assert edit_button.is_displayed()
         
         print("[TEST 7] ✓ Edit button exists and is visible")
     
@@ -259,7 +233,7 @@ class TestEmployeeManagementSystem:
         """
         Test Case 8: Edit an existing employee record
         Steps:
-        1. Create a test employee
+        1. Create a test employee (via API)
         2. Click Edit button
         3. Modify employee details
         4. Submit changes
@@ -268,54 +242,32 @@ class TestEmployeeManagementSystem:
         print("\n[TEST 8] Testing employee edit functionality...")
         
         # Create employee
-        self.driver.get(f"{self.base_url}/create")
-        timestamp = str(int(time.time()))
-        original_name = f"Original Name {timestamp}"
-        
-        name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-        name_input.send_keys(original_name)
-        
-        position_input = self.driver.find_element(By.ID, "position")
-        position_input.send_keys("Backend Developer")
-        
-        intern_radio = self.driver.find_element(By.ID, "positionIntern")
-        intern_radio.click()
-        
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-        submit_button.click()
+        original_name = self.names.unique("Original Name")
+        self.employees.create(original_name, "Backend Developer", "Intern")
         
-        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
-        time.sleep(2)
+        self.list_page.open()
+        self.list_page.wait_for_row(original_name)
         
-        # Click Edit on first employee
-        edit_button = self.wait.until(
-            EC.element_to_be_clickable((By.LINK_TEXT, "Edit"))
-        )
-        edit_button.click()
+        # Click Edit on the created employee
+        self.list_page.click_edit(original_name)
         
-        # Wait for edit page
+        # Wait for edit page and the record to load into the form
         self.wait.until(EC.url_contains("/edit/"))
+        self.form_page.wait_until_loaded(original_name)
         
-        # Modify name
-        updated_name = f"Updated Name {timestamp}"
-        name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-        name_input.clear()
-        name_input.send_keys(updated_name)
-        
-        # Submit changes
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-        submit_button.click()
-        
-        # Verify redirect and changes
-        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
-        time.sleep(3)  # Wait for data to update
+        # Modify name and submit changes; waits for redirect
+        updated_name = self.names.unique("Updated Name")
+        self.form_page.fill(name=updated_name)
+        self.form_page.submit()
+        wait_for_network_idle(self.driver)
         
         # Refresh page to ensure we get latest data
         self.driver.refresh()
-        time.sleep(2)
+        self.list_page.wait_for_row(updated_name)
         
-        page_source = self.driver.page_source
-        assert updated_name in page_source, f"Updated name '{updated_name}' not found"
+        snapshot = self.list_page.snapshot(contains=self.names.namespace)
+        assert updated_name in snapshot.names(), f"Updated name '{updated_name}' not found"
+        assert original_name not in snapshot.names(), f"Original name '{original_name}' still listed"
         
         print(f"[TEST 8] ✓ Employee updated to '{updated_name}'")
     
@@ -324,35 +276,24 @@ class TestEmployeeManagementSystem:
         """
         Test Case 9: Verify Delete button exists for employees
         Steps:
-        1. Create a test employee
-        2. Verify Delete button appears
+        1. Create a test employee (via API)
+        2. Verify Delete button appears in its row
         3. Verify Delete button is clickable
         """
         print("\n[TEST 9] Testing Delete button existence...")
         
         # Create employee
-        self.driver.get(f"{self.base_url}/create")
-        timestamp = str(int(time.time()))
+        employee = self.employees.create(self.names.unique("Delete Test"), "Tester", "Junior")
         
-        name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-        name_input.send_keys(f"Delete Test {timestamp}")
+        self.list_page.open()
+        self.list_page.wait_for_row(employee["name"])
         
-        position_input = self.driver.find_element(By.ID, "position")
-        position_input.send_keys("Tester")
-        
-        junior_radio = self.driver.find_element(By.ID, "positionJunior")
-        junior_radio.click()
-        
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-        submit_button.click()
-        
-        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
-        time.sleep(2)
-        
-        # Find Delete button
-        delete_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Delete')]")
-        assert len(delete_buttons) > 0, "No Delete buttons found"
-        assert delete_buttons[0].is_displayed()
+        # Find the Delete button of the created employee (not whichever row is first)
+        try:
+            delete_button = self.list_page.delete_button(employee["name"])
+        except NoSuchElementException:
+            pytest.fail(f"No Delete button for '{employee['name']}'")
+        assert delete_button.is_displayed()
         
         print("[TEST 9] ✓ Delete button exists and is visible")
     
@@ -361,56 +302,41 @@ class TestEmployeeManagementSystem:
         """
         Test Case 10: Delete an employee record
         Steps:
-        1. Create a test employee
-        2. Count total employees
+        1. Create a test employee (via API)
+        2. Count this worker's employees (other workers change the table meanwhile)
         3. Click Delete button
-        4. Verify employee count decreased
+        4. Verify this worker's employee count decreased
         5. Verify employee no longer in list
         """
         print("\n[TEST 10] Testing employee deletion...")
         
         # Create employee
-        self.driver.get(f"{self.base_url}/create")
-        timestamp = str(int(time.time()))
-        employee_name = f"To Delete {timestamp}"
-        
-        name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-        name_input.send_keys(employee_name)
-        
-        position_input = self.driver.find_element(By.ID, "position")
-        position_input.send_keys("Temporary")
+        employee_name = self.names.unique("To Delete")
+        self.employees.create(employee_name, "Temporary", "Senior")
         
-        senior_radio = self.driver.find_element(By.ID, "positionSenior")
-        senior_radio.click()
+        self.list_page.open()
+        self.list_page.wait_for_row(employee_name)
         
-        submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-        submit_button.click()
+        # Count this worker's employees before deletion
+        count_before = len(self.list_page.snapshot(contains=self.names.namespace).rows)
         
-        self.wait.until(EC.url_to_be(f"{self.base_url}/"))
-        time.sleep(2)
+        # Click Delete on the created employee (not whichever row is first)
+        self.list_page.click_delete(employee_name)
         
-        # Count employees before deletion
-        rows_before = self.driver.find_elements(By.XPATH, "//tbody/tr")
-        count_before = len(rows_before)
-        
-        # Click Delete on first employee
-        delete_button = self.wait.until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Delete')]"))
-        )
-        delete_button.click()
+        # Wait for the row to be removed from the table
+        self.list_page.wait_for_row_gone(employee_name)
         
-        # Wait a moment for deletion
-        time.sleep(2)
-        
-        # Count employees after deletion
-        rows_after = self.driver.find_elements(By.XPATH, "//tbody/tr")
-        count_after = len(rows_after)
+        # Count this worker's employees after deletion
+        snapshot = self.list_page.snapshot(contains=self.names.namespace)
+        count_after = len(snapshot.rows)
         
+        assert employee_name not in snapshot.names(), f"'{employee_name}' still listed"
         assert count_after == count_before - 1, "Employee count did not decrease"
         
         print(f"[TEST 10] ✓ Employee deleted successfully (count: {count_before} → {count_after})")
     
     # ==================== TEST 11: Radio Button Selection ====================
+    @pytest.mark.read_only
     def test_11_radio_button_selection(self):
         """
         Test Case 11: Verify only one radio button can be selected
@@ -422,7 +348,7 @@ class TestEmployeeManagementSystem:
         5. Verify only Junior is selected
         """
         print("\n[TEST 11] Testing radio button selection...")
-        self.driver.get(f"{self.base_url}/create")
+        self.form_page.open_create()
         
         intern_radio = self.wait.until(EC.presence_of_element_located((By.ID, "positionIntern")))
         junior_radio = self.driver.find_element(By.ID, "positionJunior")
@@ -430,21 +356,21 @@ class TestEmployeeManagementSystem:
         
         # Select Intern
         intern_radio.click()
-        time.sleep(0.5)
+        self.wait.until(EC.element_to_be_selected(intern_radio))
         assert intern_radio.is_selected()
         assert not junior_radio.is_selected()
         assert not senior_radio.is_selected()
         
         # Select Junior
         junior_radio.click()
-        time.sleep(0.5)
+        self.wait.until(EC.element_to_be_selected(junior_radio))
         assert not intern_radio.is_selected()
         assert junior_radio.is_selected()
         assert not senior_radio.is_selected()
         
         # Select Senior
         senior_radio.click()
-        time.sleep(0.5)
+        self.wait.until(EC.element_to_be_selected(senior_radio))
         assert not intern_radio.is_selected()
         assert not junior_radio.is_selected()
         assert senior_radio.is_selected()
@@ -452,6 +378,7 @@ class TestEmployeeManagementSystem:
         print("[TEST 11] ✓ Radio button selection works correctly")
     
     # ==================== TEST 12: Form Input Validation ====================
+    @pytest.mark.read_only
     def test_12_form_accepts_input(self):
         """
         Test Case 12: Verify form inputs accept text
@@ -462,7 +389,7 @@ class TestEmployeeManagementSystem:
         4. Verify inputs contain entered text
         """
         print("\n[TEST 12] Testing form input acceptance...")
-        self.driver.get(f"{self.base_url}/create")
+        self.form_page.open_create()
         
         name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
         position_input = self.driver.find_element(By.ID, "position")
@@ -483,46 +410,30 @@ class TestEmployeeManagementSystem:
         """
         Test Case 13: Create multiple employees and verify all appear
         Steps:
-        1. Create 3 different employees
+        1. Create 3 different employees (one batch via API)
         2. Verify all 3 appear in the list
         """
         print("\n[TEST 13] Testing multiple employee creation...")
-        timestamp = str(int(time.time()))
         
         employees = [
-            {"name": f"Alice {timestamp}", "position": "Frontend Dev", "level": "positionJunior"},
-            {"name": f"Bob {timestamp}", "position": "Backend Dev", "level": "positionSenior"},
-            {"name": f"Charlie {timestamp}", "position": "DevOps", "level": "positionIntern"}
+            {"name": self.names.unique("Alice"), "position": "Frontend Dev", "level": "Junior"},
+            {"name": self.names.unique("Bob"), "position": "Backend Dev", "level": "Senior"},
+            {"name": self.names.unique("Charlie"), "position": "DevOps", "level": "Intern"}
         ]
-        
-        for emp in employees:
-            self.driver.get(f"{self.base_url}/create")
-            
-            name_input = self.wait.until(EC.presence_of_element_located((By.ID, "name")))
-            name_input.send_keys(emp["name"])
-            
-            position_input = self.driver.find_element(By.ID, "position")
-            position_input.send_keys(emp["position"])
-            
-            level_radio = self.driver.find_element(By.ID, emp["level"])
-            level_radio.click()
-            
-            submit_button = self.driver.find_element(By.XPATH, "//input[@type='submit']")
-            submit_button.click()
-            
-            self.wait.until(EC.url_to_be(f"{self.base_url}/"))
-            time.sleep(1)
+        self.employees.create_many(records=employees)
         
         # Verify all employees in list
-        time.sleep(2)
-        page_source = self.driver.page_source
+        self.list_page.open()
+        self.list_page.wait_for_row(employees[-1]["name"])
+        listed = self.list_page.snapshot(contains=self.names.namespace).names()
         
         for emp in employees:
-            assert emp["name"] in page_source, f"Employee '{emp['name']}' not found"
+            assert emp["name"] in listed, f"Employee '{emp['name']}' not found"
         
         print(f"[TEST 13] ✓ Created and verified {len(employees)} employees")
     
     # ==================== TEST 14: Navigation Back to Homepage ====================
+    @pytest.mark.read_only
     def test_14_navigation_back_to_homepage(self):
         """
         Test Case 14: Verify navigation back to homepage
@@ -532,14 +443,13 @@ class TestEmployeeManagementSystem:
         3. Verify URL is homepage
         """
         print("\n[TEST 14] Testing navigation back to homepage...")
-        self.driver.get(f"{self.base_url}/create")
+        self.form_page.open_create()
         
         # Verify we're on create page
         assert "/create" in self.driver.current_url
         
-        # Navigate back by clicking on the main heading/logo
-        # (This might need adjustment based on actual navigation implementation)
-        self.driver.get(self.base_url)
+        # Navigate back (in-app link click while the app is loaded)
+        self.list_page.open()
         
         # Verify we're back on homepage
         assert self.driver.current_url == f"{self.base_url}/" or self.driver.current_url == self.base_url
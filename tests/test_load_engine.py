@@ -0,0 +1,40 @@
+"""
+API load engine against the in-process stand-in (utils/load_generator.py)
+Runs offline in the default suite; tests/test_api_load.py drives the real API
+"""
+
+import pytest
+import asyncio
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.load_generator import aiohttp, run_load
+from utils.stub_server import StubServer
+
+
+@pytest.mark.skipif(aiohttp is None, reason="the load generator needs aiohttp")
+def test_load_engine_against_stub():
+    """
+    Load engine: one second of closed-loop traffic against the stand-in
+    Steps:
+    1. Start the stand-in with 5ms latency per API call
+    2. Run the create/edit/delete mix for 1s with 4 concurrent users
+    3. Verify requests were counted per endpoint without errors
+    4. Verify the latency percentiles are ordered and include the added latency
+    5. Verify the run deleted every record it created
+    """
+    with StubServer(latency=0.005, seed=1) as server:
+        summary = asyncio.run(run_load(server.url, duration=1, concurrency=4, name_prefix="Load engine"))
+        leftovers = server.store.list()
+
+    endpoints = summary["endpoints"]
+    assert "POST /record" in endpoints, f"No creates in {list(endpoints)}"
+    assert sum(summary["scenarios"].values()) > 0
+    for endpoint, stats in endpoints.items():
+        assert stats["requests"] > 0, endpoint
+        assert stats["errors"] == 0, f"{endpoint} failed {stats['errors']} time(s)"
+        assert 5 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"], f"{endpoint}: {stats}"
+    assert leftovers == [], f"{len(leftovers)} record(s) left behind"
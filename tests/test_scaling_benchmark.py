@@ -0,0 +1,91 @@
+"""
+Employee Management System - Large-Dataset Scaling Benchmark
+Seeds growing numbers of employees and measures the homepage list at each size
+Run with: pytest --run-benchmarks tests/test_scaling_benchmark.py (without -n)
+"""
+
+import pytest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config.config import (
+    BENCHMARK_SIZES,
+    BENCHMARK_RELEASE,
+    BENCHMARK_RESULTS_DIR,
+    BENCHMARK_THRESHOLDS_FILE,
+    BENCHMARK_BASELINE_FILE,
+    BENCHMARK_TOLERANCE,
+    BENCHMARK_RENDER_TIMEOUT
+)
+from pages import EmployeeListPage
+from utils.benchmark import measure_list_scaling, check_point, load_json, save_curve
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def scaling_curve():
+    """Collects {size: metrics}; written to BENCHMARK_RESULTS_DIR at the end"""
+    curve = {}
+    yield curve
+    if curve:
+        path = os.path.join(BENCHMARK_RESULTS_DIR, f"scaling_{BENCHMARK_RELEASE}.json")
+        save_curve(curve, path, BENCHMARK_RELEASE)
+        print(f"\n[BENCHMARK] Scaling curve written to {path}")
+
+
+@pytest.fixture(scope="module")
+def benchmark_records(api, registry):
+    """Employees seeded for the benchmark; grows between sizes, deleted at the end"""
+    records = []
+    yield records
+    record_ids = [record["_id"] for record in records]
+    api.delete_many(record_ids, missing_ok=True)
+    registry.forget(*record_ids)
+
+
+@pytest.mark.parametrize("size", BENCHMARK_SIZES, ids=lambda size: f"{size}_rows")
+def test_employee_list_scaling(size, driver, app_url, api, employee_factory, benchmark_records,
+                               scaling_curve, record_property):
+    """
+    Benchmark: employee list at `size` seeded employees
+    Steps:
+    1. Seed employees through the API until `size` benchmark records exist
+    2. Measure time to heading, time to full table, row lookup, delete and payload size
+    3. Compare against the thresholds file and the baseline release
+    """
+    print(f"\n[BENCHMARK] Seeding up to {size} employees...")
+    missing = size - len(benchmark_records)
+    if missing > 0:
+        benchmark_records.extend(employee_factory.create_many(missing, prefix="Bench"))
+    
+    list_page = EmployeeListPage(driver, app_url)
+    deleted = benchmark_records.pop(0)
+    point = measure_list_scaling(
+        list_page,
+        api,
+        lookup_name=benchmark_records[-1]["name"],
+        delete_name=deleted["name"],
+        timeout=BENCHMARK_RENDER_TIMEOUT
+    )
+    scaling_curve[str(size)] = point
+    for metric, value in point.items():
+        record_property(metric, value)
+    
+    print(
+        f"[BENCHMARK] {point['rows']} rows: heading {point['time_to_heading']:.2f}s, "
+        f"table {point['time_to_table']:.2f}s, lookup {point['row_lookup'] * 1000:.0f}ms, "
+        f"delete {point['row_delete']:.2f}s, payload {point['payload_bytes'] / 1024:.0f} KiB"
+    )
+    
+    violations = check_point(
+        size,
+        point,
+        thresholds=load_json(BENCHMARK_THRESHOLDS_FILE, {}),
+        baseline=load_json(BENCHMARK_BASELINE_FILE),
+        tolerance=BENCHMARK_TOLERANCE
+    )
+    assert not violations, f"{size} rows: " + "; ".join(violations)
@@ -0,0 +1,71 @@
+"""
+Longest-first scheduling in xdist workers (tests/conftest.py)
+No browser or API needed
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests.conftest import duration_history_key, schedule_longest_first
+from utils.durations import DurationHistory
+
+
+class FakeItem:
+    """The parts of a pytest item the scheduler uses"""
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.keywords = {}
+        self.marks = []
+
+    def get_closest_marker(self, name):
+        return next((mark for mark in self.marks if mark.name == name), None)
+
+    def add_marker(self, marker):
+        self.marks.append(marker.mark)
+
+
+def worker_config(history, **options):
+    """Config as an xdist worker sees it: `dist` reset to "no", the mode kept as `loadgroup`"""
+    options = dict({"dist": "no", "loadgroup": True}, **options)
+    return SimpleNamespace(
+        workerinput={"workerid": "gw0"},
+        stash={duration_history_key: history},
+        getoption=lambda name, default=None: options.get(name, default),
+    )
+
+
+def test_lpt_groups_applied_in_worker(tmp_path, monkeypatch):
+    """
+    With --dist loadgroup every worker pins tests to LPT groups
+    Steps:
+    1. Give three tests known durations
+    2. Schedule them with a worker's config on 2 workers
+    3. Verify the longest test runs first and every test got an lpt group
+    """
+    history = DurationHistory(str(tmp_path / "durations.json"))
+    for test_id, seconds in (("t::a", 1.0), ("t::b", 9.0), ("t::c", 4.0)):
+        history.record(test_id, seconds)
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+    items = [FakeItem(test_id) for test_id in ("t::a", "t::b", "t::c")]
+
+    schedule_longest_first(worker_config(history), items)
+
+    assert [item.nodeid for item in items] == ["t::b", "t::c", "t::a"]
+    groups = {item.nodeid: item.get_closest_marker("xdist_group").args[0] for item in items}
+    assert groups == {"t::b": "lpt0", "t::c": "lpt1", "t::a": "lpt1"}
+
+
+@pytest.mark.parametrize("options", [{"loadgroup": False}, {"dist": "load", "loadgroup": False}])
+def test_no_groups_without_loadgroup(tmp_path, monkeypatch, options):
+    """Other distribution modes keep the order but add no groups"""
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+    items = [FakeItem("t::a"), FakeItem("t::b")]
+    schedule_longest_first(worker_config(DurationHistory(str(tmp_path / "d.json")), **options), items)
+    assert all(item.get_closest_marker("xdist_group") is None for item in items)
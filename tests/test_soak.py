@@ -0,0 +1,59 @@
+"""
+Employee Management System - Browser Memory Soak
+Repeats create/list/edit/delete thousands of times in one browser session and
+fails when heap, DOM nodes or event listeners grow without bound
+Run with: pytest --run-soak tests/test_soak.py
+"""
+
+import pytest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config.config import (
+    REPORTS_DIR,
+    SOAK_CYCLES,
+    SOAK_SAMPLE_EVERY,
+    SOAK_WARMUP_CYCLES,
+    SOAK_MAX_HEAP_GROWTH,
+    SOAK_MAX_NODE_GROWTH,
+    SOAK_MAX_LISTENER_GROWTH
+)
+from pages import EmployeeListPage, EmployeeFormPage
+from utils.soak import SoakRunner, detect_growth
+from utils.test_data import current_worker_id
+
+pytestmark = pytest.mark.soak
+
+
+def test_crud_memory_soak(driver, app_url, names):
+    """
+    Soak: repeated CRUD flow in one session
+    Steps:
+    1. Open the homepage once; navigate only through in-app links afterwards
+    2. Run SOAK_CYCLES create -> list -> edit -> delete cycles
+    3. Sample heap, DOM nodes and listeners every SOAK_SAMPLE_EVERY cycles
+    4. Fit a trend after warm-up and fail on steady growth
+    """
+    print(f"\n[SOAK] Running {SOAK_CYCLES} CRUD cycles...")
+    runner = SoakRunner(EmployeeListPage(driver, app_url), EmployeeFormPage(driver, app_url), names)
+    samples = runner.run(SOAK_CYCLES, SOAK_SAMPLE_EVERY)
+    
+    failures = detect_growth(
+        samples,
+        {
+            "heap": SOAK_MAX_HEAP_GROWTH,
+            "dom_nodes": SOAK_MAX_NODE_GROWTH,
+            "listeners": SOAK_MAX_LISTENER_GROWTH,
+        },
+        warmup_cycles=SOAK_WARMUP_CYCLES
+    )
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    runner.write(os.path.join(REPORTS_DIR, f"soak_{current_worker_id()}.json"), failures)
+    
+    assert not failures, "Unbounded growth per cycle: " + ", ".join(
+        f"{metric} +{slope:.1f} (r²={r_squared:.2f})" for metric, (slope, r_squared) in failures.items()
+    )
+    print(f"[SOAK] ✓ No unbounded growth over {SOAK_CYCLES} cycles")
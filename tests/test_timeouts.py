@@ -0,0 +1,75 @@
+"""
+Adaptive timeouts (utils/timeouts.py)
+No browser or API needed
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.timeouts import AdaptiveTimeouts, MIN_SAMPLES, EXPLICIT_LIMITS, PAGE_LOAD_LIMITS
+
+
+class FakeDriver:
+    """Answers the Navigation Timing script with a fixed load time"""
+
+    def __init__(self, load_seconds):
+        self.load_seconds = load_seconds
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        return self.load_seconds
+
+
+class FakeApi:
+    def list(self):
+        return []
+
+
+def test_fast_target_gets_shorter_timeouts():
+    """
+    A fast target fails broken tests sooner than the configured 15/30s
+    Steps:
+    1. Calibrate against a page that loads in 0.2s and an instant API
+    2. Verify both timeouts drop below the configured values, to their floors
+    """
+    timeouts = AdaptiveTimeouts(15, 30)
+    driver = FakeDriver(0.2)
+    assert timeouts.calibrate(driver, "http://app", FakeApi())
+    assert driver.visited == ["http://app"]
+    assert timeouts.current() == {"explicit": EXPLICIT_LIMITS[0], "page_load": PAGE_LOAD_LIMITS[0]}
+    assert timeouts.current()["explicit"] < 15 and timeouts.current()["page_load"] < 30
+
+
+def test_environment_overrides_are_kept():
+    """EXPLICIT_WAIT / PAGE_LOAD_TIMEOUT set in the environment are never adapted"""
+    timeouts = AdaptiveTimeouts(15, 30, overrides=("EXPLICIT_WAIT", "PAGE_LOAD_TIMEOUT"))
+    timeouts.calibrate(FakeDriver(0.2), "http://app", FakeApi())
+    assert timeouts.current() == {"explicit": 15, "page_load": 30}
+
+
+def test_slow_profile_gets_longer_timeouts():
+    """
+    A slow profile's timeouts grow with its measured page loads
+    Steps:
+    1. Observe slow page loads under a throttling profile
+    2. Verify that profile's timeouts grow, and the default profile's do not
+    """
+    timeouts = AdaptiveTimeouts(15, 30)
+    for _ in range(MIN_SAMPLES):
+        timeouts.observe("page_load", 9.0, "slow-3g")
+    assert timeouts.current("slow-3g") == {"explicit": 37.0, "page_load": 38.0}
+    assert timeouts.current() == {"explicit": 15, "page_load": 30}
+
+
+def test_disabled():
+    """With ADAPTIVE_TIMEOUTS=0 the configured values are used as given"""
+    timeouts = AdaptiveTimeouts(15, 30, enabled=False)
+    for _ in range(MIN_SAMPLES):
+        timeouts.observe("page_load", 9.0)
+    assert timeouts.current() == {"explicit": 15, "page_load": 30}
@@ -0,0 +1,35 @@
+"""
+Time budget of the command tracer (utils/tracing.py)
+No browser or API needed
+"""
+
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.tracing import CommandTracer
+
+
+def test_only_the_tests_own_sleeps_are_counted(monkeypatch):
+    """
+    Sleeps from libraries are not booked to the test
+    Steps:
+    1. Trace sleeps made from this module
+    2. Sleep from this module, then let Selenium poll (it sleeps between polls)
+    3. Verify only this module's sleep is counted
+    """
+    tracer = CommandTracer()
+    monkeypatch.setattr(time, "sleep", tracer.sleep_hook(time.sleep, __file__))
+
+    time.sleep(0.01)
+    assert tracer.totals["sleeps"] >= 0.01
+
+    counted = tracer.totals["sleeps"]
+    polls = []
+    WebDriverWait(None, 1, poll_frequency=0.01).until(lambda driver: polls.append(1) or len(polls) > 2)
+    assert tracer.totals["sleeps"] == counted
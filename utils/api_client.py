@@ -0,0 +1,116 @@
+"""
+REST client for the Employee Management API
+Used to seed and inspect test data without going through the browser
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
+
+from config.config import API_URL, API_RECORDS_PATH, API_POOL_SIZE
+
+
+class ApiError(Exception):
+    """Raised when the API answers with an unexpected status code or body"""
+
+    def __init__(self, method, url, status, body):
+        super().__init__(f"{method} {url} returned {status}: {body[:200]}")
+        self.status = status
+
+
+class EmployeeApiClient:
+    """
+    CRUD client for employee records over a pool of keep-alive connections
+    The API only has single-record routes (`POST /record`, `PATCH` and
+    `DELETE /record/:id`) and no bulk endpoint, so the bulk helpers fan
+    single-record requests out over the pool instead of one at a time
+    """
+
+    def __init__(self, api_url=API_URL, records_path=API_RECORDS_PATH,
+                 pool_size=API_POOL_SIZE, timeout=10):
+        self.records_url = f"{api_url.rstrip('/')}{records_path}"
+        self.pool_size = pool_size
+        self.http = urllib3.PoolManager(
+            maxsize=pool_size,
+            block=True,
+            timeout=urllib3.Timeout(total=timeout),
+            retries=False,
+            headers={"Content-Type": "application/json"}
+        )
+
+    # ==================== Single record operations ====================
+    def create(self, name, position, level):
+        """Create an employee and return it including its `_id`"""
+        record = {"name": name, "position": position, "level": level}
+        result = self._request("POST", self.records_url, record) or {}
+        # The API answers with the Mongo insert result rather than the document
+        record["_id"] = result.get("_id") or result.get("insertedId")
+        if not record["_id"]:
+            raise ApiError("POST", self.records_url, "no record id", json.dumps(result))
+        return record
+
+    def get(self, record_id):
+        return self._request("GET", f"{self.records_url}/{record_id}")
+
+    def list(self):
+        return self._request("GET", self.records_url)
+
+    def list_with_size(self):
+        """All records plus the size in bytes of the list response body"""
+        data = self._raw_request("GET", self.records_url)
+        return json.loads(data), len(data)
+
+    def update(self, record_id, **fields):
+        return self._request("PATCH", f"{self.records_url}/{record_id}", fields)
+
+    def delete(self, record_id, missing_ok=False):
+        try:
+            return self._request("DELETE", f"{self.records_url}/{record_id}")
+        except ApiError as e:
+            if missing_ok and e.status == 404:
+                return None
+            raise
+
+    # ==================== Bulk operations ====================
+    def create_many(self, records):
+        """
+        Create several employees concurrently; returns them in input order
+        One POST per record: the API has no bulk insert to batch them into
+        """
+        return self._fan_out(
+            lambda r: self.create(r["name"], r["position"], r["level"]),
+            records
+        )
+
+    def update_many(self, updates):
+        """Apply a {record_id: fields} mapping concurrently"""
+        return self._fan_out(
+            lambda item: self.update(item[0], **item[1]),
+            list(updates.items())
+        )
+
+    def delete_many(self, record_ids, missing_ok=False):
+        """Delete concurrently; with `missing_ok`, already deleted records are not an error"""
+        return self._fan_out(lambda record_id: self.delete(record_id, missing_ok), record_ids)
+
+    def close(self):
+        self.http.clear()
+
+    def _fan_out(self, func, items):
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _request(self, method, url, payload=None):
+        data = self._raw_request(method, url, payload)
+        return json.loads(data) if data else None
+
+    def _raw_request(self, method, url, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else None
+        response = self.http.request(method, url, body=body)
+        if response.status >= 400:
+            text = response.data.decode("utf-8", errors="replace")
+            raise ApiError(method, url, response.status, text)
+        return response.data
@@ -0,0 +1,239 @@
+"""
+Failure artifacts: screenshot, DOM, console log and network log (HAR)
+Only the reads from the browser happen while the test waits; compressing
+and writing run on a background thread. Count and total size are capped
+per worker, and the report links to the files instead of embedding them.
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.cdp import add_script_on_new_document
+
+
+# Keeps the last console messages and uncaught errors of the page
+CONSOLE_RECORDER_SCRIPT = """
+(function () {
+    if (window.__seleniumConsole) { return; }
+    var log = window.__seleniumConsole = [];
+    function add(level, args) {
+        var text = Array.prototype.map.call(args, function (arg) {
+            if (arg instanceof Error) { return arg.stack || String(arg); }
+            if (typeof arg === 'object') { try { return JSON.stringify(arg); } catch (e) {} }
+            return String(arg);
+        }).join(' ');
+        log.push({ level: level, time: Date.now(), url: location.href, text: text });
+        if (log.length > 500) { log.shift(); }
+    }
+    ['error', 'warn', 'info', 'log'].forEach(function (level) {
+        var original = console[level];
+        console[level] = function () {
+            add(level, arguments);
+            return original.apply(console, arguments);
+        };
+    });
+    window.addEventListener('error', function (event) {
+        add('uncaught', [event.error || event.message]);
+    });
+    window.addEventListener('unhandledrejection', function (event) {
+        add('unhandledrejection', [event.reason]);
+    });
+})();
+"""
+
+# Everything the artifacts need from the page, in one round trip
+FAILURE_STATE_SCRIPT = """
+function number(value) { return typeof value === 'number' ? value : -1; }
+var resources = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {
+    url: location.href,
+    title: document.title,
+    dom: document.documentElement ? document.documentElement.outerHTML : '',
+    console: window.__seleniumConsole || [],
+    requests: window.__seleniumNetwork ? window.__seleniumNetwork.requests : [],
+    time_origin: performance.timeOrigin,
+    resources: resources.map(function (entry) {
+        return {
+            url: entry.name,
+            type: entry.initiatorType,
+            protocol: entry.nextHopProtocol || '',
+            start: entry.startTime,
+            duration: entry.duration,
+            status: number(entry.responseStatus),
+            transfer_size: number(entry.transferSize),
+            encoded_size: number(entry.encodedBodySize),
+            decoded_size: number(entry.decodedBodySize),
+            dns: entry.domainLookupEnd - entry.domainLookupStart,
+            connect: entry.connectEnd - entry.connectStart,
+            wait: entry.responseStart - entry.requestStart,
+            receive: entry.responseEnd - entry.responseStart
+        };
+    })
+};
+"""
+
+
+def install_console_recorder(driver):
+    """Record console messages of every document; False when DevTools is unavailable"""
+    try:
+        add_script_on_new_document(driver, CONSOLE_RECORDER_SCRIPT)
+        return True
+    except WebDriverException:
+        return False
+
+
+def _iso(epoch_ms):
+    return datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc).isoformat()
+
+
+def build_har(state):
+    """
+    HAR 1.2 log from Resource Timing entries
+    Methods and statuses of fetch/XHR calls come from the network tracker
+    (utils.waits); headers and bodies are not available to the page
+    """
+    methods = {}
+    for request in state.get("requests", []):
+        methods.setdefault(request["url"], []).append(request)
+    entries = []
+    for resource in state.get("resources", []):
+        tracked = methods.get(resource["url"])
+        request = tracked.pop(0) if tracked else {}
+        status = resource["status"] if resource["status"] > 0 else (request.get("status") or 0)
+        entries.append({
+            "pageref": "page_1",
+            "startedDateTime": _iso(state["time_origin"] + resource["start"]),
+            "time": round(resource["duration"], 3),
+            "request": {
+                "method": request.get("method", "GET"),
+                "url": resource["url"],
+                "httpVersion": resource["protocol"],
+                "cookies": [], "headers": [], "queryString": [],
+                "headersSize": -1, "bodySize": -1,
+            },
+            "response": {
+                "status": status, "statusText": "",
+                "httpVersion": resource["protocol"],
+                "cookies": [], "headers": [],
+                "content": {"size": resource["decoded_size"], "mimeType": ""},
+                "redirectURL": "",
+                "headersSize": -1, "bodySize": resource["encoded_size"],
+                "_transferSize": resource["transfer_size"],
+            },
+            "cache": {},
+            "timings": {
+                "dns": round(resource["dns"], 3),
+                "connect": round(resource["connect"], 3),
+                "send": 0,
+                "wait": round(max(0, resource["wait"]), 3),
+                "receive": round(max(0, resource["receive"]), 3),
+            },
+            "_initiatorType": resource["type"],
+        })
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": "selenium-tests-employee-mgmt", "version": "1.0"},
+        "pages": [{
+            "id": "page_1",
+            "startedDateTime": _iso(state["time_origin"]),
+            "title": state.get("url", ""),
+            "pageTimings": {},
+        }],
+        "entries": entries,
+    }}
+
+
+def _slug(test_id):
+    return re.sub(r"[^\w.-]+", "_", test_id.split("::", 1)[-1])[:80]
+
+
+class ArtifactWriter:
+    """
+    Captures failure artifacts for one worker
+    - max_count: failures captured; later failures are not captured
+    - max_bytes: total size on disk; files that no longer fit are left out
+    Each file's size is reserved before anything is written (uncompressed,
+    or a generous per-entry estimate for the HAR) and corrected after the
+    write, so every link in the report points to a file that will exist
+    """
+
+    def __init__(self, directory, max_count=50, max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.captured = 0
+        self.skipped = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+
+    def capture(self, driver, test_id, phase):
+        """
+        Read the artifacts from the browser and queue them for writing
+        Returns [(name, path)] of the files to come; empty when over the count cap
+        """
+        with self._lock:
+            if self.captured >= self.max_count:
+                self.skipped += 1
+                return []
+            self.captured += 1
+            index = self.captured
+
+        try:
+            state = driver.execute_script(FAILURE_STATE_SCRIPT) or {}
+        except WebDriverException:
+            state = {}
+        try:
+            screenshot = driver.get_screenshot_as_png()
+        except WebDriverException:
+            screenshot = None
+
+        folder = os.path.join(self.directory, f"{index:03d}_{_slug(test_id)}_{phase}")
+        planned = []
+        if screenshot:
+            planned.append(("Screenshot", "screenshot.png", screenshot, len(screenshot)))
+        if state:
+            planned.append(("DOM", "dom.html.gz", state["dom"], len(state["dom"])))
+            planned.append(("Console", "console.json.gz", state["console"], len(json.dumps(state["console"]))))
+            planned.append(("Network (HAR)", "network.har.gz", state, 1024 * (len(state["resources"]) + 1)))
+
+        files = []
+        with self._lock:
+            for name, filename, data, size in planned:
+                if self.bytes + size <= self.max_bytes:
+                    self.bytes += size
+                    files.append((name, filename, data, size))
+        if not files:
+            return []
+        self._executor.submit(self._write, folder, files)
+        return [
+            (name, os.path.join(folder, filename)) for name, filename, _, _ in files
+        ]
+
+    def _write(self, folder, files):
+        os.makedirs(folder, exist_ok=True)
+        for name, filename, data, reserved in files:
+            if filename == "screenshot.png":
+                content = data  # PNG is already compressed
+            elif filename == "dom.html.gz":
+                content = gzip.compress(data.encode("utf-8"), compresslevel=6)
+            elif filename == "network.har.gz":
+                content = gzip.compress(json.dumps(build_har(data)).encode("utf-8"), compresslevel=6)
+            else:
+                content = gzip.compress(json.dumps(data, indent=1).encode("utf-8"), compresslevel=6)
+            with open(os.path.join(folder, filename), "wb") as f:
+                f.write(content)
+            with self._lock:
+                self.bytes += len(content) - reserved
+
+    def close(self):
+        """Wait for queued writes; returns (captured, skipped, bytes written)"""
+        self._executor.shutdown(wait=True)
+        return self.captured, self.skipped, self.bytes
@@ -0,0 +1,106 @@
+"""
+Scaling benchmark helpers for the employee list
+Measures how the homepage behaves as the table grows and compares the
+resulting curve against thresholds and a previous release
+"""
+
+import json
+import os
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import EXPLICIT_WAIT
+
+
+# Metrics recorded for every dataset size; all are "lower is better"
+METRICS = (
+    "time_to_heading",   # s from navigation start to the Employee Records heading
+    "time_to_table",     # s from navigation start until every row is rendered
+    "row_lookup",        # s to find one row by name (single in-page query)
+    "row_delete",        # s from clicking Delete until the row is gone
+    "payload_bytes",     # size of the list API response
+)
+
+
+class rows_rendered:
+    """The employee table shows at least `count` rows"""
+
+    def __init__(self, list_page, count):
+        self.list_page = list_page
+        self.count = count
+
+    def __call__(self, driver):
+        return self.list_page.row_count() >= self.count
+
+
+def measure_list_scaling(list_page, api, lookup_name, delete_name, timeout=EXPLICIT_WAIT):
+    """
+    Measure one point of the scaling curve against the data currently stored
+    `lookup_name` and `delete_name` must be existing rows; the latter is deleted
+    """
+    records, payload_bytes = api.list_with_size()
+    wait = WebDriverWait(list_page.driver, timeout)
+
+    start = time.perf_counter()
+    list_page.open(hard=True)  # Full load: bundle, API call and render
+    time_to_heading = time.perf_counter() - start
+    wait.until(rows_rendered(list_page, len(records)))
+    time_to_table = time.perf_counter() - start
+
+    start = time.perf_counter()
+    row = list_page.find(lookup_name)
+    row_lookup = time.perf_counter() - start
+    assert row is not None, f"Benchmark row '{lookup_name}' not rendered"
+
+    start = time.perf_counter()
+    list_page.click_delete(delete_name)
+    list_page.wait_for_row_gone(delete_name)
+    row_delete = time.perf_counter() - start
+
+    return {
+        "rows": len(records),
+        "time_to_heading": time_to_heading,
+        "time_to_table": time_to_table,
+        "row_lookup": row_lookup,
+        "row_delete": row_delete,
+        "payload_bytes": payload_bytes,
+    }
+
+
+def load_json(path, default=None):
+    if not path or not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_curve(curve, path, release):
+    """Write {size: metrics} for one release so releases can be compared"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"release": release, "recorded_at": time.time(), "curve": curve}, f, indent=2)
+
+
+def check_point(size, point, thresholds=None, baseline=None, tolerance=0.2):
+    """
+    Compare one measured point with its limits
+    - thresholds: {size: {metric: max}} absolute limits
+    - baseline: a curve saved by save_curve for an earlier release; a metric
+      fails when it is more than `tolerance` (20%) worse than the baseline
+    Returns a list of human-readable violations
+    """
+    violations = []
+    limits = (thresholds or {}).get(str(size), {})
+    previous = (baseline or {}).get("curve", {}).get(str(size), {})
+
+    for metric in METRICS:
+        value = point[metric]
+        if metric in limits and value > limits[metric]:
+            violations.append(f"{metric}={value:.3f} exceeds threshold {limits[metric]}")
+        if metric in previous and value > previous[metric] * (1 + tolerance):
+            violations.append(
+                f"{metric}={value:.3f} is more than {tolerance:.0%} worse than "
+                f"{baseline.get('release')} ({previous[metric]:.3f})"
+            )
+    return violations
@@ -0,0 +1,122 @@
+"""
+Pool of warm browser sessions reused across tests
+Sessions are reset between tests instead of being quit and relaunched
+"""
+
+import threading
+
+from utils.driver_factory import create_driver, apply_default_timeouts
+
+
+# Clears web storage for the origin the session is currently on
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class PooledSession:
+    """A pooled WebDriver session and how many tests it has served"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of WebDriver sessions
+    - size: maximum number of live sessions
+    - max_uses: tests served by one session before it is recycled
+    """
+
+    def __init__(self, factory=create_driver, size=1, max_uses=25):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._idle = []
+        self._live = 0
+        self._closed = False
+        self._lock = threading.Condition()
+
+    def acquire(self):
+        """Return an idle session, opening a new one while under capacity"""
+        with self._lock:
+            while not self._closed and not self._idle and self._live >= self.size:
+                self._lock.wait()
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if self._idle:
+                return self._idle.pop()
+            self._live += 1
+
+        try:
+            return PooledSession(self.factory())
+        except Exception:
+            with self._lock:
+                self._live -= 1
+                self._lock.notify()
+            raise
+
+    def release(self, session, discard=False):
+        """
+        Hand a session back to the pool
+        The session is reset for the next test, or quit when it crashed,
+        stopped responding or reached max_uses
+        """
+        session.uses += 1
+        keep = (
+            not discard
+            and not self._closed
+            and session.uses < self.max_uses
+            and self._reset(session.driver)
+        )
+
+        if not keep:
+            self._quit(session.driver)
+
+        with self._lock:
+            if keep:
+                self._idle.append(session)
+            else:
+                self._live -= 1
+            self._lock.notify()
+
+    def close(self):
+        """Quit every idle session; sessions still in use are quit on release"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._lock.notify_all()
+        for session in idle:
+            self._quit(session.driver)
+
+    def _reset(self, driver):
+        """Clear per-test browser state; returns False if the session is unusable"""
+        try:
+            # Drop any windows a test opened and go back to the first one
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per origin, so clear it before leaving the app page
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            apply_default_timeouts(driver)
+            return True
+        except Exception as e:
+            # Crashed or unresponsive sessions surface here as driver or
+            # connection errors; either way the session is not reusable
+            print(f"Recycling browser session after failed reset: {e}")
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Session is already gone
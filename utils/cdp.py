@@ -0,0 +1,22 @@
+"""
+Chrome DevTools Protocol helpers that work for local and Grid sessions
+"""
+
+# Grid forwards this vendor endpoint to the Chrome node
+CDP_EXECUTE_COMMAND = ("POST", "/session/$sessionId/goog/cdp/execute")
+
+
+def execute_cdp(driver, cmd, params=None):
+    """Run a DevTools Protocol command and return its result"""
+    params = params or {}
+    if hasattr(driver, "execute_cdp_cmd"):
+        return driver.execute_cdp_cmd(cmd, params)
+
+    # webdriver.Remote does not register the command, so add it on first use
+    driver.command_executor._commands.setdefault("executeCdpCommand", CDP_EXECUTE_COMMAND)
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+
+def add_script_on_new_document(driver, source):
+    """Inject a script into every document before the page's own scripts run"""
+    return execute_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": source})
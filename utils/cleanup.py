@@ -0,0 +1,137 @@
+"""
+Clean-up of employees created by the suite
+- ResourceRegistry tracks what one worker creates and deletes it in a single
+  bulk pass at the end of the session
+- The janitor removes leftovers of crashed or killed runs by name pattern
+
+Usage:
+    python -m utils.cleanup --dry-run          # list leftover test records
+    python -m utils.cleanup                    # delete them
+    python -m utils.cleanup --run-id 3fa2c1    # only one run's records
+"""
+
+import argparse
+import re
+import sys
+import threading
+
+from config.config import API_URL
+
+
+# Name prefixes used by the tests, benchmarks, load and soak runs
+TEST_NAME_PREFIXES = (
+    "Test Employee", "Edit Test", "Original Name", "Updated Name", "Delete Test", "To Delete",
+    "Alice", "Bob", "Charlie", "Bench", "Load", "Soak", "Contention",
+)
+
+# Run ids from utils.test_data.new_run_id() and pytest-xdist worker ids
+RUN_ID = r"[0-9a-f]{6}"
+WORKER_ID = r"(?:gw\d+|main)"
+
+
+def generated_name_pattern(run_id=None, worker_id=None):
+    """
+    Regex for the exact names the suite generates:
+    `<prefix> <run>-<worker>-<n>` (NameFactory; soak renames add ` edited`),
+    `Load <run>-<worker> <n>` (load runs), and without a `run_id` also
+    `<prefix> <unix time>` (older versions of the suite) and `Load <n>` (load CLI)
+    Runs with a custom TEST_RUN_ID are only matched when it is given as `run_id`
+    """
+    prefixes = "|".join(re.escape(prefix) for prefix in TEST_NAME_PREFIXES)
+    namespace = "{}-{}".format(
+        re.escape(run_id) if run_id else RUN_ID,
+        re.escape(worker_id) if worker_id else WORKER_ID
+    )
+    generated = rf"(?:{prefixes}) {namespace}-\d+(?: edited)?|Load {namespace} \d+"
+    if run_id:
+        return re.compile(rf"^(?:{generated})$")
+    return re.compile(rf"^(?:{generated}|(?:{prefixes}) \d{{9,}}|Load \d+)$")
+
+
+TEST_NAME_PATTERN = generated_name_pattern()
+
+
+def is_test_record(record, run_id=None):
+    """True for records named exactly like the suite names them (optionally for one run only)"""
+    pattern = generated_name_pattern(run_id) if run_id else TEST_NAME_PATTERN
+    return bool(pattern.match(record.get("name") or ""))
+
+
+class ResourceRegistry:
+    """
+    Ids of the employees one worker created
+    Once a browser has submitted the create form, the worker's name namespace
+    is also scanned, so a test that fails before tracking its record leaks
+    nothing; without UI creates no records are listed
+    """
+
+    def __init__(self, api, namespace=None):
+        self.api = api
+        self.namespace = namespace
+        self._ids = set()
+        self._scan = False
+        self._lock = threading.Lock()
+
+    def track(self, *record_ids):
+        with self._lock:
+            self._ids.update(record_id for record_id in record_ids if record_id)
+
+    def forget(self, *record_ids):
+        """Stop tracking records that were already deleted"""
+        with self._lock:
+            self._ids.difference_update(record_ids)
+
+    def expect_untracked(self):
+        """Records were created through the browser; look for them by namespace when purging"""
+        self._scan = True
+
+    def __len__(self):
+        return len(self._ids)
+
+    def purge(self):
+        """
+        Delete everything tracked plus, after UI creates, untracked records in
+        the namespace; returns the count (no API calls when nothing was created)
+        """
+        with self._lock:
+            record_ids, self._ids = self._ids, set()
+            scan, self._scan = self._scan, False
+        if scan and self.namespace:
+            run_id, _, worker_id = self.namespace.rpartition("-")
+            pattern = generated_name_pattern(run_id, worker_id)
+            record_ids |= {
+                record["_id"] for record in self.api.list()
+                if pattern.match(record.get("name") or "")
+            }
+        if not record_ids:
+            return 0
+        self.api.delete_many(sorted(record_ids), missing_ok=True)
+        return len(record_ids)
+
+
+def main(argv=None):
+    from utils.api_client import EmployeeApiClient
+
+    parser = argparse.ArgumentParser(description="Delete employee records left behind by test runs")
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--run-id", help="only delete records of this run (TEST_RUN_ID)")
+    parser.add_argument("--dry-run", action="store_true", help="list matching records without deleting")
+    args = parser.parse_args(argv)
+
+    api = EmployeeApiClient(args.api_url)
+    try:
+        leftovers = [record for record in api.list() if is_test_record(record, args.run_id)]
+        for record in leftovers:
+            print(f"{record['_id']}  {record['name']}")
+        if args.dry_run:
+            print(f"{len(leftovers)} test record(s) found")
+            return 0
+        api.delete_many([record["_id"] for record in leftovers], missing_ok=True)
+        print(f"Deleted {len(leftovers)} test record(s)")
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
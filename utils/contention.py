@@ -0,0 +1,360 @@
+"""
+Multi-browser contention scenarios
+Several browser sessions create, edit (`/edit/:id`) and delete the same
+records at the same moment, then every session re-reads its list until it
+shows the other sessions' changes. Reports how long changes take to show up
+elsewhere, updates the API silently dropped (lost updates), saved edits a
+concurrent save silently overwrote (overwritten) and rows that never caught
+up (stale rows).
+
+The app's list only fetches records when it is rendered, so observers reload
+it; propagation time is measured from the moment the change was saved.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from pages import EmployeeListPage, EmployeeFormPage
+from utils.driver_factory import create_driver
+from utils.grid import fetch_grid_status, free_slots
+from utils.tracing import percentile
+from utils.waits import wait_for_network_idle
+
+
+# Fields an edit changes; concurrent edits of one record alternate between them.
+# The form saves the whole record, so the last save of a round wins every field
+EDIT_FIELDS = ("name", "position")
+
+
+def session_capacity(remote_url, requested):
+    """Sessions that can run at once: free Grid slots (capped at `requested`), or `requested` locally"""
+    if not remote_url:
+        return requested
+    return min(requested, free_slots(fetch_grid_status(remote_url)))
+
+
+def operation_cycle(mix):
+    """`{create: 1, edit: 2}` -> ['create', 'edit', 'edit'] (the order sessions take turns in)"""
+    return [op for op, weight in mix.items() for _ in range(max(0, round(weight)))]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1)
+
+
+class ContentionRunner:
+    """
+    Runs rounds of simultaneous operations on shared records
+    - mix: operation weights (utils.load_generator.parse_mix)
+    - visibility_timeout: seconds a session may take to show another session's change
+    Each round, session i runs operation (round + i) of the mix cycle: every
+    edit targets the same "hot" record, deletes take other records and
+    creates add records that later rounds share
+    """
+
+    def __init__(self, app_url, factory, mix, visibility_timeout=10.0, poll_interval=0.25, driver_factory=create_driver):
+        self.app_url = app_url
+        self.factory = factory
+        self.operations = operation_cycle(mix)
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.driver_factory = driver_factory
+        self.drivers = []
+        self.pages = []
+        self.records = {}  # Shared records: id -> current name
+        self.changes = []
+        self.propagation = []
+        self.lost_updates = []
+        self.overwritten = []
+        self.stale_rows = []
+        self.errors = []
+        self._executor = None
+        self._lock = threading.Lock()
+
+    # ==================== Sessions and records ====================
+    def start(self, sessions):
+        """Open `sessions` browsers at once on a pool of as many threads"""
+        self._executor = ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="contention")
+        futures = [self._executor.submit(self.driver_factory) for _ in range(sessions)]
+        for future in futures:
+            try:
+                self.drivers.append(future.result())
+            except Exception:
+                self.close()
+                raise
+        self.pages = [
+            (EmployeeListPage(driver, self.app_url), EmployeeFormPage(driver, self.app_url))
+            for driver in self.drivers
+        ]
+        return self
+
+    def seed(self, count):
+        """Create the shared records through the API"""
+        for record in self.factory.create_many(count, prefix="Contention"):
+            self.records[record["_id"]] = record["name"]
+
+    def close(self):
+        registry = self.factory.registry
+        for driver in self.drivers:
+            if registry is not None and getattr(driver, "_ui_creates", 0):
+                registry.expect_untracked()
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.drivers = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _parallel(self, func, *args):
+        """Run func(session_index, *args) in every session; returns the results in session order"""
+        futures = [self._executor.submit(func, index, *args) for index in range(len(self.drivers))]
+        return [future.result() for future in futures]
+
+    # ==================== Rounds ====================
+    def plan(self, round_index):
+        """The change each session makes this round"""
+        ids = list(self.records)
+        hot = ids[round_index % len(ids)] if ids else None
+        deletable = [record_id for record_id in ids if record_id != hot]
+        plan = []
+        edits = 0
+        for session in range(len(self.drivers)):
+            op = self.operations[(round_index + session) % len(self.operations)]
+            if (op == "delete" and not deletable) or (op == "edit" and hot is None):
+                op = "create"
+            change = {"round": round_index, "session": session, "op": op}
+            if op == "create":
+                change["name"] = self.factory.names.unique("Contention")
+            elif op == "edit":
+                change["record_id"] = hot
+                change["field"] = EDIT_FIELDS[edits % len(EDIT_FIELDS)]
+                change["value"] = self.factory.names.unique("Contention" if change["field"] == "name" else "Role")
+                edits += 1
+            else:
+                change["record_id"] = deletable.pop(0)
+                change["name"] = self.records[change["record_id"]]
+            plan.append(change)
+        return plan
+
+    def run(self, rounds):
+        """Run `rounds` rounds: simultaneous changes, API check, then every session catches up"""
+        self._parallel(lambda index: self.pages[index][0].open(hard=True))
+        for round_index in range(rounds):
+            plan = self.plan(round_index)
+            barrier = threading.Barrier(len(plan))
+            self._parallel(self._apply, plan, barrier)
+            truth = {record["_id"]: record for record in self.factory.api.list()}
+            visible = self._verify(plan, truth)
+            self._parallel(self._observe, visible)
+            print(f"[CONTENTION] round {round_index}: " + ", ".join(change["op"] for change in plan))
+        return self.summary()
+
+    def _apply(self, session, plan, barrier):
+        change = plan[session]
+        list_page, form_page = self.pages[session]
+        try:
+            if change["op"] == "edit":
+                # Load the form first so concurrent edits start from the same record
+                form_page.open_edit(change["record_id"])
+                form_page.wait.until(lambda driver: form_page.values()["name"])
+            elif change["op"] == "delete":
+                list_page.open()
+                list_page.wait_for_row(change["name"])
+            else:
+                form_page.open_create()
+        except WebDriverException as e:
+            barrier.abort()
+            return self._failed(session, change, e)
+        try:
+            barrier.wait(timeout=self.visibility_timeout * 3)
+        except threading.BrokenBarrierError:
+            pass  # A session failed to get ready; the others go ahead
+
+        start = time.perf_counter()
+        try:
+            if change["op"] == "create":
+                form_page.fast_fill(change["name"], "Contention Tester", "Junior", submit=True)
+            elif change["op"] == "edit":
+                form_page.fast_fill(**{change["field"]: change["value"]}, submit=True)
+            else:
+                list_page.click_delete(change["name"])
+                list_page.wait_for_row_gone(change["name"])
+            change["saved"] = time.perf_counter()
+            change["op_ms"] = _ms(change["saved"] - start)
+        except WebDriverException as e:
+            return self._failed(session, change, e)
+        with self._lock:
+            self.changes.append(change)
+
+    def _failed(self, session, change, error):
+        change["error"] = f"{type(error).__name__}: {error.msg or 'timed out'}"
+        with self._lock:
+            self.changes.append(change)
+            self.errors.append(f"round {change['round']} session {session} {change['op']}: {change['error']}")
+
+    def _verify(self, plan, truth):
+        """
+        Compare the saved changes with the API's records
+        Returns the changes other sessions should now show; edits overwritten
+        by a later save of the same record are reported in `overwritten`
+        """
+        saved = [change for change in plan if "saved" in change]
+        visible = []
+        for change in saved:
+            if change["op"] == "create":
+                record = next((r for r in truth.values() if r["name"] == change["name"]), None)
+                if record is None:
+                    self.lost_updates.append({"round": change["round"], "op": "create", "name": change["name"]})
+                    continue
+                change["record_id"] = record["_id"]
+                self.factory.track(record["_id"])
+                visible.append(change)
+            elif change["op"] == "delete":
+                if change["record_id"] in truth:
+                    self.lost_updates.append({"round": change["round"], "op": "delete", "record_id": change["record_id"]})
+                    continue
+                if self.factory.registry is not None:
+                    self.factory.registry.forget(change["record_id"])
+                visible.append(change)
+
+        # Edits of the hot record, each compared on the field it wrote. The
+        # form saves the whole record, so a concurrent save can silently put
+        # back the old value of another session's field: every saved edit
+        # missing from the record is reported, and none surviving means the
+        # API dropped the writes altogether
+        edits = [change for change in saved if change["op"] == "edit"]
+        if edits:
+            record = truth.get(edits[0]["record_id"], {})
+            winners = []
+            for change in edits:
+                if record.get(change["field"]) == change["value"]:
+                    winners.append(change)
+                    continue
+                self.overwritten.append({
+                    "round": change["round"],
+                    "session": change["session"],
+                    "record_id": change["record_id"],
+                    "field": change["field"],
+                    "written": change["value"],
+                    "final": record.get(change["field"]),
+                })
+            if not winners:
+                self.lost_updates.append({
+                    "round": edits[0]["round"],
+                    "op": "edit",
+                    "record_id": edits[0]["record_id"],
+                    "written": [{change["field"]: change["value"]} for change in edits],
+                    "final": {field: record.get(field) for field in EDIT_FIELDS},
+                })
+            visible.extend(winners)
+
+        # Shared records for the next rounds, with their current names
+        self.records = {
+            record_id: truth[record_id]["name"]
+            for record_id in list(self.records) + [c["record_id"] for c in visible if c["op"] == "create"]
+            if record_id in truth
+        }
+        return visible
+
+    @staticmethod
+    def _shown(change, rows):
+        if change["op"] == "delete":
+            return change["record_id"] not in rows
+        row = rows.get(change["record_id"])
+        if row is None:
+            return False
+        if change["op"] == "create":
+            return row.name == change["name"]
+        return getattr(row, change["field"]) == change["value"]
+
+    def _observe(self, session, changes):
+        """Reload the list until it shows every other session's change, or time out"""
+        list_page = self.pages[session][0]
+        pending = [change for change in changes if change["session"] != session]
+        deadline = time.monotonic() + self.visibility_timeout
+        while pending:
+            list_page.open(hard=True)
+            wait_for_network_idle(list_page.driver)
+            rows = {row.id: row for row in list_page.snapshot().rows}
+            now = time.perf_counter()
+            for change in [change for change in pending if self._shown(change, rows)]:
+                pending.remove(change)
+                with self._lock:
+                    self.propagation.append(now - change["saved"])
+            if pending and time.monotonic() >= deadline:
+                break
+            if pending:
+                time.sleep(self.poll_interval)
+        with self._lock:
+            for change in pending:
+                self.stale_rows.append({
+                    "round": change["round"],
+                    "session": session,
+                    "op": change["op"],
+                    "record_id": change.get("record_id"),
+                    "expected": change.get("value", change.get("name")),
+                })
+
+    # ==================== Results ====================
+    def summary(self):
+        operations = {}
+        for op in sorted({change["op"] for change in self.changes}):
+            timings = [change["op_ms"] for change in self.changes if change["op"] == op and "op_ms" in change]
+            operations[op] = {
+                "count": sum(1 for change in self.changes if change["op"] == op),
+                "errors": sum(1 for change in self.changes if change["op"] == op and "error" in change),
+                "p50_ms": percentile(timings, 0.50) if timings else None,
+                "p95_ms": percentile(timings, 0.95) if timings else None,
+            }
+        propagation = {"samples": len(self.propagation)}
+        if self.propagation:
+            propagation.update({
+                "p50_ms": _ms(percentile(self.propagation, 0.50)),
+                "p95_ms": _ms(percentile(self.propagation, 0.95)),
+                "max_ms": _ms(max(self.propagation)),
+            })
+        return {
+            "sessions": len(self.pages),
+            "rounds": len({change["round"] for change in self.changes}),
+            "operations": operations,
+            "propagation": propagation,
+            "lost_updates": self.lost_updates,
+            "overwritten": self.overwritten,
+            "stale_rows": self.stale_rows,
+            "errors": self.errors,
+        }
+
+
+def format_summary(summary):
+    lines = [f"{summary['sessions']} sessions, {summary['rounds']} rounds"]
+    for op, stats in summary["operations"].items():
+        lines.append(
+            f"  {op:<8}{stats['count']:>5} ops{stats['errors']:>4} errors   "
+            f"p50 {stats['p50_ms']}ms  p95 {stats['p95_ms']}ms"
+        )
+    propagation = summary["propagation"]
+    if propagation["samples"]:
+        lines.append(
+            f"  Changes visible to other sessions after p50 {propagation['p50_ms']}ms, "
+            f"p95 {propagation['p95_ms']}ms, max {propagation['max_ms']}ms ({propagation['samples']} observations)"
+        )
+    lines.append(
+        f"  Lost updates: {len(summary['lost_updates'])}, overwritten edits: {len(summary['overwritten'])}, "
+        f"stale rows: {len(summary['stale_rows'])}"
+    )
+    for edit in summary["overwritten"]:
+        lines.append(
+            f"    round {edit['round']} session {edit['session']}: {edit['field']} {edit['written']!r} "
+            f"overwritten with {edit['final']!r}"
+        )
+    return "\n".join(lines)
+
+
+def write_summary(path, summary):
+    with open(path, "w") as f:
+        json.dump(summary, f, indent=2)
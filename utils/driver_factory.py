@@ -0,0 +1,123 @@
+"""
+WebDriver factory shared by the pytest fixtures and the standalone runners
+Builds Chrome options and opens a local or Selenium Grid session
+"""
+
+import os
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from config.config import (
+    BASE_URL,
+    API_URL,
+    HEADLESS,
+    WINDOW_SIZE,
+    IMPLICIT_WAIT,
+    PERF_METRICS,
+    LOCAL_APP_HOST,
+    LEAN_PROFILE,
+    LEAN_BLOCKED_URLS,
+    LEAN_ALLOWED_HOSTS,
+    LEAN_PROFILE_TEMPLATE,
+    DIRECT_NODE_ROUTING,
+    FAILURE_ARTIFACTS
+)
+from utils.artifacts import install_console_recorder
+from utils.lean_profile import (
+    add_lean_arguments,
+    allowed_hosts_from_urls,
+    block_urls,
+    build_profile_template,
+    copy_profile,
+    remove_profile_on_quit
+)
+from utils.node_routing import route_to_node
+from utils.perf_metrics import install_perf_observers
+from utils.timeouts import TIMEOUTS
+from utils.waits import install_network_tracker
+
+
+def build_chrome_options(lean=False, user_data_dir=None):
+    """Chrome options used for every session (plus the lean switches in lean mode)"""
+    chrome_options = Options()
+    if HEADLESS:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument(f'--window-size={WINDOW_SIZE}')
+    if lean:
+        add_lean_arguments(chrome_options, LEAN_ALLOWED_HOSTS or allowed_hosts_from_urls(BASE_URL, API_URL, f"http://{LOCAL_APP_HOST}"))
+    if user_data_dir:
+        chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+    return chrome_options
+
+
+def apply_default_timeouts(driver):
+    """Restore the suite-wide timeouts (as adapted so far) on a (possibly reused) session"""
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    driver.set_page_load_timeout(TIMEOUTS.page_load(driver))
+
+
+def create_driver(lean=None):
+    """
+    Open a new Chrome session
+    Uses Selenium Grid when SELENIUM_REMOTE_URL is set, local Chrome otherwise
+    Grid readiness is checked once per test run (utils.grid.wait_for_grid), so
+    session creation is not retried here
+    In lean mode (default: LEAN_PROFILE) local sessions start from a copy of
+    the pre-warmed profile template when one exists
+    With DIRECT_NODE_ROUTING, Grid sessions send their commands straight to
+    the node after creation
+    """
+    if lean is None:
+        lean = LEAN_PROFILE
+
+    # Check if we should use Selenium Grid (remote)
+    selenium_remote_url = os.getenv('SELENIUM_REMOTE_URL')
+
+    if selenium_remote_url:
+        driver = webdriver.Remote(
+            command_executor=selenium_remote_url,
+            options=build_chrome_options(lean)
+        )
+        if DIRECT_NODE_ROUTING:
+            route_to_node(driver, selenium_remote_url)
+    else:
+        # Fallback to local Chrome (for local testing)
+        profile_dir = None
+        if lean and os.path.isdir(LEAN_PROFILE_TEMPLATE):
+            profile_dir = copy_profile(LEAN_PROFILE_TEMPLATE)
+        driver = webdriver.Chrome(options=build_chrome_options(lean, profile_dir))
+        if profile_dir:
+            remove_profile_on_quit(driver, profile_dir)
+
+    apply_default_timeouts(driver)
+    if lean:
+        block_urls(driver, LEAN_BLOCKED_URLS)
+    install_network_tracker(driver)
+    if FAILURE_ARTIFACTS:
+        install_console_recorder(driver)
+    if PERF_METRICS:
+        install_perf_observers(driver)
+    return driver
+
+
+def prepare_profile_template(warm_url, template=LEAN_PROFILE_TEMPLATE):
+    """
+    Build the lean profile template once by loading `warm_url` in a local
+    Chrome; no-op on Selenium Grid, where the profile lives on the node
+    """
+    if os.getenv('SELENIUM_REMOTE_URL'):
+        return False
+
+    def warm_up(user_data_dir):
+        driver = webdriver.Chrome(options=build_chrome_options(True, user_data_dir))
+        try:
+            apply_default_timeouts(driver)
+            block_urls(driver, LEAN_BLOCKED_URLS)
+            driver.get(warm_url)
+        finally:
+            driver.quit()
+
+    return build_profile_template(template, warm_up)
@@ -0,0 +1,124 @@
+"""
+Per-test duration history and longest-first scheduling
+Keeps a running mean and variance of every test's duration across runs and
+uses them to order tests longest-first, split them between workers (LPT) and
+estimate the build time before the run starts
+"""
+
+import heapq
+import json
+import math
+import os
+import statistics
+
+
+class DurationHistory:
+    """
+    Running mean/variance per test id, stored as JSON
+    The first `window` runs are weighted equally; after that the statistics
+    become an exponentially weighted average, so they follow the app's speed
+    """
+
+    def __init__(self, path, window=20, default=5.0):
+        self.path = path
+        self.window = max(1, window)
+        self.default = default
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.tests = json.load(f).get("tests", {})
+
+    def _entry(self, test_id):
+        return self.tests.setdefault(test_id, {"runs": 0, "mean": 0.0, "variance": 0.0})
+
+    def known(self, test_id):
+        return self.tests.get(test_id, {}).get("runs", 0) > 0
+
+    def label(self, test_id, marker):
+        """Remember the opt-in marker of a test (also when it was skipped)"""
+        self._entry(test_id)["marker"] = marker
+
+    def marker(self, test_id):
+        return self.tests.get(test_id, {}).get("marker")
+
+    def record(self, test_id, seconds):
+        entry = self._entry(test_id)
+        entry["runs"] += 1
+        alpha = 1.0 / min(entry["runs"], self.window)
+        diff = seconds - entry["mean"]
+        increment = alpha * diff
+        entry["mean"] += increment
+        entry["variance"] = (1 - alpha) * (entry["variance"] + diff * increment)
+        entry["last"] = seconds
+
+    def expected(self, test_id):
+        """(mean, variance) for a test; unknown tests get the median of known means"""
+        if self.known(test_id):
+            entry = self.tests[test_id]
+            return entry["mean"], entry["variance"]
+        means = [entry["mean"] for entry in self.tests.values() if entry["runs"]]
+        return (statistics.median(means) if means else self.default), 0.0
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"window": self.window, "tests": self.tests}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)  # Readers never see a half-written file
+
+
+def longest_first(test_ids, history):
+    """Test ids ordered by expected duration, longest first (stable for ties)"""
+    return sorted(test_ids, key=lambda test_id: -history.expected(test_id)[0])
+
+
+def assign_workers(test_ids, history, workers):
+    """
+    Longest-processing-time-first assignment: each test, longest first, goes
+    to the worker with the least expected work so far
+    Returns {test_id: worker_index} and the expected load per worker
+    """
+    workers = max(1, workers)
+    loads = [(0.0, index) for index in range(workers)]
+    assignment = {}
+    for test_id in longest_first(test_ids, history):
+        load, index = heapq.heappop(loads)
+        assignment[test_id] = index
+        heapq.heappush(loads, (load + history.expected(test_id)[0], index))
+    per_worker = [0.0] * workers
+    for load, index in loads:
+        per_worker[index] = load
+    return assignment, per_worker
+
+
+def estimate_build(test_ids, history, workers):
+    """
+    Expected wall-clock time of the tests on `workers` workers
+    The busiest worker decides the build time; its spread comes from the
+    variances of the tests assigned to it
+    """
+    assignment, per_worker = assign_workers(test_ids, history, workers)
+    busiest = max(range(len(per_worker)), key=per_worker.__getitem__)
+    variance = sum(
+        history.expected(test_id)[1]
+        for test_id, index in assignment.items()
+        if index == busiest
+    )
+    return {
+        "tests": len(test_ids),
+        "unknown": sum(1 for test_id in test_ids if not history.known(test_id)),
+        "workers": len(per_worker),
+        "serial_s": round(sum(history.expected(test_id)[0] for test_id in test_ids), 1),
+        "estimate_s": round(per_worker[busiest], 1),
+        "stddev_s": round(math.sqrt(variance), 1),
+    }
+
+
+def format_estimate(estimate):
+    unknown = f", {estimate['unknown']} without history" if estimate["unknown"] else ""
+    return (
+        f"Estimated test time: {estimate['estimate_s']:.0f}s ± {estimate['stddev_s']:.0f}s on "
+        f"{estimate['workers']} worker(s) ({estimate['tests']} tests, {estimate['serial_s']:.0f}s serial{unknown})"
+    )
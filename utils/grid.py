@@ -0,0 +1,90 @@
+"""
+Selenium Grid helpers
+Reads the hub /status endpoint to find out whether the Grid is ready and how
+many browser slots are free
+"""
+
+import json
+import random
+import time
+
+import urllib3
+from urllib3.exceptions import HTTPError, LocationValueError
+
+
+class GridConfigurationError(Exception):
+    """The Grid URL or response is wrong in a way retrying cannot fix"""
+
+
+class GridNotReadyError(Exception):
+    """The Grid did not report ready nodes before the timeout"""
+
+
+def grid_base_url(remote_url):
+    """Hub root URL for a WebDriver endpoint such as http://hub:4444/wd/hub"""
+    base = remote_url.rstrip('/')
+    if base.endswith('/wd/hub'):
+        base = base[:-len('/wd/hub')]
+    return base
+
+
+def fetch_grid_status(remote_url, timeout=5):
+    """Return the `value` object of the hub's /status response"""
+    url = f"{grid_base_url(remote_url)}/status"
+    try:
+        response = urllib3.PoolManager().request("GET", url, timeout=timeout, retries=False)
+    except LocationValueError as e:
+        raise GridConfigurationError(f"Invalid Selenium Grid URL {remote_url!r}: {e}")
+
+    if 400 <= response.status < 500:
+        raise GridConfigurationError(f"{url} returned {response.status}; check SELENIUM_REMOTE_URL")
+    if response.status != 200:
+        raise HTTPError(f"{url} returned {response.status}")
+
+    try:
+        return json.loads(response.data)["value"]
+    except (ValueError, KeyError):
+        raise GridConfigurationError(f"{url} is not a Selenium Grid status endpoint")
+
+
+def wait_for_grid(remote_url, timeout=120, base_delay=0.5, max_delay=8):
+    """
+    Poll /status until the Grid reports that its nodes are ready
+    Retries connection errors and 5xx answers with exponential backoff and
+    full jitter; configuration errors are raised immediately.
+    Returns the number of seconds spent waiting.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    attempt = 0
+    reason = "no response yet"
+
+    while True:
+        try:
+            status = fetch_grid_status(remote_url)
+            if status.get("ready"):
+                return time.monotonic() - start
+            reason = status.get("message") or "nodes not ready"
+        except HTTPError as e:
+            reason = str(e)
+
+        delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+        if time.monotonic() + delay > deadline:
+            raise GridNotReadyError(
+                f"Selenium Grid at {remote_url} not ready within {timeout}s: {reason}"
+            )
+        attempt += 1
+        time.sleep(delay)
+
+
+def free_slots(status, browser_name="chrome"):
+    """Number of idle slots for `browser_name` on nodes that are UP"""
+    free = 0
+    for node in status.get("nodes", []):
+        if node.get("availability") != "UP":
+            continue
+        for slot in node.get("slots", []):
+            stereotype = slot.get("stereotype", {})
+            if slot.get("session") is None and stereotype.get("browserName") == browser_name:
+                free += 1
+    return free
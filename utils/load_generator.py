@@ -0,0 +1,256 @@
+"""
+Asyncio load generator for the Employee Management API
+Replays the create, edit and delete flows of the Selenium suite (test_05,
+test_08, test_10) as the HTTP calls the app makes, over pooled keep-alive
+connections, and reports latency percentiles and throughput per endpoint
+
+Usage:
+    python -m utils.load_generator --duration 60 --concurrency 20 --rate 50
+    python -m utils.load_generator --stub --duration 5   # in-process stand-in
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+
+try:
+    import aiohttp
+except ImportError:  # Only the load mode needs it
+    aiohttp = None
+
+from config.config import API_URL, API_RECORDS_PATH
+from utils.tracing import percentile
+
+
+# Operation name -> default weight in the mix
+DEFAULT_MIX = {"create": 3, "edit": 2, "delete": 1}
+
+
+def parse_mix(text):
+    """Parse `create=3,edit=2,delete=1` into a weights dict"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation '{name}' (expected one of {', '.join(DEFAULT_MIX)})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+class LoadStats:
+    """Latencies and errors per endpoint (`METHOD /path` with ids templated)"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.scenarios = defaultdict(int)
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, endpoint, seconds, ok):
+        self.latencies[endpoint].append(seconds)
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def summary(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        endpoints = {}
+        for endpoint, latencies in sorted(self.latencies.items()):
+            endpoints[endpoint] = {
+                "requests": len(latencies),
+                "errors": self.errors[endpoint],
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+            }
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "scenarios": dict(self.scenarios),
+            "endpoints": endpoints,
+        }
+
+
+class EmployeeLoadScenarios:
+    """The suite's CRUD flows expressed as API calls"""
+
+    def __init__(self, session, api_url, stats, name_prefix="Load"):
+        self.session = session
+        self.records_url = f"{api_url.rstrip('/')}{API_RECORDS_PATH}"
+        self.stats = stats
+        self.name_prefix = name_prefix
+        self.created = []  # Ids available for edit/delete
+        self._counter = 0
+
+    async def _call(self, method, endpoint, url, payload=None):
+        start = time.perf_counter()
+        ok = False
+        try:
+            async with self.session.request(method, url, json=payload) as response:
+                body = await response.read()
+                ok = response.status < 400
+                return json.loads(body) if ok and body else None
+        finally:
+            self.stats.record(f"{method} {endpoint}", time.perf_counter() - start, ok)
+
+    async def _create_record(self):
+        self._counter += 1
+        result = await self._call("POST", API_RECORDS_PATH, self.records_url, {
+            "name": f"{self.name_prefix} {self._counter}",
+            "position": "Load Tester",
+            "level": random.choice(("Intern", "Junior", "Senior")),
+        })
+        record_id = (result or {}).get("insertedId") or (result or {}).get("_id")
+        return record_id
+
+    async def _existing_record(self):
+        """Take an id created earlier, or create one like the tests do"""
+        if self.created:
+            return self.created.pop(random.randrange(len(self.created)))
+        return await self._create_record()
+
+    # ==================== Scenarios ====================
+    async def create(self):
+        """test_05: submit the form, then the homepage reloads the list"""
+        record_id = await self._create_record()
+        await self._call("GET", API_RECORDS_PATH, self.records_url)
+        if record_id:
+            self.created.append(record_id)
+
+    async def edit(self):
+        """test_08: list, open /edit/:id, save changes, list again"""
+        record_id = await self._existing_record()
+        if not record_id:
+            return
+        item_url = f"{self.records_url}/{record_id}"
+        await self._call("GET", API_RECORDS_PATH, self.records_url)
+        await self._call("GET", f"{API_RECORDS_PATH}/:id", item_url)
+        await self._call("PATCH", f"{API_RECORDS_PATH}/:id", item_url, {"position": "Edited"})
+        await self._call("GET", API_RECORDS_PATH, self.records_url)
+        self.created.append(record_id)
+
+    async def delete(self):
+        """test_10: list, then delete one row"""
+        record_id = await self._existing_record()
+        if not record_id:
+            return
+        await self._call("GET", API_RECORDS_PATH, self.records_url)
+        await self._call("DELETE", f"{API_RECORDS_PATH}/:id", f"{self.records_url}/{record_id}")
+
+    async def cleanup(self):
+        """Delete whatever the run created and did not delete itself"""
+        ids, self.created = self.created, []
+
+        async def delete(record_id):
+            async with self.session.delete(f"{self.records_url}/{record_id}") as response:
+                await response.read()
+
+        await asyncio.gather(*(delete(record_id) for record_id in ids), return_exceptions=True)
+
+
+async def run_load(api_url=API_URL, duration=30, concurrency=10, rate=None, mix=None, name_prefix="Load"):
+    """
+    Drive the scenarios for `duration` seconds
+    - concurrency: maximum scenarios in flight (and connection pool size)
+    - rate: scenario arrivals per second (Poisson); None runs a closed loop
+      where each of `concurrency` users starts a new scenario immediately
+    - mix: {operation: weight}
+    Returns LoadStats.summary()
+    """
+    if aiohttp is None:
+        raise RuntimeError("The load generator needs aiohttp: pip install -r requirements.txt")
+
+    mix = mix or DEFAULT_MIX
+    operations, weights = zip(*mix.items())
+    stats = LoadStats()
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        scenarios = EmployeeLoadScenarios(session, api_url, stats, name_prefix)
+        deadline = time.perf_counter() + duration
+
+        async def run_one():
+            operation = random.choices(operations, weights)[0]
+            stats.scenarios[operation] += 1
+            try:
+                await getattr(scenarios, operation)()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass  # Already counted as an endpoint error
+
+        if rate is None:
+            async def user():
+                while time.perf_counter() < deadline:
+                    await run_one()
+            await asyncio.gather(*(user() for _ in range(concurrency)))
+        else:
+            in_flight = asyncio.Semaphore(concurrency)
+            tasks = set()
+
+            async def limited():
+                async with in_flight:
+                    await run_one()
+
+            while time.perf_counter() < deadline:
+                task = asyncio.ensure_future(limited())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await asyncio.sleep(random.expovariate(rate))
+            await asyncio.gather(*tasks)
+
+        stats.finished = time.perf_counter()
+        await scenarios.cleanup()
+
+    return stats.summary()
+
+
+def format_summary(summary):
+    lines = [
+        f"Elapsed: {summary['elapsed_s']}s  Scenarios: {summary['scenarios']}",
+        f"{'Endpoint':<28}{'Requests':>10}{'Errors':>8}{'RPS':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}",
+    ]
+    for endpoint, stats in summary["endpoints"].items():
+        lines.append(
+            f"{endpoint:<28}{stats['requests']:>10}{stats['errors']:>8}{stats['throughput_rps']:>9}"
+            f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Employee API load generator")
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--duration", type=float, default=30, help="seconds to generate load")
+    parser.add_argument("--concurrency", type=int, default=10, help="maximum scenarios in flight")
+    parser.add_argument("--rate", type=float, default=None, help="scenario arrivals per second (default: closed loop)")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="e.g. create=3,edit=2,delete=1")
+    parser.add_argument("--stub", action="store_true", help="run against an in-process stand-in API")
+    parser.add_argument("--json", dest="json_path", help="also write the summary to this file")
+    args = parser.parse_args(argv)
+
+    stub = None
+    api_url = args.api_url
+    if args.stub:
+        from utils.stub_server import StubServer
+        stub = StubServer().start()
+        api_url = stub.url
+
+    try:
+        summary = asyncio.run(run_load(api_url, args.duration, args.concurrency, args.rate, args.mix))
+    finally:
+        if stub:
+            stub.stop()
+
+    print(format_summary(summary))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 1 if any(s["errors"] for s in summary["endpoints"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
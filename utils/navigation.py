@@ -0,0 +1,106 @@
+"""
+In-app (client-side) navigation for the single-page app
+When the app is already loaded, routes are changed the way a user would
+(clicking the in-app link) or through the history API the router listens to,
+instead of reloading and re-parsing the whole bundle with driver.get
+"""
+
+from contextlib import nullcontext
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import NAVIGATION_MODE, APP_ROOT_SELECTOR
+from utils.timeouts import TIMEOUTS
+
+
+# arguments[0]: {origin, root}; true when the app is mounted on this page
+APP_LOADED_SCRIPT = """
+var app = arguments[0];
+var root = document.querySelector(app.root);
+return location.origin === app.origin
+    && document.readyState === 'complete'
+    && !!root && root.children.length > 0;
+"""
+
+# Changes the route without a reload and reports after the next frame has
+# been painted. arguments[0]: path, arguments[1]: prefer in-app links
+SOFT_NAVIGATE_SCRIPT = """
+var path = arguments[0], preferLink = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+var mode = 'history';
+var link = null;
+if (preferLink) {
+    var links = document.querySelectorAll('a[href]');
+    for (var i = 0; i < links.length; i++) {
+        if (links[i].origin === location.origin && links[i].pathname + links[i].search === path) {
+            link = links[i];
+            break;
+        }
+    }
+}
+if (link) {
+    link.click();
+    mode = 'link';
+} else {
+    history.pushState({}, '', path);
+    window.dispatchEvent(new PopStateEvent('popstate', {state: history.state}));
+}
+requestAnimationFrame(function () {
+    requestAnimationFrame(function () {
+        done({mode: mode, path: location.pathname + location.search, ms: performance.now() - start});
+    });
+});
+"""
+
+
+def _path(url):
+    parsed = urlparse(url)
+    return (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+
+
+def navigate(driver, base_url, path="/", hard=False, mode=None):
+    """
+    Show `path` of the app and return the mode used: `link`, `history` or `hard`
+    - hard: always reload with driver.get (e.g. to see fresh server data)
+    - mode: `auto` (default: NAVIGATION_MODE) changes routes in the client
+      when the app is already loaded, `hard` always reloads
+    Falls back to a hard load on a cold start (about:blank, another origin),
+    for the current route (re-rendering it would not refetch its data) and
+    when the router did not pick up the change
+    """
+    mode = mode or NAVIGATION_MODE
+    url = f"{base_url.rstrip('/')}{path}"
+    target = _path(url)
+    recorder = getattr(driver, "_perf_recorder", None)
+
+    if not hard and mode != "hard" and _app_loaded(driver, base_url) and _path(driver.current_url) != target:
+        if recorder is not None:
+            recorder.collect()  # The page being left, as for a hard navigation
+        tracer = getattr(driver, "_command_tracer", None)
+        phase = tracer.phase("navigation") if tracer else nullcontext()
+        with phase:
+            try:
+                result = driver.execute_async_script(SOFT_NAVIGATE_SCRIPT, target, True)
+            except WebDriverException:
+                result = None
+        if result and result["path"] == target:
+            if recorder is not None:
+                recorder.soft_navigation(result["mode"], result["ms"], urlparse(target).path)
+            return result["mode"]
+
+    driver.get(url)
+    TIMEOUTS.observe_page_load(driver)
+    return "hard"
+
+
+def _app_loaded(driver, base_url):
+    parsed = urlparse(base_url)
+    try:
+        return driver.execute_script(
+            APP_LOADED_SCRIPT,
+            {"origin": f"{parsed.scheme}://{parsed.netloc}", "root": APP_ROOT_SELECTOR}
+        )
+    except WebDriverException:
+        return False
@@ -0,0 +1,134 @@
+"""
+Direct-to-node WebDriver routing for Selenium Grid
+Once the hub has created a session, its commands are sent straight to the
+node that owns it (one network hop instead of two) over a keep-alive
+connection. The hub remains the fallback when the node cannot be reached.
+"""
+
+import json
+import statistics
+import time
+from urllib.parse import urlparse
+
+from urllib3.exceptions import ConnectTimeoutError, HTTPError, MaxRetryError, NewConnectionError
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from utils.grid import GridConfigurationError, fetch_grid_status
+
+
+# The hub must see the session end, so these always go through it
+HUB_ONLY_COMMANDS = {Command.QUIT}
+
+
+def find_node_uri(status, session_id):
+    """URI of the Grid node running `session_id` (from the hub's /status), or None"""
+    for node in status.get("nodes", []):
+        for slot in node.get("slots", []):
+            if (slot.get("session") or {}).get("sessionId") == session_id:
+                return node.get("uri")
+    return None
+
+
+def _never_sent(error):
+    """True when the connection failed before the request reached the node"""
+    if isinstance(error, MaxRetryError):
+        error = error.reason
+    return isinstance(error, (NewConnectionError, ConnectTimeoutError, ConnectionRefusedError))
+
+
+class NodeRoutedConnection:
+    """
+    Command executor that talks to the node directly and to the hub otherwise
+    After the first connection error every later command goes through the hub;
+    the failed command is resent only when it never reached the node
+    """
+
+    def __init__(self, hub, node_uri):
+        self.hub = hub
+        self.node_uri = node_uri
+        self.node = RemoteConnection(node_uri, keep_alive=True, ignore_proxy=True)
+        self.node._commands = hub._commands  # Shares vendor commands (e.g. CDP) added later
+        self.direct = True
+
+    def __getattr__(self, name):
+        return getattr(self.hub, name)
+
+    @property
+    def _commands(self):
+        return self.hub._commands
+
+    def execute(self, command, params):
+        if self.direct and command not in HUB_ONLY_COMMANDS:
+            try:
+                return self.node.execute(command, dict(params))  # execute() pops sessionId
+            except (HTTPError, OSError) as e:
+                self.direct = False
+                print(f"Grid node {self.node_uri} unreachable, sending commands through the hub: {e}")
+                if not _never_sent(e):
+                    raise
+        return self.hub.execute(command, params)
+
+    def close(self):
+        self.node.close()
+        self.hub.close()
+
+
+def route_to_node(driver, remote_url):
+    """
+    Send the session's later commands straight to its node
+    Returns the node URI, or None when the session stays on the hub (node not
+    found, a standalone server, or the node not reachable from here)
+    """
+    try:
+        node_uri = find_node_uri(fetch_grid_status(remote_url), driver.session_id)
+    except (HTTPError, GridConfigurationError):
+        return None
+    if not node_uri or urlparse(node_uri).netloc == urlparse(remote_url).netloc:
+        return None
+
+    connection = NodeRoutedConnection(driver.command_executor, node_uri)
+    try:
+        driver.error_handler.check_response(
+            connection.node.execute(Command.GET_CURRENT_URL, {"sessionId": driver.session_id})
+        )
+    except Exception:
+        connection.node.close()
+        return None
+    driver.command_executor = connection
+    return node_uri
+
+
+# ==================== Latency comparison ====================
+def median_command_ms(connection, session_id, runs):
+    """Median round trip of a cheap command (current URL) in ms"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        connection.execute(Command.GET_CURRENT_URL, {"sessionId": session_id})
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def compare_routes(driver, runs=20):
+    """Command latency through the hub and directly to the node of a routed session"""
+    connection = driver.command_executor
+    result = {"node": connection.node_uri, "runs": runs}
+    result["hub_ms"] = round(median_command_ms(connection.hub, driver.session_id, runs), 2)
+    result["node_ms"] = round(median_command_ms(connection.node, driver.session_id, runs), 2)
+    result["saved_ms"] = round(result["hub_ms"] - result["node_ms"], 2)
+    result["saved_pct"] = round(100 * result["saved_ms"] / result["hub_ms"], 1) if result["hub_ms"] else 0.0
+    return result
+
+
+def format_routing(result):
+    return (
+        f"Direct node routing: {result['node_ms']:.1f}ms per command to {result['node']} "
+        f"instead of {result['hub_ms']:.1f}ms through the hub (saved {result['saved_ms']:.1f}ms, "
+        f"{result['saved_pct']:.0f}%, median of {result['runs']})"
+    )
+
+
+def write_routing(path, result):
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
@@ -0,0 +1,135 @@
+"""
+Page snapshots for read-only structural checks
+One execute_script call captures the text, visibility, attributes and form
+state of the elements behind a set of locators (not the whole DOM). The
+snapshot answers find_element/is_displayed/get_attribute like the live page,
+so several tests can assert against one page load.
+"""
+
+from selenium.common.exceptions import NoSuchElementException
+
+
+# arguments[0]: [[by, value], ...] using Selenium's By strings
+CAPTURE_SCRIPT = """
+var locators = arguments[0];
+function toArray(list) { return Array.prototype.slice.call(list); }
+function find(by, value) {
+    switch (by) {
+        case 'id':
+            var element = document.getElementById(value);
+            return element ? [element] : [];
+        case 'css selector': return toArray(document.querySelectorAll(value));
+        case 'tag name': return toArray(document.getElementsByTagName(value));
+        case 'name': return toArray(document.getElementsByName(value));
+        case 'class name': return toArray(document.getElementsByClassName(value));
+        case 'link text':
+        case 'partial link text':
+            return toArray(document.querySelectorAll('a')).filter(function (a) {
+                var text = a.innerText.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        case 'xpath':
+            var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+            return nodes;
+    }
+    return [];
+}
+function describe(element) {
+    var style = window.getComputedStyle(element);
+    var attributes = {};
+    toArray(element.attributes).forEach(function (attribute) { attributes[attribute.name] = attribute.value; });
+    return {
+        tag_name: element.tagName.toLowerCase(),
+        text: (element.innerText || '').trim(),
+        displayed: element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+        enabled: !element.disabled,
+        selected: !!(element.checked || element.selected),
+        value: element.value === undefined ? null : element.value,
+        attributes: attributes
+    };
+}
+return {
+    url: location.href,
+    title: document.title,
+    elements: locators.map(function (locator) { return find(locator[0], locator[1]).map(describe); })
+};
+"""
+
+
+class ElementSnapshot:
+    """An element as captured; mirrors the read-only WebElement API"""
+
+    def __init__(self, tag_name, text, displayed, enabled, selected, value, attributes):
+        self.tag_name = tag_name
+        self.text = text
+        self._displayed = displayed
+        self._enabled = enabled
+        self._selected = selected
+        self._value = value
+        self._attributes = attributes
+
+    def is_displayed(self):
+        return self._displayed
+
+    def is_enabled(self):
+        return self._enabled
+
+    def is_selected(self):
+        return self._selected
+
+    def get_attribute(self, name):
+        """Like WebElement.get_attribute: the current value for `value`, else the attribute"""
+        if name == "value":
+            return self._value
+        return self._attributes.get(name)
+
+
+class PageSnapshot:
+    """URL, title and the captured elements of one page load"""
+
+    def __init__(self, url, title, elements):
+        self.current_url = url
+        self.title = title
+        self._elements = elements
+
+    def find_elements(self, by, value):
+        if (by, value) not in self._elements:
+            raise KeyError(f"{by}={value!r} was not captured in this snapshot")
+        return self._elements[(by, value)]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element {by}={value!r} in the snapshot of {self.current_url}")
+        return elements[0]
+
+
+def capture_page(driver, locators):
+    """Snapshot the current page with the elements behind `locators`, in one round trip"""
+    locators = [tuple(locator) for locator in locators]
+    result = driver.execute_script(CAPTURE_SCRIPT, [list(locator) for locator in locators])
+    elements = {
+        locator: [ElementSnapshot(**element) for element in found]
+        for locator, found in zip(locators, result["elements"])
+    }
+    return PageSnapshot(result["url"], result["title"], elements)
+
+
+class PageSnapshots:
+    """
+    Snapshots shared by the tests of a class; the first test to ask loads the page
+    Kept per throttling profile, so each profile of a THROTTLE_MATRIX run
+    checks a page loaded under that profile
+    """
+
+    def __init__(self):
+        self._pages = {}
+
+    def get(self, page, capture, profile=None):
+        """The snapshot of `page` under `profile`, taken with `capture()` on first use"""
+        key = (profile, page)
+        if key not in self._pages:
+            self._pages[key] = capture()
+        return self._pages[key]
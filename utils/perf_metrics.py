@@ -0,0 +1,261 @@
+"""
+Front-end performance metrics for every page the suite loads
+- Navigation Timing, paint timings (FCP/LCP), long tasks and transferred
+  resources from the Performance APIs
+- Chrome's DevTools Protocol Performance.getMetrics
+Samples are grouped per route and checked against budgets and a baseline
+"""
+
+import json
+import re
+import statistics
+import time
+from contextlib import nullcontext
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from utils.cdp import add_script_on_new_document, execute_cdp
+from utils.throttling import DEFAULT_PROFILE
+
+
+# Records LCP and long tasks from the start of every document
+PERF_OBSERVER_SCRIPT = """
+(function () {
+    if (window.__seleniumPerf || !window.PerformanceObserver) { return; }
+    var state = window.__seleniumPerf = { lcp: null, longTasks: 0, longTaskMs: 0 };
+    try {
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (entry) { state.lcp = entry.startTime; });
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (entry) {
+                state.longTasks += 1;
+                state.longTaskMs += entry.duration;
+            });
+        }).observe({ type: 'longtask', buffered: true });
+    } catch (e) {}
+})();
+"""
+
+COLLECT_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+var paints = {};
+performance.getEntriesByType('paint').forEach(function (p) { paints[p.name] = p.startTime; });
+var resources = performance.getEntriesByType('resource');
+var transfer = nav.transferSize || 0;
+resources.forEach(function (r) { transfer += r.transferSize || 0; });
+var state = window.__seleniumPerf || {};
+return {
+    path: location.pathname,
+    document_path: new URL(nav.name).pathname,
+    ttfb_ms: nav.responseStart - nav.startTime,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+    load_ms: nav.loadEventEnd,
+    fcp_ms: paints['first-contentful-paint'] === undefined ? null : paints['first-contentful-paint'],
+    lcp_ms: state.lcp === undefined ? null : state.lcp,
+    long_tasks: state.longTasks || 0,
+    long_task_ms: state.longTaskMs || 0,
+    resources: resources.length,
+    transfer_bytes: transfer
+};
+"""
+
+# Subset of Performance.getMetrics kept per sample
+CDP_METRICS = ("Nodes", "JSHeapUsedSize", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration", "TaskDuration")
+
+# Metrics compared with the baseline (cumulative CDP counters are too noisy)
+BASELINE_METRICS = (
+    "ttfb_ms", "dom_content_loaded_ms", "load_ms", "fcp_ms", "lcp_ms", "long_task_ms", "transfer_bytes",
+    "route_change_ms",
+)
+
+# Document load metrics; meaningless for a route shown by client-side navigation
+DOCUMENT_METRICS = ("ttfb_ms", "dom_content_loaded_ms", "load_ms", "fcp_ms", "lcp_ms")
+
+# Counters that keep growing for the document's lifetime; a client-side
+# route gets the increase since it was shown
+CUMULATIVE_METRICS = ("long_tasks", "long_task_ms", "resources", "transfer_bytes")
+
+# Commands that leave the current document
+LEAVING_COMMANDS = {Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD}
+
+
+def install_perf_observers(driver):
+    """Register the observers for every new document and enable CDP metrics"""
+    try:
+        add_script_on_new_document(driver, PERF_OBSERVER_SCRIPT)
+        execute_cdp(driver, "Performance.enable", {})
+        return True
+    except WebDriverException:
+        return False
+
+
+def route_key(path):
+    """Group /edit/<id> pages under one key"""
+    return re.sub(r"^/edit/[^/]+", "/edit/:id", path or "/")
+
+
+def sample_key(sample):
+    """
+    Budget/baseline key: the route, marked `[soft]` when shown without a
+    reload and `@<profile>` when recorded under network/CPU throttling
+    """
+    key = sample["page"]
+    if sample.get("navigation", "hard") != "hard":
+        key = f"{key} [soft]"
+    if sample.get("profile", DEFAULT_PROFILE) != DEFAULT_PROFILE:
+        key = f"{key} @{sample['profile']}"
+    return key
+
+
+class PerfRecorder:
+    """
+    Collects one sample for every app page a driver visits
+    A page is sampled just before the driver navigates away and when the test
+    ends, so LCP and long tasks cover the page's whole lifetime
+    Every sample records how the page was reached (`navigation`): `hard` for
+    a document load, `link`/`history` for client-side routing
+    (utils.navigation), which samples the route change time instead, and
+    `in-app` for routes the app changed itself, and the throttling profile
+    it ran under (`profile`, utils.throttling)
+    """
+
+    def __init__(self, base_url, tracer=None, profile=DEFAULT_PROFILE):
+        self.origin = urlparse(base_url).netloc
+        self.tracer = tracer
+        self.profile = profile
+        self.samples = []
+        self.navigation = "hard"
+        self._route = None
+        self._route_ms = None
+        self._totals = {}
+        self._driver = None
+        self._execute = None
+
+    def attach(self, driver):
+        self._driver = driver
+        self._execute = driver.execute
+
+        def recording_execute(driver_command, params=None):
+            if driver_command in LEAVING_COMMANDS:
+                self.collect()
+                self.navigation, self._route, self._route_ms, self._totals = "hard", None, None, {}
+            return self._execute(driver_command, params)
+
+        driver.execute = recording_execute
+        driver._perf_recorder = self
+
+    def detach(self):
+        if self._driver is not None:
+            self._driver.execute = self._execute
+            del self._driver._perf_recorder
+            self._driver = None
+
+    def soft_navigation(self, mode, route_ms, path):
+        """The next sample is `path`, shown by client-side navigation in `route_ms`"""
+        self.navigation = mode
+        self._route = path
+        self._route_ms = route_ms
+
+    def collect(self):
+        """Sample the current page if it belongs to the app"""
+        phase = self.tracer.phase("metrics") if self.tracer else nullcontext()
+        with phase:
+            try:
+                url = self._execute(Command.GET_CURRENT_URL)["value"]
+                if urlparse(url).netloc != self.origin:
+                    return None
+                sample = self._execute(Command.W3C_EXECUTE_SCRIPT, {"script": COLLECT_SCRIPT, "args": []})["value"]
+                if not sample:
+                    return None
+                sample.update(self._cdp_metrics())
+            except WebDriverException:
+                return None
+        document_path = sample.pop("document_path")
+        expected = document_path if self.navigation == "hard" else self._route
+        if route_key(expected) != route_key(sample["path"]):
+            # Routed by the app itself (link click, form submit)
+            self.soft_navigation("in-app", None, sample["path"])
+        totals = {metric: sample.get(metric) or 0 for metric in CUMULATIVE_METRICS}
+        if self.navigation != "hard":
+            for metric in DOCUMENT_METRICS:
+                sample.pop(metric, None)
+            for metric in CUMULATIVE_METRICS:
+                sample[metric] = totals[metric] - self._totals.get(metric, 0)
+            sample["route_change_ms"] = self._route_ms
+        self._totals = totals
+        sample["page"] = route_key(sample.pop("path"))
+        sample["navigation"] = self.navigation
+        sample["profile"] = self.profile
+        self.samples.append(sample)
+        return sample
+
+    def _cdp_metrics(self):
+        try:
+            metrics = execute_cdp(self._driver, "Performance.getMetrics", {})["metrics"]
+        except (WebDriverException, KeyError):
+            return {}
+        return {f"cdp_{m['name']}": m["value"] for m in metrics if m["name"] in CDP_METRICS}
+
+
+def check_sample(sample, budgets=None, baseline=None, tolerance=0.25):
+    """
+    Compare one sample with its page budget and the baseline medians
+    Returns a list of human-readable violations
+    """
+    violations = []
+    page = sample_key(sample)
+    limits = (budgets or {}).get(page, {})
+    previous = (baseline or {}).get("pages", {}).get(page, {})
+
+    for metric, limit in limits.items():
+        value = sample.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{page} {metric}={value:.0f} exceeds budget {limit}")
+    for metric in BASELINE_METRICS:
+        median = previous.get(metric)
+        value = sample.get(metric)
+        if value is not None and median and value > median * (1 + tolerance):
+            violations.append(
+                f"{page} {metric}={value:.0f} is more than {tolerance:.0%} above baseline ({median:.0f})"
+            )
+    return violations
+
+
+class PerfCollector:
+    """All samples of one worker; written per build with per-page medians"""
+
+    def __init__(self, build):
+        self.build = build
+        self.samples = []
+
+    def add(self, test, samples):
+        for sample in samples:
+            self.samples.append(dict(sample, test=test))
+
+    def page_medians(self):
+        pages = {}
+        for sample in self.samples:
+            pages.setdefault(sample_key(sample), []).append(sample)
+        medians = {}
+        for page, samples in pages.items():
+            medians[page] = {}
+            metrics = sorted({metric for sample in samples for metric in sample} - {"page", "test", "navigation", "profile"})
+            for metric in metrics:
+                values = [s[metric] for s in samples if isinstance(s.get(metric), (int, float))]
+                if values:
+                    medians[page][metric] = statistics.median(values)
+        return medians
+
+    def write(self, path):
+        """The file doubles as a baseline for later builds (PERF_BASELINE_FILE)"""
+        with open(path, "w") as f:
+            json.dump({
+                "build": self.build,
+                "recorded_at": time.time(),
+                "pages": self.page_medians(),
+                "samples": self.samples,
+            }, f, indent=2)
@@ -0,0 +1,96 @@
+"""
+Result cache for read-only tests
+A test marked `read_only` that passed against the same front-end build, with
+the same test and page-object source, is not run again. The key combines a
+hash of the served assets (index.html and the JS/CSS bundles it references)
+with a hash of the source.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import time
+from urllib.parse import urljoin, urlparse
+
+import urllib3
+
+
+# src/href of <script> and <link> tags in index.html
+ASSET_PATTERN = re.compile(r"<(?:script|link)\b[^>]*?\b(?:src|href)=[\"']([^\"']+)[\"']", re.IGNORECASE)
+BUNDLE_PATTERN = re.compile(r"\.(?:m?js|jsx|tsx?|css)(?:\?|$)")
+
+
+def _fetch(http, url):
+    response = http.request("GET", url)
+    if response.status != 200:
+        raise urllib3.exceptions.HTTPError(f"GET {url} returned {response.status}")
+    return response.data
+
+
+def build_hash(app_url, timeout=10):
+    """sha256 of index.html and the app's own JS/CSS bundles"""
+    http = urllib3.PoolManager(timeout=urllib3.Timeout(total=timeout), retries=False)
+    base = app_url.rstrip("/") + "/"
+    index = _fetch(http, base)
+    digest = hashlib.sha256(index)
+    for asset in sorted(set(ASSET_PATTERN.findall(index.decode("utf-8", "replace")))):
+        url = urljoin(base, asset)
+        if urlparse(url).netloc != urlparse(base).netloc or not BUNDLE_PATTERN.search(url):
+            continue  # Third-party scripts, icons
+        digest.update(asset.encode())
+        digest.update(_fetch(http, url))
+    return digest.hexdigest()
+
+
+def source_hash(function, paths=()):
+    """sha256 of a test function's source and the files it depends on"""
+    digest = hashlib.sha256(inspect.getsource(function).encode())
+    for path in sorted(paths):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Last passing key per test id, stored as JSON"""
+
+    def __init__(self, path):
+        self.path = path
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.tests = json.load(f).get("tests", {})
+
+    @staticmethod
+    def key(*parts):
+        return hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+    def hit(self, test_id, key):
+        """The cache entry when the test passed with this key, else None"""
+        entry = self.tests.get(test_id)
+        return entry if entry and entry["key"] == key else None
+
+    def store(self, test_id, key, build):
+        self.tests[test_id] = {"key": key, "build": build, "passed_at": time.time()}
+
+    def invalidate(self, test_id):
+        self.tests.pop(test_id, None)
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"tests": self.tests}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def format_age(seconds):
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.0f}h"
+    return f"{seconds / 86400:.0f}d"
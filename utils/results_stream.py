@@ -0,0 +1,250 @@
+"""
+Streaming test results
+One JSON line per test is appended to REPORTS_DIR/results.jsonl as soon as
+the test finishes (setup, call and teardown), so a run can be followed while
+it is in progress and a crashed run keeps everything up to its last test.
+JUnit XML and an HTML summary are built from the stream afterwards.
+
+Usage:
+    tail -f reports/results.jsonl                        # follow a run
+    python -m utils.results_stream                       # rebuild junit.xml/results.html
+    python -m utils.results_stream --stream other.jsonl --junit other.xml
+"""
+
+import argparse
+import html
+import json
+import os
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+from config.config import REPORTS_DIR
+
+
+# Characters of a failure's traceback kept in the stream
+MAX_LONGREPR = 4000
+
+
+def test_outcome(reports):
+    """pytest-style outcome of one test from its phase reports"""
+    for report in reports:
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+    for report in reports:
+        if dict(report.user_properties).get("result_cache") == "hit":
+            return "cached"
+        if hasattr(report, "wasxfail"):
+            return "xpassed" if report.passed else "xfailed"
+        if report.skipped:
+            return "skipped"
+    return "passed"
+
+
+def _longrepr(report):
+    if report.skipped and isinstance(report.longrepr, tuple):
+        return report.longrepr[2]  # (path, line, reason)
+    return str(report.longrepr)[-MAX_LONGREPR:]
+
+
+class ResultStream:
+    """
+    pytest plugin that writes one record per finished test
+    Registered in the main process only; with xdist it sees every worker's
+    reports as they arrive, so a single process writes the file
+    """
+
+    def __init__(self, path, run_id):
+        self.path = path
+        self.run_id = run_id
+        self.started = time.time()
+        self.counts = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "w", buffering=1)  # Line-buffered: every record reaches the disk
+        self._write({"type": "run", "run_id": run_id, "started": self.started})
+
+    def _write(self, record):
+        with self._lock:
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def pytest_runtest_logreport(self, report):
+        self._pending.setdefault(report.nodeid, []).append(report)
+        if report.when == "teardown":
+            self._write(self.record(self._pending.pop(report.nodeid)))
+
+    def record(self, reports):
+        outcome = test_outcome(reports)
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        node = getattr(reports[0], "node", None)
+        properties = {}
+        for report in reports:
+            properties.update(dict(report.user_properties))
+        record = {
+            "type": "test",
+            "test": reports[0].nodeid,
+            "outcome": outcome,
+            "duration_s": round(sum(report.duration for report in reports), 4),
+            "worker": node.workerinput["workerid"] if node is not None else "main",
+            "finished": time.time(),
+        }
+        if "time_budget" in properties:
+            record["breakdown_s"] = properties["time_budget"]
+        if "throttle_profile" in properties:
+            record["profile"] = properties["throttle_profile"]
+        if "artifacts" in properties:
+            record["artifacts"] = properties["artifacts"]
+        problem = next((report for report in reports if report.failed or report.skipped), None)
+        if problem is not None and problem.longrepr:
+            record["when"] = problem.when
+            record["longrepr"] = _longrepr(problem)
+        return record
+
+    def close(self):
+        """Write the summary line; returns the counts per outcome"""
+        self._write({
+            "type": "summary",
+            "run_id": self.run_id,
+            "duration_s": round(time.time() - self.started, 1),
+            "counts": self.counts,
+        })
+        self._file.close()
+        return self.counts
+
+
+# ==================== Reports built from the stream ====================
+def read_stream(path):
+    """(run, tests, summary) from a stream; summary is None for an interrupted run"""
+    run, tests, summary = {}, [], None
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Last line of a killed run may be cut off
+            if record.get("type") == "run":
+                run = record
+            elif record.get("type") == "test":
+                tests.append(record)
+            elif record.get("type") == "summary":
+                summary = record
+    return run, tests, summary
+
+
+def _split_nodeid(nodeid):
+    """JUnit classname and name: `tests.test_x.TestClass` and `test_y[param]`"""
+    parts = nodeid.split("::")
+    module = parts[0][:-3] if parts[0].endswith(".py") else parts[0]
+    classname = ".".join([module.replace("/", ".")] + parts[1:-1])
+    return classname, parts[-1]
+
+
+def write_junit(path, run, tests, summary=None):
+    failures = sum(1 for test in tests if test["outcome"] == "failed")
+    errors = sum(1 for test in tests if test["outcome"] == "error")
+    skipped = sum(1 for test in tests if test["outcome"] in ("skipped", "cached", "xfailed"))
+    suite = ET.Element("testsuite", {
+        "name": "selenium-tests",
+        "tests": str(len(tests)),
+        "failures": str(failures),
+        "errors": str(errors),
+        "skipped": str(skipped),
+        "time": f"{sum(test['duration_s'] for test in tests):.3f}",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(run.get("started", time.time()))),
+    })
+    properties = ET.SubElement(suite, "properties")
+    ET.SubElement(properties, "property", {"name": "run_id", "value": str(run.get("run_id", ""))})
+    ET.SubElement(properties, "property", {"name": "complete", "value": str(summary is not None).lower()})
+    for test in tests:
+        classname, name = _split_nodeid(test["test"])
+        case = ET.SubElement(suite, "testcase", {
+            "classname": classname, "name": name, "time": f"{test['duration_s']:.3f}"
+        })
+        text = test.get("longrepr", "")
+        if test["outcome"] in ("failed", "error"):
+            tag = "failure" if test["outcome"] == "failed" else "error"
+            ET.SubElement(case, tag, {"message": text.strip().splitlines()[-1] if text.strip() else tag}).text = text
+        elif test["outcome"] in ("skipped", "cached"):
+            ET.SubElement(case, "skipped", {"message": text or test["outcome"]})
+        elif test["outcome"] == "xfailed":
+            ET.SubElement(case, "skipped", {"message": "expected failure"}).text = text
+        if test.get("artifacts"):
+            ET.SubElement(case, "system-out").text = "\n".join(
+                f"[[ATTACHMENT|{os.path.abspath(artifact)}]]" for artifact in test["artifacts"].values()
+            )
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+OUTCOME_COLORS = {
+    "passed": "#2e7d32", "failed": "#c62828", "error": "#c62828", "skipped": "#757575",
+    "cached": "#1565c0", "xfailed": "#757575", "xpassed": "#ef6c00",
+}
+
+
+def write_html(path, run, tests, summary=None):
+    """Compact HTML table of the stream; artifact links are relative to `path`"""
+    base = os.path.dirname(os.path.abspath(path))
+    counts = {}
+    for test in tests:
+        counts[test["outcome"]] = counts.get(test["outcome"], 0) + 1
+    state = f"finished in {summary['duration_s']:.0f}s" if summary else "incomplete (run interrupted or still running)"
+    rows = []
+    for test in tests:
+        links = " ".join(
+            f'<a href="{html.escape(os.path.relpath(artifact, base).replace(os.sep, "/"))}">{html.escape(name)}</a>'
+            for name, artifact in test.get("artifacts", {}).items()
+        )
+        breakdown = ", ".join(
+            f"{category} {seconds:.1f}s" for category, seconds in test.get("breakdown_s", {}).items() if seconds >= 0.05
+        )
+        details = f"<details><summary>{html.escape(test.get('when', ''))}</summary><pre>{html.escape(test['longrepr'])}</pre></details>" \
+            if test.get("longrepr") else ""
+        rows.append(
+            f'<tr><td style="color:{OUTCOME_COLORS.get(test["outcome"], "#000")}">{test["outcome"]}</td>'
+            f"<td>{html.escape(test['test'])}{details}</td><td>{test['duration_s']:.2f}s</td>"
+            f"<td>{html.escape(test['worker'])}</td><td>{html.escape(breakdown)}</td><td>{links}</td></tr>"
+        )
+    with open(path, "w") as f:
+        f.write(
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test results</title>"
+            "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+            "td,th{border:1px solid #ddd;padding:4px 8px;text-align:left;vertical-align:top}</style></head><body>"
+            f"<h1>Test results</h1><p>Run {html.escape(str(run.get('run_id', '')))}: {len(tests)} tests, {state}<br>"
+            + ", ".join(f"{count} {outcome}" for outcome, count in sorted(counts.items()))
+            + "</p><table><tr><th>Outcome</th><th>Test</th><th>Duration</th><th>Worker</th>"
+            "<th>Time budget</th><th>Artifacts</th></tr>"
+            + "".join(rows) + "</table></body></html>"
+        )
+
+
+def build_reports(stream_path, junit_path=None, html_path=None):
+    """Write JUnit XML and HTML from a (possibly partial) stream; returns the test count"""
+    run, tests, summary = read_stream(stream_path)
+    if junit_path:
+        write_junit(junit_path, run, tests, summary)
+    if html_path:
+        write_html(html_path, run, tests, summary)
+    return len(tests)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build JUnit XML and HTML from a results stream")
+    parser.add_argument("--stream", default=os.path.join(REPORTS_DIR, "results.jsonl"))
+    parser.add_argument("--junit", default=os.path.join(REPORTS_DIR, "junit.xml"))
+    parser.add_argument("--html", default=os.path.join(REPORTS_DIR, "results.html"))
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.stream):
+        print(f"No results stream at {args.stream}")
+        return 1
+    count = build_reports(args.stream, args.junit, args.html)
+    print(f"{count} test(s) from {args.stream} written to {args.junit} and {args.html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
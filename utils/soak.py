@@ -0,0 +1,130 @@
+"""
+Soak runner for browser memory leaks
+Repeats the create -> list -> edit -> delete flow with in-app (client-side)
+navigation so the page is never reloaded, samples heap size, DOM nodes and
+event listeners at intervals and fits a growth trend to the samples
+"""
+
+import json
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils.cdp import execute_cdp
+
+
+HEAP_SCRIPT = """
+return {
+    heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+    dom_nodes: document.getElementsByTagName('*').length
+};
+"""
+
+
+def sample_memory(driver, collect_garbage=True):
+    """
+    Heap, DOM node and event listener counts for the current page
+    Forces a garbage collection first so only retained memory is counted
+    """
+    if collect_garbage:
+        try:
+            execute_cdp(driver, "HeapProfiler.collectGarbage", {})
+        except WebDriverException:
+            pass
+    sample = driver.execute_script(HEAP_SCRIPT)
+    try:
+        counters = execute_cdp(driver, "Memory.getDOMCounters", {})
+        sample["listeners"] = counters["jsEventListeners"]
+        sample["cdp_nodes"] = counters["nodes"]
+    except (WebDriverException, KeyError):
+        sample["listeners"] = None
+    return sample
+
+
+def fit_trend(xs, ys):
+    """Least-squares line through the points: (slope, r_squared)"""
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    if sxx == 0:
+        return 0.0, 0.0
+    slope = sxy / sxx
+    r_squared = (sxy * sxy) / (sxx * syy) if syy else 0.0
+    return slope, r_squared
+
+
+def detect_growth(samples, limits, warmup_cycles=0, min_r_squared=0.6):
+    """
+    Flag metrics that keep growing after warm-up
+    - limits: {metric: max growth per cycle}
+    A metric fails when its trend exceeds the limit and the line explains
+    most of the variation (r² >= min_r_squared), i.e. growth is steady rather
+    than noise or a one-off jump. Returns {metric: (slope, r²)} for failures.
+    """
+    steady = [s for s in samples if s["cycle"] >= warmup_cycles]
+    failures = {}
+    for metric, limit in limits.items():
+        points = [(s["cycle"], s[metric]) for s in steady if s.get(metric) is not None]
+        if len(points) < 3:
+            continue
+        slope, r_squared = fit_trend(*zip(*points))
+        if slope > limit and r_squared >= min_r_squared:
+            failures[metric] = (slope, r_squared)
+    return failures
+
+
+class SoakRunner:
+    """Drives the CRUD flow through the UI without reloading the page"""
+
+    def __init__(self, list_page, form_page, names):
+        self.list_page = list_page
+        self.form_page = form_page
+        self.names = names
+        self.driver = list_page.driver
+        self.samples = []
+
+    def cycle(self):
+        """Create, list, edit and delete one employee with in-app navigation"""
+        name = self.names.unique("Soak")
+        updated_name = f"{name} edited"
+
+        self.list_page.click_create()
+        self.form_page.wait_until_loaded()
+        self.form_page.fast_fill(name, "Soak Tester", "Junior", submit=True)
+        self.list_page.wait_for_row(name)
+
+        self.list_page.click_edit(name)
+        self.form_page.wait.until(EC.url_contains("/edit/"))
+        self.form_page.wait_until_loaded(name)
+        self.form_page.fast_fill(name=updated_name, submit=True)
+        self.list_page.wait_for_row(updated_name)
+
+        self.list_page.click_delete(updated_name)
+        self.list_page.wait_for_row_gone(updated_name)
+
+    def run(self, cycles, sample_every):
+        """Run `cycles` flows, sampling memory before the first and every `sample_every`"""
+        self.list_page.open()
+        start = time.perf_counter()
+        for cycle in range(cycles + 1):
+            if cycle % sample_every == 0 or cycle == cycles:
+                sample = sample_memory(self.driver)
+                sample["cycle"] = cycle
+                sample["elapsed_s"] = round(time.perf_counter() - start, 2)
+                self.samples.append(sample)
+                print(f"[SOAK] cycle {cycle}: heap={sample['heap']} nodes={sample['dom_nodes']} "
+                      f"listeners={sample['listeners']}")
+            if cycle < cycles:
+                self.cycle()
+        return self.samples
+
+    def write(self, path, failures):
+        with open(path, "w") as f:
+            json.dump({
+                "samples": self.samples,
+                "growth_failures": {k: {"slope": v[0], "r_squared": v[1]} for k, v in failures.items()},
+            }, f, indent=2)
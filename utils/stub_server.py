@@ -0,0 +1,368 @@
+"""
+In-process stand-in for the Employee Management app
+Serves the same pages (`/`, `/create`, `/edit/:id`, same element ids) and the
+same /record endpoints as the real deployment from an in-memory store, so the
+suite can run offline in milliseconds. Latency and failures can be injected
+into the API to see how the suite's waits cope with a slow or flaky backend.
+
+Usage:
+    python -m utils.stub_server --port 5173 --latency-ms 300 --error-rate 0.05
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+RECORD_PATH = re.compile(r"^/record/?$")
+RECORD_ID_PATH = re.compile(r"^/record/([^/]+)/?$")
+PAGE_PATH = re.compile(r"^/(create/?|edit/[^/]+/?)?$")
+
+# Single-page app with the markup of the real React front end: links and
+# form submits navigate with the history API, data comes from /record via fetch
+APP_HTML = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>Employee Management (local)</title>
+<style>
+body { font-family: sans-serif; margin: 0 1rem; }
+nav { display: flex; justify-content: space-between; padding: 1rem 0; }
+table { width: 100%; border-collapse: collapse; }
+th, td { text-align: left; padding: 0.5rem; border-bottom: 1px solid #ddd; }
+label { display: block; margin-top: 0.75rem; }
+</style>
+</head>
+<body>
+<nav><a href="/" data-link>Employee Management</a><a href="/create" data-link>Create Employee</a></nav>
+<div id="root"></div>
+<script>
+(function () {
+    var root = document.getElementById('root');
+    var LEVELS = ['Intern', 'Junior', 'Senior'];
+
+    function escape(text) {
+        var div = document.createElement('div');
+        div.textContent = text == null ? '' : text;
+        return div.innerHTML;
+    }
+
+    function navigate(path) {
+        history.pushState({}, '', path);
+        render();
+    }
+
+    function renderList() {
+        root.innerHTML = '<h3>Employee Records</h3><table><thead><tr>' +
+            '<th>Name</th><th>Position</th><th>Level</th><th>Action</th>' +
+            '</tr></thead><tbody></tbody></table>';
+        var tbody = root.querySelector('tbody');
+        fetch('/record').then(function (response) {
+            if (!response.ok) {
+                console.error('An error occurred: ' + response.statusText);
+                return;
+            }
+            return response.json().then(function (records) {
+                tbody.innerHTML = records.map(function (record) {
+                    return '<tr data-id="' + escape(record._id) + '"><td>' + escape(record.name) + '</td>' +
+                        '<td>' + escape(record.position) + '</td><td>' + escape(record.level) + '</td>' +
+                        '<td><a href="/edit/' + escape(record._id) + '" data-link>Edit</a> ' +
+                        '<button type="button" data-delete>Delete</button></td></tr>';
+                }).join('');
+            });
+        });
+    }
+
+    function renderForm(id) {
+        root.innerHTML = '<h3>Create/Update Employee Record</h3><form>' +
+            '<label for="name">Name</label><input type="text" id="name" name="name">' +
+            '<label for="position">Position</label><input type="text" id="position" name="position">' +
+            LEVELS.map(function (level) {
+                return '<label><input type="radio" name="positionOptions" id="position' + level +
+                    '" value="' + level + '"> ' + level + '</label>';
+            }).join('') +
+            '<p><input type="submit" value="Save Employee Record"></p></form>';
+        var form = root.querySelector('form');
+        if (id) {
+            fetch('/record/' + id).then(function (response) {
+                if (!response.ok) {
+                    console.error('An error has occurred: ' + response.statusText);
+                    return;
+                }
+                return response.json().then(function (record) {
+                    document.getElementById('name').value = record.name;
+                    document.getElementById('position').value = record.position;
+                    var radio = document.getElementById('position' + record.level);
+                    if (radio) { radio.checked = true; }
+                });
+            });
+        }
+        form.addEventListener('submit', function (event) {
+            event.preventDefault();
+            var checked = form.querySelector('input[type="radio"]:checked');
+            var record = {
+                name: document.getElementById('name').value,
+                position: document.getElementById('position').value,
+                level: checked ? checked.value : ''
+            };
+            fetch(id ? '/record/' + id : '/record', {
+                method: id ? 'PATCH' : 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify(record)
+            }).then(function (response) {
+                if (!response.ok) { throw new Error('HTTP error! status: ' + response.status); }
+            }).catch(function (error) {
+                console.error('A problem occurred adding or updating a record: ', error);
+            }).then(function () { navigate('/'); });
+        });
+    }
+
+    function render() {
+        var match = location.pathname.match(/^\\/edit\\/([^\\/]+)/);
+        if (match) {
+            renderForm(match[1]);
+        } else if (/^\\/create/.test(location.pathname)) {
+            renderForm(null);
+        } else {
+            renderList();
+        }
+    }
+
+    document.addEventListener('click', function (event) {
+        var link = event.target.closest('a[data-link]');
+        if (link) {
+            event.preventDefault();
+            navigate(link.getAttribute('href'));
+            return;
+        }
+        var button = event.target.closest('button[data-delete]');
+        if (button) {
+            var row = button.closest('tr');
+            fetch('/record/' + row.getAttribute('data-id'), {method: 'DELETE'}).then(function () {
+                row.remove();
+            });
+        }
+    });
+    window.addEventListener('popstate', render);
+    render();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class EmployeeStore:
+    """Thread-safe in-memory employee collection"""
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def list(self):
+        with self._lock:
+            return list(self._records.values())
+
+    def get(self, record_id):
+        with self._lock:
+            return self._records.get(record_id)
+
+    def create(self, fields):
+        record_id = uuid.uuid4().hex[:24]  # Looks like a Mongo ObjectId
+        with self._lock:
+            self._records[record_id] = dict(fields, _id=record_id)
+        return record_id
+
+    def update(self, record_id, fields):
+        with self._lock:
+            if record_id not in self._records:
+                return False
+            fields.pop("_id", None)
+            self._records[record_id].update(fields)
+            return True
+
+    def delete(self, record_id):
+        with self._lock:
+            return self._records.pop(record_id, None) is not None
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Serves the app page and routes /record requests to the server's EmployeeStore"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real backend
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+    def log_message(self, format, *args):
+        pass  # Keep test output clean
+
+    # ==================== Routing ====================
+    def do_OPTIONS(self):
+        self._send(204, None)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if PAGE_PATH.match(path):
+            return self._send_html(APP_HTML)
+        if self._inject_fault(path):
+            return
+        match = RECORD_ID_PATH.match(path)
+        if match:
+            record = self.server.store.get(match.group(1))
+            return self._send(200, record) if record else self._send(404, "Record not found")
+        if RECORD_PATH.match(path):
+            return self._send(200, self.server.store.list())
+        self._send(404, "Not found")
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if not RECORD_PATH.match(path):
+            return self._send(404, "Not found")
+        if self._inject_fault(path):
+            return
+        record_id = self.server.store.create(self._read_json())
+        self._send(201, {"acknowledged": True, "insertedId": record_id})
+
+    def do_PATCH(self):
+        path = urlsplit(self.path).path
+        match = RECORD_ID_PATH.match(path)
+        if not match:
+            return self._send(404, "Not found")
+        if self._inject_fault(path):
+            return
+        updated = self.server.store.update(match.group(1), self._read_json())
+        self._send(200, {"acknowledged": True, "matchedCount": int(updated), "modifiedCount": int(updated)})
+
+    def do_DELETE(self):
+        path = urlsplit(self.path).path
+        match = RECORD_ID_PATH.match(path)
+        if not match:
+            return self._send(404, "Not found")
+        if self._inject_fault(path):
+            return
+        deleted = self.server.store.delete(match.group(1))
+        self._send(200, {"acknowledged": True, "deletedCount": int(deleted)})
+
+    # ==================== Helpers ====================
+    def _inject_fault(self, path):
+        """
+        Delay API requests by the server's latency and fail a share of them
+        with 503; returns True when the request was answered with an error
+        """
+        if not RECORD_PATH.match(path) and not RECORD_ID_PATH.match(path):
+            return False
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.error_rate and self.server.random.random() < self.server.error_rate:
+            self._read_json()  # Drain the body so the connection stays usable
+            self._send(503, "Injected failure")
+            return True
+        return False
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _send(self, status, payload):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PATCH, DELETE, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_html(self, html):
+        body = html.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer:
+    """
+    Runs the stand-in on a background thread
+    Use as a context manager; `url` is available once started
+    - latency: seconds added to every API request
+    - error_rate: share of API requests (0-1) answered with 503
+    Both can be changed while the server runs
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, error_rate=0.0, seed=None):
+        self.store = EmployeeStore()
+        self._httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.store = self.store
+        self._httpd.random = random.Random(seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self._thread = None
+
+    @property
+    def latency(self):
+        return self._httpd.latency
+
+    @latency.setter
+    def latency(self, seconds):
+        self._httpd.latency = seconds
+
+    @property
+    def error_rate(self):
+        return self._httpd.error_rate
+
+    @error_rate.setter
+    def error_rate(self, rate):
+        self._httpd.error_rate = rate
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        # A short poll interval lets stop() return in milliseconds
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Employee Management app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5173)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every API request")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of API requests answered with 503")
+    args = parser.parse_args(argv)
+
+    server = StubServer(args.host, args.port, args.latency_ms / 1000, args.error_rate)
+    print(f"Serving the Employee Management stand-in on {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Test data factory for employee records
+Seeds records through the REST API so tests only drive the browser for the
+behaviour they are checking
+"""
+
+import itertools
+import os
+import threading
+import uuid
+
+
+LEVELS = ("Intern", "Junior", "Senior")
+
+
+def new_run_id():
+    """Short random id shared by every worker of one test run"""
+    return uuid.uuid4().hex[:6]
+
+
+def current_worker_id():
+    """pytest-xdist worker id (gw0, gw1, ...) or `main` for serial runs"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+class NameFactory:
+    """
+    Generates employee names that cannot collide across workers or runs
+    Names look like `<prefix> <run_id>-<worker>-<n>`
+    """
+
+    def __init__(self, run_id, worker_id=None):
+        self.namespace = f"{run_id}-{worker_id or current_worker_id()}"
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def unique(self, prefix="Test Employee"):
+        with self._lock:
+            n = next(self._counter)
+        return f"{prefix} {self.namespace}-{n}"
+
+
+class EmployeeFactory:
+    """
+    Creates, reads, updates and deletes employees through the API
+    Everything created is tracked in `registry` (utils.cleanup.ResourceRegistry)
+    """
+
+    def __init__(self, api, names, registry=None):
+        self.api = api
+        self.names = names
+        self.registry = registry
+
+    def build(self, name=None, position="QA Engineer", level="Junior"):
+        """Return an employee payload without saving it"""
+        if name is None:
+            name = self.names.unique()
+        return {"name": name, "position": position, "level": level}
+
+    def create(self, name=None, position="QA Engineer", level="Junior"):
+        """Save a single employee and return it with its `_id`"""
+        record = self.build(name, position, level)
+        created = self.api.create(record["name"], record["position"], record["level"])
+        self.track(created["_id"])
+        return created
+
+    def create_many(self, count=None, prefix="Test Employee", records=None):
+        """
+        Save several employees in one concurrent batch
+        Either pass explicit `records` or a `count` of generated ones
+        """
+        if records is None:
+            records = [
+                self.build(self.names.unique(prefix), level=LEVELS[i % len(LEVELS)])
+                for i in range(count)
+            ]
+        created = self.api.create_many(records)
+        self.track(*(record["_id"] for record in created))
+        return created
+
+    def get(self, record_id):
+        return self.api.get(record_id)
+
+    def update(self, record_id, **fields):
+        return self.api.update(record_id, **fields)
+
+    def delete(self, *record_ids):
+        result = self.api.delete_many(list(record_ids))
+        if self.registry is not None:
+            self.registry.forget(*record_ids)
+        return result
+
+    def track(self, *record_ids):
+        """Register records created outside the factory (e.g. through the UI) for clean-up"""
+        if self.registry is not None:
+            self.registry.track(*record_ids)
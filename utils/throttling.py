@@ -0,0 +1,119 @@
+"""
+Network and CPU throttling profiles (DevTools Protocol)
+Runs the existing tests as if on a slow link or a slow machine and summarizes
+per profile how pages degrade and how close explicit waits come to timing out
+"""
+
+import statistics
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.cdp import execute_cdp
+from utils.tracing import percentile
+
+
+# latency in ms, throughput in kbit/s (-1 = unthrottled), CPU slowdown factor.
+# The 3G profiles match Chrome DevTools' presets.
+PROFILES = {
+    "fast": {"latency_ms": 0, "download_kbps": -1, "upload_kbps": -1, "cpu_rate": 1},
+    "fast-3g": {"latency_ms": 562.5, "download_kbps": 1440, "upload_kbps": 675, "cpu_rate": 1},
+    "slow-3g": {"latency_ms": 2000, "download_kbps": 400, "upload_kbps": 400, "cpu_rate": 1},
+    "cpu-4x": {"latency_ms": 0, "download_kbps": -1, "upload_kbps": -1, "cpu_rate": 4},
+    "slow-3g-cpu-4x": {"latency_ms": 2000, "download_kbps": 400, "upload_kbps": 400, "cpu_rate": 4},
+}
+
+DEFAULT_PROFILE = "fast"
+
+# A wait that used more than this share of its timeout is reported as tight
+TIGHT_WAIT_RATIO = 0.5
+
+
+def parse_profiles(text):
+    """Comma-separated profile names, validated"""
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown throttling profile(s) {unknown} (expected one of {', '.join(PROFILES)})")
+    return names
+
+
+def _throughput(kbps):
+    return -1 if kbps < 0 else kbps * 1000 / 8  # Bytes per second
+
+
+def apply_profile(driver, name):
+    """
+    Throttle the session's network and CPU (no-op when already applied)
+    Returns False when DevTools is unavailable
+    """
+    if getattr(driver, "_throttle_profile", DEFAULT_PROFILE) == name:
+        return True
+    profile = PROFILES[name]
+    try:
+        execute_cdp(driver, "Network.enable", {})
+        execute_cdp(driver, "Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile["latency_ms"],
+            "downloadThroughput": _throughput(profile["download_kbps"]),
+            "uploadThroughput": _throughput(profile["upload_kbps"]),
+        })
+        execute_cdp(driver, "Emulation.setCPUThrottlingRate", {"rate": profile["cpu_rate"]})
+    except WebDriverException:
+        return False
+    driver._throttle_profile = name
+    return True
+
+
+def summarize_matrix(results):
+    """
+    Per-profile page timings and wait headroom
+    - results: [{"profile", "perf_samples", "waits"}] from the test reports
+    Page time is load_ms for hard navigations and route_change_ms otherwise
+    """
+    summary = {}
+    for result in results:
+        profile = summary.setdefault(result["profile"], {"tests": 0, "pages": {}, "waits": {}})
+        profile["tests"] += 1
+        for sample in result.get("perf_samples", []):
+            value = sample.get("load_ms") or sample.get("route_change_ms")
+            if value:
+                profile["pages"].setdefault(sample["page"], []).append(value)
+        for wait in result.get("waits", []):
+            profile["waits"].setdefault(wait["site"], []).append(wait)
+
+    for profile in summary.values():
+        profile["pages"] = {
+            page: {"samples": len(values), "median_ms": round(statistics.median(values), 1)}
+            for page, values in sorted(profile["pages"].items())
+        }
+        profile["waits"] = {
+            site: _wait_stats(waits) for site, waits in sorted(profile["waits"].items())
+        }
+    return summary
+
+
+def _wait_stats(waits):
+    seconds = [wait["seconds"] for wait in waits]
+    timeout = max(wait["timeout"] for wait in waits)
+    return {
+        "count": len(waits),
+        "timeout_s": timeout,
+        "p95_s": round(percentile(seconds, 0.95), 3),
+        "max_s": round(max(seconds), 3),
+        "timed_out": sum(1 for wait in waits if wait["timed_out"]),
+        "tight": max(seconds) > timeout * TIGHT_WAIT_RATIO,
+    }
+
+
+def format_matrix(summary):
+    lines = []
+    for name, profile in summary.items():
+        pages = ", ".join(f"{page} {stats['median_ms']:.0f}ms" for page, stats in profile["pages"].items())
+        lines.append(f"Throttling profile {name} ({profile['tests']} tests): {pages or 'no page timings'}")
+        for site, stats in profile["waits"].items():
+            if stats["tight"]:
+                lines.append(
+                    f"  tight wait {site}: max {stats['max_s']:.1f}s of {stats['timeout_s']:g}s "
+                    f"(p95 {stats['p95_s']:.1f}s, {stats['timed_out']} timed out)"
+                )
+    return lines
@@ -0,0 +1,193 @@
+"""
+Adaptive timeouts
+When a worker's first browser test starts, one page load (timed by the
+browser's Navigation Timing, `loadEventEnd`) and one API round trip are
+measured, and explicit-wait and page-load timeouts are derived from them with
+a safety margin. During the run they follow the p95 of the page loads and
+explicit waits actually observed. A fast target therefore fails a broken test
+in seconds instead of after the configured 15/30s. EXPLICIT_WAIT /
+PAGE_LOAD_TIMEOUT set in the environment are used as given.
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+from config.config import (
+    EXPLICIT_WAIT,
+    PAGE_LOAD_TIMEOUT,
+    TIMEOUT_OVERRIDES,
+    TIMEOUT_SAFETY_FACTOR,
+    ADAPTIVE_TIMEOUTS
+)
+from utils.api_client import ApiError
+from utils.throttling import DEFAULT_PROFILE
+from utils.tracing import percentile
+
+
+# (floor, ceiling) in seconds of the derived timeouts
+EXPLICIT_LIMITS = (3.0, 60.0)
+PAGE_LOAD_LIMITS = (10.0, 120.0)
+
+# Observations needed before a throttling profile leaves the configured values
+MIN_SAMPLES = 5
+# Recent observations kept per profile and kind
+WINDOW = 500
+
+# Seconds from the start of the navigation to the end of the load event
+# (null before the page has finished loading)
+LOAD_TIME_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+return nav && nav.loadEventEnd > 0 ? nav.loadEventEnd / 1000 : null;
+"""
+
+
+def _clamp(value, limits):
+    return round(min(limits[1], max(limits[0], value)), 1)
+
+
+def profile_of(driver):
+    """Throttling profile a session is running under (utils.throttling)"""
+    return getattr(driver, "_throttle_profile", DEFAULT_PROFILE)
+
+
+class AdaptiveTimeouts:
+    """
+    Explicit-wait and page-load timeouts for the target under test
+    - explicit / page_load: configured values, used until latency is known
+    - overrides: settings given in the environment; they are never adapted
+    - factor: safety margin applied to the p95 latency
+    Observations (`page_load`, `wait`, `api` in seconds) are kept per
+    throttling profile. The unthrottled profile starts from the calibration
+    probes; throttled profiles use the configured values until they have
+    MIN_SAMPLES observations of their own
+    """
+
+    def __init__(self, explicit=15, page_load=30, overrides=(), factor=4.0, enabled=True):
+        self.defaults = {"explicit": explicit, "page_load": page_load}
+        self.overrides = set(overrides)
+        self.factor = factor
+        self.enabled = enabled
+        self.probes = {}
+        self.observed = defaultdict(lambda: defaultdict(lambda: deque(maxlen=WINDOW)))
+        self._lock = threading.Lock()
+
+    def explicit(self, driver=None):
+        """Timeout for a WebDriverWait in this session"""
+        return self.current(profile_of(driver))["explicit"]
+
+    def page_load(self, driver=None):
+        """Page-load timeout for this session"""
+        return self.current(profile_of(driver))["page_load"]
+
+    def observe(self, kind, seconds, profile=DEFAULT_PROFILE):
+        with self._lock:
+            self.observed[profile][kind].append(seconds)
+
+    def observe_page_load(self, driver):
+        """Record the load the browser just finished, as timed by Navigation Timing"""
+        if not self.enabled:
+            return
+        try:
+            seconds = driver.execute_script(LOAD_TIME_SCRIPT)
+        except WebDriverException:
+            return
+        if seconds:
+            self.observe("page_load", seconds, profile_of(driver))
+
+    def calibrate(self, driver, app_url, api):
+        """
+        Probe one page load of `app_url` in the browser and one `api` round trip
+        Returns False (configured values stay) when the target does not answer
+        """
+        try:
+            driver.get(app_url)
+            page_load = driver.execute_script(LOAD_TIME_SCRIPT)
+            start = time.perf_counter()
+            api.list()
+            round_trip = time.perf_counter() - start
+        except (WebDriverException, ApiError, HTTPError) as e:
+            print(f"Timeout calibration failed, keeping the configured timeouts: {e}")
+            return False
+        with self._lock:
+            self.probes = {"page_load": [page_load], "api": [round_trip]} if page_load else {"api": [round_trip]}
+        return True
+
+    def latencies(self, profile=DEFAULT_PROFILE):
+        """{kind: [seconds]} the timeouts of `profile` are based on"""
+        with self._lock:
+            observed = {kind: list(values) for kind, values in self.observed[profile].items()}
+            probes = {kind: list(values) for kind, values in self.probes.items()}
+        observed = {kind: values for kind, values in observed.items() if len(values) >= MIN_SAMPLES}
+        if profile == DEFAULT_PROFILE:
+            # Probes count until the run has enough observations of its own
+            for kind, values in probes.items():
+                observed.setdefault(kind, values)
+        return observed
+
+    def current(self, profile=DEFAULT_PROFILE):
+        """{explicit, page_load} in seconds for `profile`"""
+        timeouts = dict(self.defaults)
+        if not self.enabled:
+            return timeouts
+        p95 = {kind: percentile(values, 0.95) for kind, values in self.latencies(profile).items()}
+        if p95 and "EXPLICIT_WAIT" not in self.overrides:
+            # A wait covers an API round trip and a render, at most a page load
+            timeouts["explicit"] = _clamp(self.factor * max(p95.values()) + 1, EXPLICIT_LIMITS)
+        if "page_load" in p95 and "PAGE_LOAD_TIMEOUT" not in self.overrides:
+            timeouts["page_load"] = _clamp(self.factor * p95["page_load"] + 2, PAGE_LOAD_LIMITS)
+        return timeouts
+
+    def report(self):
+        """Timeouts and the latency they are based on, per profile seen"""
+        with self._lock:
+            profiles = set(self.observed) | {DEFAULT_PROFILE}
+        report = {"defaults": self.defaults, "overrides": sorted(self.overrides), "factor": self.factor, "profiles": {}}
+        for profile in sorted(profiles):
+            latencies = self.latencies(profile)
+            report["profiles"][profile] = dict(
+                self.current(profile),
+                samples={kind: len(values) for kind, values in latencies.items()},
+                p95_s={kind: round(percentile(values, 0.95), 3) for kind, values in latencies.items()},
+            )
+        return report
+
+
+def format_timeouts(report, worker="main"):
+    lines = []
+    for profile, result in report["profiles"].items():
+        basis = ", ".join(
+            f"{kind} {seconds:.2f}s (n={result['samples'][kind]})" for kind, seconds in result["p95_s"].items()
+        ) or "configured values"
+        lines.append(
+            f"Timeouts [{worker}, {profile}]: explicit {result['explicit']:.1f}s, "
+            f"page load {result['page_load']:.1f}s from p95 {basis}"
+        )
+    if report["overrides"]:
+        lines.append(f"  Set in the environment: {', '.join(report['overrides'])}")
+    return lines
+
+
+def write_timeouts(path, report):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_timeouts(directory, run_id):
+    """{worker: report} of the timeout reports this run wrote"""
+    reports = {}
+    for path in sorted(glob.glob(os.path.join(directory, "timeouts_*.json"))):
+        with open(path) as f:
+            report = json.load(f)
+        if report.get("run_id") == run_id:
+            reports[os.path.basename(path)[len("timeouts_"):-len(".json")]] = report
+    return reports
+
+
+TIMEOUTS = AdaptiveTimeouts(EXPLICIT_WAIT, PAGE_LOAD_TIMEOUT, TIMEOUT_OVERRIDES, TIMEOUT_SAFETY_FACTOR, ADAPTIVE_TIMEOUTS)
@@ -0,0 +1,273 @@
+"""
+WebDriver command tracing and per-test time budgets
+Records every command sent through a driver with its latency and payload
+size, and splits a test's wall-clock time into categories
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.wait import WebDriverWait
+
+
+NAVIGATION_COMMANDS = {Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD}
+
+INTERACTION_COMMANDS = {
+    Command.CLICK_ELEMENT,
+    Command.SEND_KEYS_TO_ELEMENT,
+    Command.CLEAR_ELEMENT,
+    Command.W3C_ACTIONS,
+}
+
+# Order used in reports. `metrics` is time spent collecting performance
+# metrics; `assertions` is the test time not spent in any other category:
+# assertions and the rest of the test's own Python code
+CATEGORIES = ("startup", "navigation", "waits", "sleeps", "dom_reads", "interactions", "metrics", "assertions")
+
+
+def categorize(command):
+    if command in NAVIGATION_COMMANDS:
+        return "navigation"
+    if command in INTERACTION_COMMANDS:
+        return "interactions"
+    return "dom_reads"
+
+
+def _json_size(value):
+    try:
+        return len(json.dumps(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class CommandTracer:
+    """
+    Per-test trace of WebDriver commands
+    Commands issued inside a phase (e.g. a WebDriverWait) are attributed to
+    that phase, so time is never counted twice
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.waits = []
+        self.totals = defaultdict(float)
+        self._phase = None
+        self._lock = threading.Lock()
+
+    # ==================== Driver hooks ====================
+    def attach(self, driver):
+        """Route the driver's commands through the tracer"""
+        original_execute = driver.execute
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = original_execute(driver_command, params)
+                return response
+            finally:
+                elapsed = time.perf_counter() - start
+                self._record_command(
+                    driver_command,
+                    elapsed,
+                    _json_size(params),
+                    _json_size(response.get("value")) if response else 0
+                )
+
+        driver.execute = traced_execute
+        driver._command_tracer = self
+        driver._untraced_execute = original_execute
+
+    @staticmethod
+    def detach(driver):
+        if hasattr(driver, "_untraced_execute"):
+            driver.execute = driver._untraced_execute
+            del driver._untraced_execute
+            del driver._command_tracer
+
+    def _record_command(self, command, seconds, sent, received):
+        phase = self._phase
+        with self._lock:
+            self.commands.append({
+                "command": command,
+                "seconds": seconds,
+                "bytes_sent": sent,
+                "bytes_received": received,
+                "phase": phase,
+            })
+            if phase is None:
+                self.totals[categorize(command)] += seconds
+
+    # ==================== Phases ====================
+    @contextmanager
+    def phase(self, category):
+        """Attribute everything inside the block to `category`"""
+        if self._phase is not None:
+            # Already inside a phase (e.g. a wait inside a wait)
+            yield
+            return
+        self._phase = category
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phase = None
+            self.add(category, time.perf_counter() - start)
+
+    def add(self, category, seconds):
+        with self._lock:
+            self.totals[category] += seconds
+
+    def record_wait(self, site, seconds, timeout, timed_out):
+        """One explicit wait: where it was called, how long it took and its timeout"""
+        with self._lock:
+            self.waits.append({
+                "site": site,
+                "seconds": round(seconds, 4),
+                "timeout": timeout,
+                "timed_out": timed_out,
+            })
+
+    def sleep_hook(self, real_sleep, test_file):
+        """
+        A time.sleep replacement that books the test's own sleeps as `sleeps`
+        Only calls made directly from `test_file` outside a wait are counted;
+        Selenium's polling, urllib3 back-off and other threads sleep untraced
+        """
+        test_file = os.path.abspath(test_file)
+
+        def traced_sleep(seconds):
+            caller = sys._getframe(1).f_code.co_filename
+            if self._phase is None and os.path.abspath(caller) == test_file:
+                with self.phase("sleeps"):
+                    real_sleep(seconds)
+            else:
+                real_sleep(seconds)
+        return traced_sleep
+
+    # ==================== Results ====================
+    def breakdown(self, call_duration):
+        """Seconds per category; `assertions` is whatever the test body did besides"""
+        result = {category: round(self.totals.get(category, 0.0), 4) for category in CATEGORIES}
+        accounted = sum(value for key, value in self.totals.items() if key != "startup")
+        result["assertions"] = round(max(0.0, call_duration - accounted), 4)
+        return result
+
+    def command_summary(self):
+        """Per-command count, latency percentiles and bytes transferred"""
+        grouped = defaultdict(list)
+        for entry in self.commands:
+            grouped[entry["command"]].append(entry)
+        return summarize_commands(grouped)
+
+
+def summarize_commands(grouped):
+    summary = {}
+    for command, entries in grouped.items():
+        latencies = [entry["seconds"] for entry in entries]
+        summary[command] = {
+            "count": len(entries),
+            "total_s": round(sum(latencies), 4),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "max_ms": round(max(latencies) * 1000, 2),
+            "bytes_sent": sum(entry["bytes_sent"] for entry in entries),
+            "bytes_received": sum(entry["bytes_received"] for entry in entries),
+        }
+    return summary
+
+
+def install_wait_tracing():
+    """
+    Make WebDriverWait.until/until_not book their time as `waits` on the
+    driver's tracer (no-op for drivers without one). Safe to call repeatedly.
+    """
+    if getattr(WebDriverWait, "_traced", False):
+        return
+
+    def traced(method):
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self._driver, "_command_tracer", None)
+            if tracer is None:
+                return method(self, *args, **kwargs)
+            site = _wait_site(sys._getframe(1))
+            start = time.perf_counter()
+            timed_out = True
+            try:
+                with tracer.phase("waits"):
+                    result = method(self, *args, **kwargs)
+                timed_out = False
+                return result
+            finally:
+                tracer.record_wait(site, time.perf_counter() - start, self._timeout, timed_out)
+        return wrapper
+
+    WebDriverWait.until = traced(WebDriverWait.until)
+    WebDriverWait.until_not = traced(WebDriverWait.until_not)
+    WebDriverWait._traced = True
+
+
+def _wait_site(frame):
+    """`file:line function` of the code that started a wait"""
+    path = os.path.relpath(frame.f_code.co_filename)
+    return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+class TraceCollector:
+    """Collects per-test traces for one worker and writes them as JSON"""
+
+    def __init__(self):
+        self.tests = []
+        self._grouped = defaultdict(list)
+
+    def add(self, nodeid, outcome, duration, breakdown, tracer):
+        self.tests.append({
+            "test": nodeid,
+            "outcome": outcome,
+            "duration_s": round(duration, 4),
+            "breakdown_s": breakdown,
+            "commands": tracer.command_summary(),
+        })
+        for entry in tracer.commands:
+            self._grouped[entry["command"]].append(entry)
+
+    def write(self, path):
+        with open(path, "w") as f:
+            json.dump({
+                "tests": self.tests,
+                "commands": summarize_commands(self._grouped),
+            }, f, indent=2)
+
+
+def breakdown_html(breakdown, tracer):
+    """Small HTML table for the pytest-html report"""
+    rows = "".join(
+        f"<tr><td>{category}</td><td>{breakdown[category]:.3f}s</td></tr>"
+        for category in CATEGORIES
+    )
+    slowest = sorted(tracer.command_summary().items(), key=lambda item: -item[1]["total_s"])[:5]
+    command_rows = "".join(
+        f"<tr><td>{command}</td><td>{stats['count']}</td><td>{stats['p50_ms']}ms</td>"
+        f"<td>{stats['p95_ms']}ms</td><td>{stats['bytes_received']}</td></tr>"
+        for command, stats in slowest
+    )
+    return (
+        "<div><b>Time budget</b><table>"
+        f"<tr><th>Category</th><th>Time</th></tr>{rows}</table>"
+        "<b>Slowest WebDriver commands</b><table>"
+        "<tr><th>Command</th><th>Count</th><th>p50</th><th>p95</th><th>Bytes received</th></tr>"
+        f"{command_rows}</table></div>"
+    )
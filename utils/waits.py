@@ -0,0 +1,165 @@
+"""
+Explicit wait helpers for the Employee Management app
+- A page hook that counts in-flight fetch/XHR requests (network idle)
+- Custom expected conditions for the employee table
+The suite uses explicit waits only; no implicit wait is configured
+"""
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.cdp import add_script_on_new_document
+from utils.timeouts import TIMEOUTS
+
+
+# Wraps fetch and XMLHttpRequest to keep a count of in-flight requests and
+# the time of the last network activity, plus a bounded log of the requests
+# (method, URL, status) for failure artifacts. Safe to run more than once.
+NETWORK_TRACKER_SCRIPT = """
+(function () {
+    if (window.__seleniumNetwork) { return; }
+    var state = window.__seleniumNetwork = { pending: 0, lastActivity: Date.now(), requests: [] };
+    function start() { state.pending += 1; state.lastActivity = Date.now(); }
+    function done() { state.pending = Math.max(0, state.pending - 1); state.lastActivity = Date.now(); }
+    function record(method, url) {
+        var entry = { method: String(method || 'GET').toUpperCase(), url: String(url), start: performance.now(), status: null };
+        try { entry.url = new URL(entry.url, location.href).href; } catch (e) {}
+        state.requests.push(entry);
+        if (state.requests.length > 200) { state.requests.shift(); }
+        return entry;
+    }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function (input, init) {
+            var entry = record(
+                (init && init.method) || (input && input.method),
+                typeof input === 'string' ? input : (input && input.url)
+            );
+            start();
+            return originalFetch.apply(this, arguments).then(
+                function (response) { entry.status = response.status; done(); return response; },
+                function (error) { entry.status = 0; done(); throw error; }
+            );
+        };
+    }
+
+    var originalOpen = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__seleniumRequest = [method, url];
+        return originalOpen.apply(this, arguments);
+    };
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var xhr = this;
+        var entry = record.apply(null, xhr.__seleniumRequest || ['GET', '']);
+        start();
+        xhr.addEventListener('loadend', function () { entry.status = xhr.status; done(); });
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+NETWORK_STATE_SCRIPT = """
+var state = window.__seleniumNetwork;
+if (!state) { return null; }
+return {
+    ready: document.readyState === 'complete',
+    pending: state.pending,
+    idleFor: Date.now() - state.lastActivity
+};
+"""
+
+ROW_COUNT_SCRIPT = """
+return document.querySelectorAll('tbody tr').length;
+"""
+
+
+def install_network_tracker(driver):
+    """
+    Register the network tracker for every document the session loads
+    Returns False when DevTools is unavailable; network_idle then falls back
+    to installing the hook on the current page, which misses requests made
+    before it ran
+    """
+    try:
+        add_script_on_new_document(driver, NETWORK_TRACKER_SCRIPT)
+        return True
+    except WebDriverException:
+        return False
+
+
+def row_xpath(name):
+    """XPath for the employee table row whose Name cell equals `name`"""
+    return f"//tbody/tr[td[1][normalize-space()={_xpath_literal(name)}]]"
+
+
+def _xpath_literal(value):
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+# ==================== Expected conditions ====================
+class network_idle:
+    """
+    The document has loaded and no fetch/XHR has been in flight for
+    `quiet_period` seconds
+    """
+
+    def __init__(self, quiet_period=0.3):
+        self.quiet_ms = quiet_period * 1000
+
+    def __call__(self, driver):
+        state = driver.execute_script(NETWORK_STATE_SCRIPT)
+        if state is None:
+            driver.execute_script(NETWORK_TRACKER_SCRIPT)
+            return False
+        return state["ready"] and state["pending"] == 0 and state["idleFor"] >= self.quiet_ms
+
+
+class row_with_name_present:
+    """A table row with the given employee name exists; returns the row"""
+
+    def __init__(self, name):
+        self.locator = (By.XPATH, row_xpath(name))
+
+    def __call__(self, driver):
+        rows = driver.find_elements(*self.locator)
+        return rows[0] if rows else False
+
+
+class row_with_name_absent:
+    """No table row with the given employee name exists"""
+
+    def __init__(self, name):
+        self.locator = (By.XPATH, row_xpath(name))
+
+    def __call__(self, driver):
+        return not driver.find_elements(*self.locator)
+
+
+class row_count_changed_from:
+    """The number of tbody rows differs from `count`"""
+
+    def __init__(self, count):
+        self.count = count
+
+    def __call__(self, driver):
+        return count_rows(driver) != self.count
+
+
+def wait_for_network_idle(driver, timeout=None, quiet_period=0.3):
+    """Block until the page is loaded and its requests have settled"""
+    if timeout is None:
+        timeout = TIMEOUTS.explicit(driver)
+    return WebDriverWait(driver, timeout).until(network_idle(quiet_period))
+
+
+def count_rows(driver):
+    """Number of rows currently rendered in the employee table (only the count crosses the wire)"""
+    return driver.execute_script(ROW_COUNT_SCRIPT)